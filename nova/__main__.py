@@ -47,10 +47,7 @@ from .monitoring.alerts import (
     notify_info,
     notify_warning,
 )
-from .monitoring.dashboards import (
-    export_lux_compliance_slice,
-    export_migration_dashboard,
-)
+from .monitoring.dashboards import export_all_dashboards
 from .monitoring.logging import configure_logger, log_error, log_info, log_warning
 from .monitoring.reports import build_markdown_test_report
 from .system.roadmap import (
@@ -187,9 +184,8 @@ def run_monitor(*, optimize_pipeline: bool = False) -> None:
 
     configure_logger()
     log_info("Monitoring services initialised.")
-    dashboard_path = export_migration_dashboard()
+    dashboard_path, lux_path = export_all_dashboards()
     log_info(f"Grafana dashboard exported to {dashboard_path}")
-    lux_path = export_lux_compliance_slice()
     log_info(f"LUX compliance slice exported to {lux_path}")
     notify_warning("Monitoring is running in stub mode.")
     notify_info("No active alerts.")
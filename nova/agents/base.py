@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 from ..blueprints.models import AgentBlueprint, AgentTaskSpec
 from ..monitoring import logging as monitoring_logging
@@ -45,6 +45,16 @@ class AgentRunReport:
     def success(self) -> bool:
         return all(report.status == "completed" for report in self.task_reports)
 
+    @property
+    def statuses(self) -> Tuple[str, ...]:
+        """Return the task statuses in order, e.g. for ``statuses.count("completed")``.
+
+        The tuple is built on each access, so it always reflects the current
+        ``task_reports``; callers needing several counts should keep it.
+        """
+
+        return tuple([report.status for report in self.task_reports])
+
     def to_dict(self) -> dict:
         return {
             "agent_type": self.agent_type,
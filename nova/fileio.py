@@ -0,0 +1,54 @@
+"""File helpers shared by Nova's report writers."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+
+
+def write_atomic(path: str | Path, data: bytes, *, durable: bool = False) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file.
+
+    The data goes to a private temporary file next to ``path`` that is then
+    renamed over it, which also keeps concurrent writers from clobbering each
+    other.  An existing file keeps its permission bits; a new one is created
+    subject to the process umask.  ``durable`` syncs the data to disk before
+    the rename so a crash cannot leave an empty file behind.
+    """
+
+    path = Path(path)
+    try:
+        mode: int | None = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    while True:
+        tmp_name = os.path.join(path.parent, f".{path.name}.{os.urandom(6).hex()}.tmp")
+        try:
+            fd = os.open(tmp_name, _TEMP_FLAGS, 0o666)
+        except FileExistsError:  # pragma: no cover - 48 random bits collided
+            continue
+        break
+    try:
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                # Only the data must reach the disk before the rename; skip
+                # the inode metadata flush where the platform allows it.
+                getattr(os, "fdatasync", os.fsync)(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+__all__ = ["write_atomic"]
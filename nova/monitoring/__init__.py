@@ -4,6 +4,7 @@ from .benchmarks import BaselineSnapshot, run_spark_baseline
 from .dashboards import (
     build_lux_compliance_slice,
     build_migration_dashboard,
+    export_all_dashboards,
     export_lux_compliance_slice,
     export_migration_dashboard,
     load_lux_compliance_slice,
@@ -15,6 +16,7 @@ __all__ = [
     "run_spark_baseline",
     "build_lux_compliance_slice",
     "build_migration_dashboard",
+    "export_all_dashboards",
     "export_lux_compliance_slice",
     "export_migration_dashboard",
     "load_lux_compliance_slice",
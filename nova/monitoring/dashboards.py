@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+
+from ..serialization import loads
 
 _DEFAULT_DASHBOARD_PATH = (
     Path(__file__).resolve().parents[2] / "docs" / "dashboards" / "spark_migration_grafana.json"
@@ -14,6 +22,27 @@ _DEFAULT_LUX_SLICE_PATH = (
     Path(__file__).resolve().parents[2] / "docs" / "dashboards" / "lux_compliance_slice.json"
 )
 
+_DEFAULT_REVIEW_WINDOWS: tuple[str, ...] = (
+    "KW 26 – Foundation Review",
+    "KW 27 – Intelligence Review",
+    "KW 28 – Interaction Review",
+    "KW 31 – Cut-over Review",
+)
+
+_DURATION_AVG_EXPR = "avg_over_time(nova_deployment_duration_seconds{environment=\"${%s}\"}[24h])"
+_DURATION_MAX_EXPR = "max_over_time(nova_deployment_duration_seconds{environment=\"${%s}\"}[24h])"
+_ERROR_BUDGET_BURN_EXPR = (
+    "(sum(nova_error_budget_consumed{environment=\"${%(var)s}\"})"
+    " / sum(nova_error_budget_total{environment=\"${%(var)s}\"}))"
+    " * 100"
+)
+_REMAINING_BUDGET_EXPR = "sum_over_time(nova_error_budget_remaining{environment=\"${%s}\"}[1d])"
+
+_REVIEW_ITEM_TEMPLATE: dict[str, str] = {
+    "status_metric": "audit_trail.coverage",
+    "acceptance_criteria": ">= 95% coverage",
+}
+
 
 def _build_timeseries_panel(panel_id: int, *, environment_variable: str) -> dict[str, Any]:
     """Return the deployment duration panel configuration."""
@@ -28,18 +57,12 @@ def _build_timeseries_panel(panel_id: int, *, environment_variable: str) -> dict
         },
         "targets": [
             {
-                "expr": (
-                    "avg_over_time(nova_deployment_duration_seconds"
-                    "{environment=\"${%s}\"}[24h])" % environment_variable
-                ),
+                "expr": sys.intern(_DURATION_AVG_EXPR % environment_variable),
                 "legendFormat": "Average",
                 "refId": "A",
             },
             {
-                "expr": (
-                    "max_over_time(nova_deployment_duration_seconds"
-                    "{environment=\"${%s}\"}[24h])" % environment_variable
-                ),
+                "expr": sys.intern(_DURATION_MAX_EXPR % environment_variable),
                 "legendFormat": "Max",
                 "refId": "B",
             },
@@ -79,12 +102,7 @@ def _build_error_budget_panel(panel_id: int, *, environment_variable: str) -> di
         },
         "targets": [
             {
-                "expr": (
-                    "(sum(nova_error_budget_consumed{environment=\"${%s}\"})"
-                    " / sum(nova_error_budget_total{environment=\"${%s}\"}))"
-                    " * 100"
-                )
-                % (environment_variable, environment_variable),
+                "expr": sys.intern(_ERROR_BUDGET_BURN_EXPR % {"var": environment_variable}),
                 "legendFormat": "Consumed",
                 "refId": "A",
             }
@@ -127,10 +145,7 @@ def _build_remaining_budget_panel(panel_id: int, *, environment_variable: str) -
         },
         "targets": [
             {
-                "expr": (
-                    "sum_over_time(nova_error_budget_remaining"
-                    "{environment=\"${%s}\"}[1d])" % environment_variable
-                ),
+                "expr": sys.intern(_REMAINING_BUDGET_EXPR % environment_variable),
                 "legendFormat": "Remaining",
                 "refId": "A",
             }
@@ -250,12 +265,7 @@ def build_lux_compliance_slice(
 ) -> dict[str, Any]:
     """Return the LUX dashboard slice used to evidence compliance metrics."""
 
-    windows = list(review_windows) if review_windows is not None else [
-        "KW 26 – Foundation Review",
-        "KW 27 – Intelligence Review",
-        "KW 28 – Interaction Review",
-        "KW 31 – Cut-over Review",
-    ]
+    windows = _DEFAULT_REVIEW_WINDOWS if review_windows is None else tuple(review_windows)
 
     slice_payload: dict[str, Any] = {
         "id": "lux-compliance-evidence",
@@ -303,14 +313,7 @@ def build_lux_compliance_slice(
                 "id": "review-readiness",
                 "type": "timeline",
                 "title": "Review Readiness Checklist",
-                "items": [
-                    {
-                        "label": window,
-                        "status_metric": "audit_trail.coverage",
-                        "acceptance_criteria": ">= 95% coverage",
-                    }
-                    for window in windows
-                ],
+                "items": [{"label": window, **_REVIEW_ITEM_TEMPLATE} for window in windows],
                 "description": (
                     "Maps compliance KPIs to the integration & security review cadence "
                     "so Aura can confirm evidence before each gate."
@@ -346,20 +349,85 @@ def export_lux_compliance_slice(path: Path | str | None = None, *, indent: int =
     return target
 
 
-def load_migration_dashboard(path: Path | str | None = None) -> dict[str, Any]:
-    """Load the Grafana dashboard JSON payload from disk."""
+def export_all_dashboards(base: Path | str | None = None, *, indent: int = 2) -> tuple[Path, Path]:
+    """Export the Grafana dashboard and LUX slice concurrently.
+
+    When ``base`` is given both files are written into that directory using
+    their default file names; otherwise the default locations are used. The
+    two payloads are independent, so encoding one overlaps with writing the
+    other.
+    """
+
+    if base is None:
+        dashboard_target: Path | None = None
+        lux_target: Path | None = None
+    else:
+        base_path = Path(base)
+        dashboard_target = base_path / _DEFAULT_DASHBOARD_PATH.name
+        lux_target = base_path / _DEFAULT_LUX_SLICE_PATH.name
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dashboard_future = executor.submit(export_migration_dashboard, dashboard_target, indent=indent)
+        lux_future = executor.submit(export_lux_compliance_slice, lux_target, indent=indent)
+        return dashboard_future.result(), lux_future.result()
+
+
+_PARSED_CACHE_SIZE = 16
+_PARSED_CACHE: "OrderedDict[str, tuple[tuple[int, int], Mapping[str, Any]]]" = OrderedDict()
+_PARSED_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of a parsed JSON value."""
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _load_json(source: Path) -> Mapping[str, Any]:
+    key = str(source)
+    with source.open("rb") as handle:
+        # The revision comes from the descriptor that is actually read, so a
+        # concurrent rewrite cannot pair new bytes with an old revision.
+        stat = os.fstat(handle.fileno())
+        revision = (stat.st_mtime_ns, stat.st_size)
+        with _PARSED_LOCK:
+            cached = _PARSED_CACHE.get(key)
+            if cached is not None and cached[0] == revision:
+                _PARSED_CACHE.move_to_end(key)
+                return cached[1]
+        payload = _freeze(loads(handle.read()))
+    with _PARSED_LOCK:
+        _PARSED_CACHE[key] = (revision, payload)
+        _PARSED_CACHE.move_to_end(key)
+        while len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+            _PARSED_CACHE.popitem(last=False)
+    return payload
+
+
+def load_migration_dashboard(path: Path | str | None = None) -> Mapping[str, Any]:
+    """Load the Grafana dashboard JSON payload from disk.
+
+    The payload is parsed once per revision of the file and shared between
+    callers, so it is returned read-only: objects are mapping views and arrays
+    are tuples.  ``dumps_bytes(payload, default=dict)`` from
+    :mod:`nova.serialization` turns it back into JSON.
+    """
 
     source = Path(path) if path is not None else _DEFAULT_DASHBOARD_PATH
-    data = json.loads(source.read_text(encoding="utf-8"))
-    return data
+    return _load_json(source)
+
 
+def load_lux_compliance_slice(path: Path | str | None = None) -> Mapping[str, Any]:
+    """Load the LUX compliance slice JSON payload from disk.
 
-def load_lux_compliance_slice(path: Path | str | None = None) -> dict[str, Any]:
-    """Load the LUX compliance slice JSON payload from disk."""
+    Like :func:`load_migration_dashboard`, the cached payload is read-only.
+    """
 
     source = Path(path) if path is not None else _DEFAULT_LUX_SLICE_PATH
-    data = json.loads(source.read_text(encoding="utf-8"))
-    return data
+    return _load_json(source)
 
 
 __all__ = [
@@ -367,6 +435,7 @@ __all__ = [
     "build_lux_compliance_slice",
     "export_migration_dashboard",
     "export_lux_compliance_slice",
+    "export_all_dashboards",
     "load_migration_dashboard",
     "load_lux_compliance_slice",
 ]
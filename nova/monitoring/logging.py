@@ -25,16 +25,23 @@ def configure_logger(level: int = logging.INFO) -> None:
     logger.setLevel(level)
 
 
-def log_info(message: str) -> None:
-    """Log an informational message."""
-    logger.info(message)
+def log_info(message: str, *args: object) -> None:
+    """Log an informational message.
+
+    ``args`` are interpolated lazily using ``%``-style formatting, so callers
+    can defer string building until a handler actually accepts the record.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, *args)
 
 
-def log_warning(message: str) -> None:
+def log_warning(message: str, *args: object) -> None:
     """Log a warning message."""
-    logger.warning(message)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message, *args)
 
 
-def log_error(message: str) -> None:
+def log_error(message: str, *args: object) -> None:
     """Log an error message."""
-    logger.error(message)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(message, *args)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import statistics
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List
 
@@ -31,12 +31,16 @@ class OptimizationReport:
     generated_at: datetime
     metrics: Dict[str, float]
     recommendations: List[OptimizationRecommendation] = field(default_factory=list)
+    generated_at_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.generated_at_iso = self.generated_at.isoformat()
 
     def to_markdown(self) -> str:
         lines = [
             "# Nova Optimizer Summary",
             "",
-            f"* Generated: {self.generated_at.isoformat()}",
+            f"* Generated: {self.generated_at_iso}",
             "",
             "## Metrics",
         ]
@@ -53,7 +57,7 @@ class OptimizationReport:
 
     def to_dict(self) -> dict[str, object]:
         return {
-            "generated_at": self.generated_at.isoformat(),
+            "generated_at": self.generated_at_iso,
             "metrics": self.metrics,
             "recommendations": [
                 {"metric": rec.metric, "message": rec.message, "severity": rec.severity}
@@ -103,12 +107,12 @@ def optimize(base_path: Path) -> OptimizationReport:
 
     metrics = _collect_metrics(base_path)
     recommendations = _analyse_metrics(metrics)
-    report = OptimizationReport(generated_at=datetime.utcnow(), metrics=metrics, recommendations=recommendations)
+    report = OptimizationReport(generated_at=datetime.now(timezone.utc), metrics=metrics, recommendations=recommendations)
     reports_dir = base_path / "reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
     destination = reports_dir / "optimizer_summary.md"
     destination.write_text(report.to_markdown(), encoding="utf-8")
-    log_info(f"Optimizer report written to {destination}")
+    log_info("Optimizer report written to %s", destination)
     if recommendations:
         log_warning("Optimizer identified improvements for Nova pipelines.")
     return report
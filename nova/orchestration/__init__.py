@@ -1,15 +1,19 @@
 """Orchestration helpers for coordinating Nova agents."""
 
 from .task_queue import (
+    AsyncTaskQueueServer,
     DispatchedTask,
     TaskQueueDispatcher,
     TaskQueueServer,
     start_task_queue_server,
+    start_task_queue_server_async,
 )
 
 __all__ = [
+    "AsyncTaskQueueServer",
     "DispatchedTask",
     "TaskQueueDispatcher",
     "TaskQueueServer",
     "start_task_queue_server",
+    "start_task_queue_server_async",
 ]
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from collections import OrderedDict
 from concurrent import futures
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional
 
 import grpc
 
 from ..monitoring.logging import log_info
+from ..serialization import dumps_sorted, loads
 from ..task_queue import proto
 from ..task_queue.grpc_service import (
     TaskQueueServicer,
@@ -21,6 +23,12 @@ from ..task_queue.grpc_service import (
 from ..task_queue.storage import TaskRecord, TaskRepository
 
 
+# Upper bound on structured payloads kept for unacknowledged local tasks.
+_LOCAL_PAYLOAD_LIMIT = 4096
+
+_Decoded = tuple[str, str, Dict[str, object]]
+
+
 @dataclass(slots=True)
 class DispatchedTask:
     """High level view of a queued orchestration task."""
@@ -43,15 +51,12 @@ class DispatchedTask:
         }
 
 
-def _record_to_proto(record: TaskRecord) -> proto.Task:
-    task_message = proto.Task()
+def _populate_task(task_message: proto.Task, record: TaskRecord) -> proto.Task:
+    """Write ``record`` into ``task_message`` in place (no intermediate copy)."""
     task_message.id = record.id
     task_message.type = record.type
     task_message.payload = record.payload
-    for key, value in record.metadata.items():
-        entry = task_message.metadata.add()
-        entry.key = key
-        entry.value = value
+    task_message.metadata.update(record.metadata)
     task_message.status = record.status
     task_message.created_at = record.created_at
     task_message.updated_at = record.updated_at
@@ -63,9 +68,13 @@ def _record_to_proto(record: TaskRecord) -> proto.Task:
     return task_message
 
 
-def _proto_to_dispatched(message: proto.Task) -> DispatchedTask:
-    metadata = {entry.key: entry.value for entry in message.metadata}
-    agent, action, payload = _decode_payload(message.payload, metadata)
+def _proto_to_dispatched(
+    message: proto.Task,
+    decoded: tuple[str, str, Dict[str, object]] | None = None,
+) -> DispatchedTask:
+    if decoded is None:
+        decoded = _decode_payload(message.payload, dict(message.metadata))
+    agent, action, payload = decoded
     return DispatchedTask(
         id=message.id,
         agent=agent,
@@ -76,8 +85,13 @@ def _proto_to_dispatched(message: proto.Task) -> DispatchedTask:
     )
 
 
-def _record_to_dispatched(record: TaskRecord) -> DispatchedTask:
-    agent, action, payload = _decode_payload(record.payload, record.metadata)
+def _record_to_dispatched(
+    record: TaskRecord,
+    decoded: tuple[str, str, Dict[str, object]] | None = None,
+) -> DispatchedTask:
+    if decoded is None:
+        decoded = _decode_payload(record.payload, record.metadata)
+    agent, action, payload = decoded
     return DispatchedTask(
         id=record.id,
         agent=agent,
@@ -89,9 +103,47 @@ def _record_to_dispatched(record: TaskRecord) -> DispatchedTask:
 
 
 def _decode_payload(payload: str, metadata: Dict[str, str]) -> tuple[str, str, Dict[str, object]]:
-    try:
-        data = json.loads(payload)
-    except json.JSONDecodeError:
+    # Encoded payloads are always JSON objects; anything else is a raw payload
+    # and is routed to the fallback without paying for a failed parse.
+    data = None
+    head = payload[:1]
+    if head == "{" or head.isspace():
+        try:
+            data = loads(payload)
+        except ValueError:
+            data = None
+    return _interpret_payload(data, payload, metadata)
+
+
+def _decode_payloads(
+    items: List[tuple[str, Dict[str, str]]],
+) -> List[tuple[str, str, Dict[str, object]]]:
+    """Decode many ``(payload, metadata)`` pairs with a single JSON parse.
+
+    The payloads are joined into one JSON array so the parser runs once for
+    the whole batch; if any payload is not valid JSON each item is decoded
+    on its own instead.
+    """
+
+    if len(items) > 1 and all(payload[:1] == "{" and payload[-1:] == "}" for payload, _ in items):
+        try:
+            parsed = loads("[" + ",".join(payload for payload, _ in items) + "]")
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, list) and len(parsed) == len(items):
+            return [
+                _interpret_payload(data, payload, metadata)
+                for data, (payload, metadata) in zip(parsed, items)
+            ]
+    return [_decode_payload(payload, metadata) for payload, metadata in items]
+
+
+def _interpret_payload(
+    data: object,
+    payload: str,
+    metadata: Dict[str, str],
+) -> tuple[str, str, Dict[str, object]]:
+    if not isinstance(data, dict):
         return metadata.get("agent", "unknown"), metadata.get("action", "execute"), {"raw": payload}
     agent = data.get("agent") or metadata.get("agent", "unknown")
     action = data.get("action") or metadata.get("action", "execute")
@@ -106,7 +158,7 @@ def _decode_payload(payload: str, metadata: Dict[str, str]) -> tuple[str, str, D
 
 
 def _encode_payload(agent: str, action: str, payload: Dict[str, object]) -> str:
-    return json.dumps({"agent": agent, "action": action, "payload": payload}, sort_keys=True)
+    return dumps_sorted({"agent": agent, "action": action, "payload": payload})
 
 
 class TaskQueueServer(TaskQueueServicer):
@@ -116,10 +168,10 @@ class TaskQueueServer(TaskQueueServicer):
         self.repository = repository
 
     def Enqueue(self, request: proto.EnqueueRequest, context: grpc.ServicerContext) -> proto.EnqueueResponse:  # noqa: N802
-        metadata = {entry.key: entry.value for entry in request.metadata}
+        metadata = dict(request.metadata)
         record = self.repository.enqueue(request.type, request.payload, metadata)
         response = proto.EnqueueResponse()
-        response.task.CopyFrom(_record_to_proto(record))
+        _populate_task(response.task, record)
         return response
 
     def Dequeue(self, request: proto.DequeueRequest, context: grpc.ServicerContext) -> proto.DequeueResponse:  # noqa: N802
@@ -130,13 +182,13 @@ class TaskQueueServer(TaskQueueServicer):
             response.has_task = False
             return response
         response.has_task = True
-        response.task.CopyFrom(_record_to_proto(record))
+        _populate_task(response.task, record)
         return response
 
     def Ack(self, request: proto.AckRequest, context: grpc.ServicerContext) -> proto.AckResponse:  # noqa: N802
         record = self.repository.ack(request.task_id, request.success, request.result or None)
         response = proto.AckResponse()
-        response.task.CopyFrom(_record_to_proto(record))
+        _populate_task(response.task, record)
         return response
 
     def ListTasks(self, request: proto.ListTasksRequest, context: grpc.ServicerContext) -> proto.ListTasksResponse:  # noqa: N802,E501
@@ -144,9 +196,23 @@ class TaskQueueServer(TaskQueueServicer):
         records = self.repository.list_tasks(status=status_filter)
         response = proto.ListTasksResponse()
         for record in records:
-            response.tasks.add().CopyFrom(_record_to_proto(record))
+            _populate_task(response.tasks.add(), record)
         return response
 
+    def EnqueueStream(  # noqa: N802
+        self,
+        request_iterator: Iterator[proto.EnqueueRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[proto.EnqueueResponse]:
+        batch = [
+            (request.type, request.payload, dict(request.metadata))
+            for request in request_iterator
+        ]
+        for record in self.repository.enqueue_many(batch):
+            response = proto.EnqueueResponse()
+            _populate_task(response.task, record)
+            yield response
+
 
 def start_task_queue_server(
     repository: TaskRepository,
@@ -164,6 +230,57 @@ def start_task_queue_server(
     return server
 
 
+class AsyncTaskQueueServer(TaskQueueServicer):
+    """``grpc.aio`` servicer that runs repository work off the event loop.
+
+    The RPC logic is shared with :class:`TaskQueueServer`; each call is
+    handed to :func:`asyncio.to_thread` so SQLite access never blocks the loop.
+    """
+
+    def __init__(self, repository: TaskRepository) -> None:
+        self.repository = repository
+        self._sync = TaskQueueServer(repository)
+
+    async def Enqueue(self, request: proto.EnqueueRequest, context: grpc.aio.ServicerContext) -> proto.EnqueueResponse:  # noqa: N802,E501
+        return await asyncio.to_thread(self._sync.Enqueue, request, context)
+
+    async def Dequeue(self, request: proto.DequeueRequest, context: grpc.aio.ServicerContext) -> proto.DequeueResponse:  # noqa: N802,E501
+        return await asyncio.to_thread(self._sync.Dequeue, request, context)
+
+    async def Ack(self, request: proto.AckRequest, context: grpc.aio.ServicerContext) -> proto.AckResponse:  # noqa: N802
+        return await asyncio.to_thread(self._sync.Ack, request, context)
+
+    async def ListTasks(self, request: proto.ListTasksRequest, context: grpc.aio.ServicerContext) -> proto.ListTasksResponse:  # noqa: N802,E501
+        return await asyncio.to_thread(self._sync.ListTasks, request, context)
+
+    async def EnqueueStream(  # noqa: N802
+        self,
+        request_iterator: AsyncIterator[proto.EnqueueRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[proto.EnqueueResponse]:
+        batch = [(request.type, request.payload, dict(request.metadata)) async for request in request_iterator]
+        records = await asyncio.to_thread(self.repository.enqueue_many, batch)
+        for record in records:
+            response = proto.EnqueueResponse()
+            _populate_task(response.task, record)
+            yield response
+
+
+async def start_task_queue_server_async(
+    repository: TaskRepository,
+    *,
+    address: str = "127.0.0.1:50071",
+) -> grpc.aio.Server:
+    """Start a ``grpc.aio`` task queue server on the running event loop."""
+
+    server = grpc.aio.server()
+    add_TaskQueueServicer_to_server(AsyncTaskQueueServer(repository), server)
+    server.add_insecure_port(address)
+    await server.start()
+    log_info("Task queue server (asyncio) started on %s", address)
+    return server
+
+
 class TaskQueueDispatcher:
     """Client abstraction for dispatching orchestration tasks."""
 
@@ -183,6 +300,28 @@ class TaskQueueDispatcher:
             self._repository = TaskRepository(path)
             self._stub = None
             self._channel = None
+        # Structured payloads of tasks enqueued in-process, keyed by task id,
+        # so local reads never have to decode the persisted JSON again. They
+        # are decoded from the encoded payload once on enqueue, so they have
+        # the same JSON shape (lists, string keys) as decoded reads.
+        # Entries are dropped on acknowledgement and the oldest ones are
+        # evicted beyond ``_LOCAL_PAYLOAD_LIMIT``.
+        self._local_payloads: "OrderedDict[str, _Decoded]" = OrderedDict()
+
+    def _remember_payload(self, task_id: str, decoded: _Decoded) -> None:
+        local_payloads = self._local_payloads
+        local_payloads[task_id] = decoded
+        while len(local_payloads) > _LOCAL_PAYLOAD_LIMIT:
+            local_payloads.popitem(last=False)
+
+    def _cached_payload(self, task_id: str) -> _Decoded | None:
+        """Return a copy of the cached payload so callers cannot alter it."""
+
+        decoded = self._local_payloads.get(task_id)
+        if decoded is None:
+            return None
+        agent, action, payload = decoded
+        return agent, action, dict(payload)
 
     def run_task(self, agent: str, action: str, payload: Optional[Dict[str, object]] = None) -> DispatchedTask:
         payload = payload or {}
@@ -190,15 +329,43 @@ class TaskQueueDispatcher:
         metadata = {"agent": agent, "action": action}
         if self._stub is not None:
             request = proto.EnqueueRequest(type="orchestration", payload=encoded)
-            for key, value in metadata.items():
-                entry = request.metadata.add()
-                entry.key = key
-                entry.value = value
+            request.metadata.update(metadata)
             response = self._stub.Enqueue(request)
             return _proto_to_dispatched(response.task)
         assert self._repository is not None  # for type checkers
         record = self._repository.enqueue("orchestration", encoded, metadata)
-        return _record_to_dispatched(record)
+        self._remember_payload(record.id, _decode_payload(encoded, metadata))
+        return _record_to_dispatched(record, self._cached_payload(record.id))
+
+    def run_tasks_batch(
+        self,
+        tasks: Iterable[tuple[str, str, Optional[Dict[str, object]]]],
+    ) -> List[DispatchedTask]:
+        """Enqueue several ``(agent, action, payload)`` tasks in one round trip.
+
+        Remote dispatchers send every request over a single ``EnqueueStream``
+        call; local dispatchers persist the batch in one transaction.
+        """
+
+        prepared = [(agent, action, payload or {}) for agent, action, payload in tasks]
+        if self._stub is not None:
+            requests = []
+            for agent, action, payload in prepared:
+                request = proto.EnqueueRequest(type="orchestration", payload=_encode_payload(agent, action, payload))
+                request.metadata.update(agent=agent, action=action)
+                requests.append(request)
+            return [_proto_to_dispatched(response.task) for response in self._stub.EnqueueStream(iter(requests))]
+        assert self._repository is not None
+        items = [
+            (_encode_payload(agent, action, payload), {"agent": agent, "action": action})
+            for agent, action, payload in prepared
+        ]
+        records = self._repository.enqueue_many(("orchestration", encoded, metadata) for encoded, metadata in items)
+        dispatched = []
+        for record, decoded in zip(records, _decode_payloads(items)):
+            self._remember_payload(record.id, decoded)
+            dispatched.append(_record_to_dispatched(record, self._cached_payload(record.id)))
+        return dispatched
 
     def list_tasks(self, status: str | None = None) -> List[DispatchedTask]:
         if self._stub is not None:
@@ -206,9 +373,22 @@ class TaskQueueDispatcher:
             if status:
                 request.status = status
             response = self._stub.ListTasks(request)
-            return [_proto_to_dispatched(task) for task in response.tasks]
+            tasks = list(response.tasks)
+            decoded = _decode_payloads([(task.payload, dict(task.metadata)) for task in tasks])
+            return [_proto_to_dispatched(task, item) for task, item in zip(tasks, decoded)]
         assert self._repository is not None
-        return [_record_to_dispatched(record) for record in self._repository.list_tasks(status=status)]
+        records = self._repository.list_tasks(status=status)
+        missing = [record for record in records if record.id not in self._local_payloads]
+        decoded_missing = dict(
+            zip(
+                (record.id for record in missing),
+                _decode_payloads([(record.payload, record.metadata) for record in missing]),
+            )
+        )
+        return [
+            _record_to_dispatched(record, self._cached_payload(record.id) or decoded_missing[record.id])
+            for record in records
+        ]
 
     def acknowledge(self, task_id: str, success: bool, result: Optional[str] = None) -> DispatchedTask:
         if self._stub is not None:
@@ -219,7 +399,7 @@ class TaskQueueDispatcher:
             return _proto_to_dispatched(response.task)
         assert self._repository is not None
         record = self._repository.ack(task_id, success, result)
-        return _record_to_dispatched(record)
+        return _record_to_dispatched(record, self._local_payloads.pop(task_id, None))
 
     def close(self) -> None:
         if self._stub is not None and self._channel is not None:
@@ -229,8 +409,10 @@ class TaskQueueDispatcher:
 
 
 __all__ = [
+    "AsyncTaskQueueServer",
     "DispatchedTask",
     "TaskQueueDispatcher",
     "TaskQueueServer",
     "start_task_queue_server",
+    "start_task_queue_server_async",
 ]
@@ -1,14 +1,22 @@
 """OPA-backed policy evaluation engine for Nova."""
 from __future__ import annotations
 
-import json
+import hashlib
 import threading
-import urllib.error
-import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+import httpx
 
 from ..logging import get_logger
+from ..serialization import dumps_bytes, dumps_sorted, loads
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+CacheKey = Tuple[str, str, str, Hashable]
 
 
 class PolicyEngineError(RuntimeError):
@@ -36,14 +44,29 @@ class PolicyEngine:
         *,
         opa_url: str = "http://localhost:8181",
         policy_path: str = "/v1/data/nova/authz/allow",
+        batch_policy_path: str = "/v1/data/nova/authz/batch_allow",
         request_timeout: float = 5.0,
+        cache_size: int = 10_000,
     ) -> None:
         self._opa_url = opa_url.rstrip("/")
         self._policy_path = policy_path
+        self._url = f"{self._opa_url}{policy_path}"
+        self._batch_url = f"{self._opa_url}{batch_policy_path}"
         self._timeout = request_timeout
         self._logger = get_logger("nova.policy.engine")
         self._lock = threading.Lock()
-        self._cache: Dict[str, PolicyDecision] = {}
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[CacheKey, PolicyDecision]" = OrderedDict()
+        # A single pooled client keeps HTTP keep-alive connections to OPA open
+        # between cache misses instead of reconnecting for every decision.
+        self._http = httpx.Client(
+            timeout=request_timeout,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+
+    def close(self) -> None:
+        """Close pooled connections to the OPA server."""
+        self._http.close()
 
     def authorize(
         self,
@@ -53,47 +76,142 @@ class PolicyEngine:
         resource: str,
         context: Optional[Dict[str, Any]] = None,
     ) -> PolicyDecision:
-        payload = {
-            "input": {
-                "subject": subject,
-                "action": action,
-                "resource": resource,
-                "context": context or {},
-            }
-        }
-        cache_key = json.dumps(payload, sort_keys=True)
+        key = (subject, action, resource, _context_key(context))
         with self._lock:
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
 
-        decision = self._query_opa(payload)
-        with self._lock:
-            self._cache[cache_key] = decision
+        decision = self._query_opa(_build_input(subject, action, resource, context))
+        self._remember(key, decision)
         return decision
 
-    def _query_opa(self, payload: Dict[str, Any]) -> PolicyDecision:
-        url = f"{self._opa_url}{self._policy_path}"
-        data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(url, data=data, method="POST")
-        request.add_header("Content-Type", "application/json")
+    def batch_authorize(self, requests: Sequence[Mapping[str, Any]]) -> List[PolicyDecision]:
+        """Evaluate several authorization requests with a single OPA call.
+
+        Each request is a mapping with ``subject``, ``action``, ``resource``
+        and an optional ``context``. Cached decisions are reused and only the
+        misses are sent to OPA as ``input.batch``. When the server does not
+        provide the batch rule, the misses are evaluated one by one.
+        """
+
+        keys = [
+            (request["subject"], request["action"], request["resource"], _context_key(request.get("context")))
+            for request in requests
+        ]
+        decisions: List[Optional[PolicyDecision]] = []
+        with self._lock:
+            for key in keys:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                decisions.append(cached)
+
+        missing = [index for index, decision in enumerate(decisions) if decision is None]
+        if not missing:
+            return decisions  # type: ignore[return-value]
+        inputs = [
+            _build_input(
+                requests[index]["subject"],
+                requests[index]["action"],
+                requests[index]["resource"],
+                requests[index].get("context"),
+            )["input"]
+            for index in missing
+        ]
+        fetched = self._query_opa_batch(inputs) if len(inputs) > 1 else None
+        if fetched is None:
+            fetched = [self._query_opa({"input": item}) for item in inputs]
+        for index, decision in zip(missing, fetched):
+            decisions[index] = decision
+            self._remember(keys[index], decision)
+        return decisions  # type: ignore[return-value]
+
+    def _remember(self, key: CacheKey, decision: PolicyDecision) -> None:
+        with self._lock:
+            self._cache[key] = decision
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _post(self, url: str, payload: Dict[str, Any]) -> Any:
+        data = dumps_bytes(payload)
         try:
-            with urllib.request.urlopen(request, timeout=self._timeout) as response:
-                body = response.read().decode("utf-8")
-        except urllib.error.URLError as exc:  # pragma: no cover - network failure path
+            try:
+                response = self._http.post(url, content=data, headers=_JSON_HEADERS)
+            except httpx.RemoteProtocolError:
+                # OPA closed an idle keep-alive connection; retry once on a fresh one.
+                response = self._http.post(url, content=data, headers=_JSON_HEADERS)
+            body = response.read()
+            response.raise_for_status()
+        except httpx.TransportError as exc:  # pragma: no cover - network failure path
             self._logger.error("OPA request failed", exc_info=exc)
             raise PolicyEngineUnavailable("OPA server unavailable") from exc
+        except httpx.HTTPStatusError as exc:
+            self._logger.error("OPA request failed", exc_info=exc)
+            raise PolicyEngineUnavailable(f"OPA server returned HTTP {response.status_code}") from exc
+        try:
+            return loads(body)
+        except ValueError as exc:
+            self._logger.error("OPA returned an invalid response", exc_info=exc)
+            raise PolicyEngineUnavailable("OPA server returned an invalid response") from exc
 
-        parsed = json.loads(body)
-        result = parsed.get("result")
+    def _query_opa(self, payload: Dict[str, Any]) -> PolicyDecision:
+        parsed = self._post(self._url, payload)
+        if not isinstance(parsed, dict):
+            raise PolicyEngineUnavailable("OPA server returned an invalid response")
+        return self._to_decision(parsed.get("result"), parsed)
+
+    def _query_opa_batch(self, inputs: List[Dict[str, Any]]) -> Optional[List[PolicyDecision]]:
+        parsed = self._post(self._batch_url, {"input": {"batch": inputs}})
+        results = parsed.get("result") if isinstance(parsed, dict) else None
+        if not isinstance(results, list) or len(results) != len(inputs):
+            self._logger.info("OPA batch rule unavailable; evaluating requests individually")
+            return None
+        return [self._to_decision(result, {"result": result}) for result in results]
+
+    def _to_decision(self, result: Any, raw: Dict[str, Any]) -> PolicyDecision:
         if isinstance(result, dict):
             allow = bool(result.get("allow"))
             reason = result.get("reason", "denied by policy" if not allow else "allowed")
         else:
             allow = bool(result)
             reason = "allowed" if allow else "denied by policy"
-        decision = PolicyDecision(allow=allow, reason=reason, raw=parsed)
+        decision = PolicyDecision(allow=allow, reason=reason, raw=raw)
         self._logger.info("Policy decision", extra={"allow": allow, "reason": reason})
         return decision
 
 
+def _build_input(
+    subject: str,
+    action: str,
+    resource: str,
+    context: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
+        "input": {
+            "subject": subject,
+            "action": action,
+            "resource": resource,
+            "context": context or {},
+        }
+    }
+
+
+def _context_key(context: Optional[Dict[str, Any]]) -> Hashable:
+    """Return a hashable cache key for ``context``.
+
+    Flat contexts with scalar values are keyed by their sorted items; nested
+    structures fall back to a BLAKE2b digest of their canonical JSON.
+    """
+
+    if not context:
+        return ()
+    if all(isinstance(key, str) and isinstance(value, _SCALAR_TYPES) for key, value in context.items()):
+        # Include the value type so that e.g. ``True`` and ``1`` stay distinct.
+        return tuple(sorted((key, type(value), value) for key, value in context.items()))
+    return hashlib.blake2b(dumps_sorted(context).encode("utf-8"), digest_size=16).digest()
+
+
 __all__ = ["PolicyEngine", "PolicyDecision", "PolicyEngineError", "PolicyEngineUnavailable"]
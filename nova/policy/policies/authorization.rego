@@ -19,3 +19,11 @@ allow = {
     input.action == "read"
     input.resource == "metrics"
 }
+
+# Evaluate several authorization requests in one round trip. Each entry of
+# ``input.batch`` is checked against ``allow`` and the decisions are returned
+# in request order.
+batch_allow := [decision |
+    request := input.batch[_]
+    decision := allow with input as request
+]
@@ -5,11 +5,18 @@ import json
 import sqlite3
 import threading
 import time
+import weakref
+from collections import deque
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from logging import Logger
+from typing import ContextManager, Deque, Dict, Iterable, Optional
 
 from ..logging import get_logger
+from ..serialization import dumps_sorted
+
+_INSERT_SQL = "INSERT INTO audit_events (event_type, subject, details, created_at) VALUES (?, ?, ?, ?)"
 
 
 @dataclass(frozen=True)
@@ -22,20 +29,77 @@ class AuditEvent:
     created_at: int
 
 
+class _ThreadConnection:
+    """Per-thread connection holder that closes the connection when dropped.
+
+    ``threading.local`` releases its values when the owning thread exits, so
+    the finalizer closes connections of finished threads instead of keeping
+    them open until :meth:`AuditStore.close`.
+    """
+
+    __slots__ = ("connection", "close", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.close = weakref.finalize(self, connection.close)
+
+
 class AuditStore:
-    """Durable storage for audit events using SQLite."""
+    """Durable storage for audit events using SQLite.
+
+    File-backed stores open one WAL-mode connection per thread so concurrent
+    writers rely on SQLite's own locking; a thread's connection is closed
+    when the thread exits. In-memory databases are private to a connection,
+    so those keep a single shared connection behind a lock.
+    """
 
     def __init__(self, database_path: str | Path = ":memory:") -> None:
         self._database_path = str(database_path)
-        self._connection = sqlite3.connect(self._database_path, check_same_thread=False)
-        self._connection.row_factory = sqlite3.Row
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._holders: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._shared: Optional[sqlite3.Connection] = None
+        self._closed = False
+        if self._database_path == ":memory:":
+            self._shared = self._open_connection()
         self._logger = get_logger(__name__)
         self._create_schema()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._database_path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        # WAL avoids an fsync per commit; it is a no-op for in-memory databases.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA wal_autocheckpoint=1000")
+        return connection
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _connection(self) -> sqlite3.Connection:
+        # Checked first so a closed store never silently opens a fresh
+        # per-thread connection (or an empty in-memory database).
+        if self._closed:
+            raise RuntimeError("audit store is closed")
+        if self._shared is not None:
+            return self._shared
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ThreadConnection(self._open_connection())
+            self._local.holder = holder
+            with self._lock:
+                self._holders.add(holder)
+        return holder.connection
+
+    def _write_lock(self) -> ContextManager[object]:
+        return self._lock if self._shared is not None else nullcontext()
+
     def _create_schema(self) -> None:
-        with self._connection:
-            self._connection.execute(
+        connection = self._connection()
+        with connection:
+            connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS audit_events (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -48,22 +112,25 @@ class AuditStore:
             )
 
     def append(self, event: AuditEvent) -> None:
-        with self._lock, self._connection:
-            self._connection.execute(
-                """
-                INSERT INTO audit_events (event_type, subject, details, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    event.event_type,
-                    event.subject,
-                    json.dumps(event.details, sort_keys=True),
-                    event.created_at,
-                ),
-            )
+        connection = self._connection()
+        with self._write_lock(), connection:
+            connection.execute(_INSERT_SQL, self._to_row(event))
+
+    def append_many(self, events: Iterable[AuditEvent]) -> None:
+        """Persist several events with a single ``executemany`` and commit."""
+        rows = [self._to_row(event) for event in events]
+        if not rows:
+            return
+        connection = self._connection()
+        with self._write_lock(), connection:
+            connection.executemany(_INSERT_SQL, rows)
+
+    @staticmethod
+    def _to_row(event: AuditEvent) -> tuple[str, str, str, int]:
+        return (event.event_type, event.subject, dumps_sorted(event.details), event.created_at)
 
     def list_events(self, limit: int = 100) -> list[AuditEvent]:
-        cursor = self._connection.execute(
+        cursor = self._connection().execute(
             "SELECT event_type, subject, details, created_at FROM audit_events ORDER BY created_at DESC LIMIT ?",
             (limit,),
         )
@@ -80,26 +147,111 @@ class AuditStore:
         return events
 
     def close(self) -> None:
-        self._connection.close()
+        """Close every connection; later reads and writes raise ``RuntimeError``."""
+        with self._lock:
+            self._closed = True
+            holders = list(self._holders)
+            self._holders = weakref.WeakSet()
+        for holder in holders:
+            holder.close()
+        if self._shared is not None:
+            self._shared.close()
+        self._local = threading.local()
+        self._shared = None
+
+
+def _log_persisted(logger: Logger, event: AuditEvent) -> None:
+    logger.info(
+        "Audit event",
+        extra={"event_type": event.event_type, "subject": event.subject, "details": event.details},
+    )
+
+
+def _drain_pending(
+    store: AuditStore,
+    pending: Deque[AuditEvent],
+    lock: threading.Lock,
+    logger: Logger,
+    *,
+    final: bool = False,
+) -> None:
+    """Persist and log everything in ``pending``; shared by flush and the finalizer.
+
+    Flushing into a closed store raises and keeps the events buffered; the
+    ``final`` drain run by the finalizer drops them with a warning instead.
+    """
+    with lock:
+        if not pending:
+            return
+        if store.closed:
+            if not final:
+                raise RuntimeError("audit store is closed")
+            logger.warning("Dropping %d buffered audit events: the audit store is already closed", len(pending))
+            pending.clear()
+            return
+        events = list(pending)
+        pending.clear()
+    store.append_many(events)
+    for event in events:
+        _log_persisted(logger, event)
 
 
 class AuditLogger:
-    """High level helper for persisting audit events and emitting logs."""
+    """High level helper for persisting audit events and emitting logs.
+
+    With ``batch_size`` greater than one, events are buffered and written to
+    the store in batches. A partial batch is persisted by :meth:`flush`,
+    :meth:`close` (or leaving the logger's ``with`` block), when the logger
+    is garbage collected and at interpreter exit. Events are logged only
+    once they have been written. Events still buffered when the store has
+    already been closed cannot be written and are dropped with a warning.
+    """
 
-    def __init__(self, store: AuditStore) -> None:
+    def __init__(self, store: AuditStore, *, batch_size: int = 1) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self._store = store
         self._logger = get_logger("nova.security.audit")
+        self._batch_size = batch_size
+        self._pending: Deque[AuditEvent] = deque()
+        self._pending_lock = threading.Lock()
+        # The finalizer only references the buffer, never ``self``, so it
+        # does not keep the logger alive; it also runs at interpreter exit.
+        self._finalizer = weakref.finalize(
+            self, _drain_pending, store, self._pending, self._pending_lock, self._logger, final=True
+        )
+
+    def __enter__(self) -> "AuditLogger":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
 
     def record_event(self, event_type: str, *, subject: str, details: Optional[Dict[str, str]] = None) -> AuditEvent:
         event = AuditEvent(
             event_type=event_type,
             subject=subject,
             details=details or {},
-            created_at=int(time.time() * 1000),
+            created_at=time.time_ns() // 1_000_000,
         )
-        self._store.append(event)
-        self._logger.info("Audit event", extra={"event_type": event_type, "subject": subject, "details": event.details})
+        if self._batch_size == 1:
+            self._store.append(event)
+            _log_persisted(self._logger, event)
+        else:
+            with self._pending_lock:
+                self._pending.append(event)
+                ready = len(self._pending) >= self._batch_size
+            if ready:
+                self.flush()
         return event
 
+    def flush(self) -> None:
+        """Write all buffered events to the store."""
+        _drain_pending(self._store, self._pending, self._pending_lock, self._logger)
+
+    def close(self) -> None:
+        """Flush buffered events; the logger must not be used afterwards."""
+        self._finalizer()
+
 
 __all__ = ["AuditEvent", "AuditLogger", "AuditStore"]
@@ -3,21 +3,42 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from ..monitoring.logging import log_info, log_warning
 
 
-@dataclass(slots=True)
 class BackupSnapshot:
-    """Metadata describing a backup snapshot."""
+    """Metadata describing a backup snapshot.
 
-    timestamp: str
-    location: Path
-    artifacts: List[Path]
+    ``artifacts`` may be omitted, in which case the snapshot directory is
+    only listed the first time the attribute is accessed.
+    """
+
+    __slots__ = ("timestamp", "location", "_artifacts")
+
+    def __init__(self, timestamp: str, location: Path, artifacts: Optional[List[Path]] = None) -> None:
+        self.timestamp = timestamp
+        self.location = location
+        self._artifacts = artifacts
+
+    @property
+    def artifacts(self) -> List[Path]:
+        if self._artifacts is None:
+            self._artifacts = list(self.location.glob("*"))
+        return self._artifacts
+
+    def __repr__(self) -> str:
+        return f"BackupSnapshot(timestamp={self.timestamp!r}, location={self.location!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BackupSnapshot):
+            return NotImplemented
+        return (self.timestamp, self.location, self.artifacts) == (other.timestamp, other.location, other.artifacts)
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -36,6 +57,9 @@ class BackupManager:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         self.reports_dir = base_path / "reports"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = base_path / "logs" / "backups.jsonl"
+        self._latest: Optional[str] = None
+        self._scanned = False
 
     def run_backup(self) -> BackupSnapshot:
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
@@ -49,6 +73,7 @@ class BackupManager:
         artifacts[1].write_text("{\"vectors\": []}\n", encoding="utf-8")
         summary = BackupSnapshot(timestamp=timestamp, location=snapshot_dir, artifacts=artifacts)
         self._write_summary(summary)
+        self._remember(timestamp)
         log_info(f"Backup snapshot created at {snapshot_dir}")
         return summary
 
@@ -65,21 +90,47 @@ class BackupManager:
         return marker
 
     def list_snapshots(self) -> List[BackupSnapshot]:
-        snapshots: List[BackupSnapshot] = []
-        for directory in sorted(self.backup_dir.iterdir()):
-            if not directory.is_dir():
-                continue
-            timestamp = directory.name
-            artifacts = list(directory.glob("*"))
-            snapshots.append(BackupSnapshot(timestamp=timestamp, location=directory, artifacts=artifacts))
+        """Return the snapshots present on disk ordered by timestamp.
+
+        A single ``scandir`` of the backup directory finds the snapshots;
+        their artifacts are only listed when first accessed, so they reflect
+        the directory contents at that point.
+        """
+
+        snapshots = self._scan_snapshots()
+        self._scanned = True
+        if snapshots:
+            self._remember(snapshots[-1].timestamp)
         return snapshots
 
+    def latest_timestamp(self) -> Optional[str]:
+        """Return the newest snapshot timestamp, or ``None`` without backups.
+
+        The backup directory is scanned once per manager; later snapshots
+        taken through :meth:`run_backup` keep the value current.
+        """
+
+        if not self._scanned:
+            with os.scandir(self.backup_dir) as entries:
+                latest = max((entry.name for entry in entries if entry.is_dir()), default=None)
+            self._scanned = True
+            if latest is not None:
+                self._remember(latest)
+        return self._latest
+
+    def _remember(self, timestamp: str) -> None:
+        if self._latest is None or timestamp > self._latest:
+            self._latest = timestamp
+
+    def _scan_snapshots(self) -> List[BackupSnapshot]:
+        # DirEntry caches the file type from the directory read, so filtering
+        # and sorting by name avoids a stat and a Path per entry.
+        with os.scandir(self.backup_dir) as entries:
+            directories = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+        return [BackupSnapshot(timestamp=entry.name, location=Path(entry.path)) for entry in directories]
+
     def _write_summary(self, snapshot: BackupSnapshot) -> None:
         report_path = self.reports_dir / "weekly_backup_summary.md"
-        existing = []
-        if report_path.exists():
-            existing.append(report_path.read_text(encoding="utf-8"))
-        header = "# Weekly Backup Summary\n\n" if not existing else ""
         entry_lines = [
             f"## Snapshot {snapshot.timestamp}",
             f"- Location: {snapshot.location}",
@@ -87,10 +138,12 @@ class BackupManager:
         ]
         entry_lines.extend(f"  - {artifact.name}" for artifact in snapshot.artifacts)
         entry_lines.append("")
-        report_path.write_text(header + "\n".join(existing + ["\n".join(entry_lines)]), encoding="utf-8")
-        journal = self.base_path / "logs" / "backups.jsonl"
-        journal.parent.mkdir(parents=True, exist_ok=True)
-        with journal.open("a", encoding="utf-8") as handle:
+        # Append only the new entry instead of rewriting the whole report.
+        with report_path.open("a", encoding="utf-8") as handle:
+            handle.write("# Weekly Backup Summary\n\n" if handle.tell() == 0 else "\n")
+            handle.write("\n".join(entry_lines))
+        self._index_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._index_path.open("a", encoding="utf-8") as handle:
             handle.write(json.dumps(snapshot.to_dict()) + "\n")
 
 
@@ -108,16 +161,20 @@ def restore_backup(base_path: Path, timestamp: str) -> Path:
     return manager.restore(timestamp)
 
 
+@lru_cache(maxsize=256)
+def _snapshot_week(timestamp: str) -> tuple[int, int]:
+    iso = datetime.strptime(timestamp, "%Y%m%d%H%M%S").isocalendar()
+    return iso[0], iso[1]
+
+
 def ensure_weekly_backup(base_path: Path) -> Optional[BackupSnapshot]:
     """Ensure that at least one snapshot exists for the current ISO week."""
 
     manager = BackupManager(base_path)
-    snapshots = manager.list_snapshots()
-    current_week = datetime.utcnow().isocalendar()[:2]
-    for snapshot in snapshots:
-        snapshot_week = datetime.strptime(snapshot.timestamp, "%Y%m%d%H%M%S").isocalendar()[:2]
-        if snapshot_week == current_week:
-            return None
+    # Timestamps sort chronologically, so only the newest one needs checking.
+    latest = manager.latest_timestamp()
+    if latest is not None and _snapshot_week(latest) == datetime.utcnow().isocalendar()[:2]:
+        return None
     log_warning("No backup found for current week; creating one automatically.")
     return manager.run_backup()
 
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping
 
-ISO_27001_CONTROLS: Dict[str, str] = {
+ISO_27001_CONTROLS: Mapping[str, str] = MappingProxyType({
     "A.6.1.2": "Information security coordination",
     "A.8.2.2": "Information classification",
     "A.12.4.1": "Event logging",
     "A.12.4.3": "Administrator and operator logs",
     "A.12.6.2": "Restrictions on software installation",
     "A.16.1.7": "Collection of evidence",
-}
+})
+_CONTROL_IDS = frozenset(ISO_27001_CONTROLS)
 
 
 @dataclass(frozen=True)
@@ -30,7 +32,7 @@ class ComplianceRegistry:
         self._entries: Dict[str, ControlEvidence] = {}
 
     def register(self, evidence: ControlEvidence) -> None:
-        if evidence.control_id not in ISO_27001_CONTROLS:
+        if evidence.control_id not in _CONTROL_IDS:
             raise KeyError(f"Unknown ISO 27001 control {evidence.control_id}")
         self._entries[evidence.control_id] = evidence
 
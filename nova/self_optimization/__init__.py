@@ -1,5 +1,5 @@
 """Self-optimisation utilities for Nova."""
 
-from .optimizer import OptimizationReport, PipelineMetrics, PipelineOptimizer
+from .optimizer import OptimizationReport, PipelineMetrics, PipelineMetricsBatch, PipelineOptimizer
 
-__all__ = ["OptimizationReport", "PipelineMetrics", "PipelineOptimizer"]
+__all__ = ["OptimizationReport", "PipelineMetrics", "PipelineMetricsBatch", "PipelineOptimizer"]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import statistics
+import atexit
 import time
+import weakref
+from array import array
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import List, Sequence
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
 
 from ..explainability import ExplainabilityLogger
+from ..fileio import write_atomic
 
 
 @dataclass(slots=True)
@@ -20,29 +24,118 @@ class PipelineMetrics:
     coverage: float
 
 
-@dataclass(slots=True)
+class PipelineMetricsBatch:
+    """Column-oriented storage for large batches of :class:`PipelineMetrics`.
+
+    Each metric is kept in a contiguous ``array('d')`` column so averages are
+    computed by C-level summation instead of per-object attribute access.
+    """
+
+    __slots__ = ("build_times", "error_rates", "coverage")
+
+    def __init__(self, build_times: Iterable[float], error_rates: Iterable[float], coverage: Iterable[float]) -> None:
+        self.build_times = array("d", build_times)
+        self.error_rates = array("d", error_rates)
+        self.coverage = array("d", coverage)
+        if not len(self.build_times) == len(self.error_rates) == len(self.coverage):
+            raise ValueError("metric columns must have the same length")
+
+    @classmethod
+    def from_metrics(cls, metrics: Iterable[PipelineMetrics]) -> "PipelineMetricsBatch":
+        batch = cls((), (), ())
+        for metric in metrics:
+            batch.build_times.append(metric.build_time_seconds)
+            batch.error_rates.append(metric.error_rate)
+            batch.coverage.append(metric.coverage)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.build_times)
+
+    def __getitem__(self, index: int) -> PipelineMetrics:
+        return PipelineMetrics(self.build_times[index], self.error_rates[index], self.coverage[index])
+
+    def __iter__(self) -> Iterator[PipelineMetrics]:
+        for build_time, error_rate, coverage in zip(self.build_times, self.error_rates, self.coverage):
+            yield PipelineMetrics(build_time, error_rate, coverage)
+
+    def copy(self) -> "PipelineMetricsBatch":
+        """Return a batch with its own copy of every column."""
+
+        batch = PipelineMetricsBatch.__new__(PipelineMetricsBatch)
+        # Slicing an array copies the raw buffer in one memcpy.
+        batch.build_times = self.build_times[:]
+        batch.error_rates = self.error_rates[:]
+        batch.coverage = self.coverage[:]
+        return batch
+
+    def rows(self) -> Iterator[Tuple[float, float, float]]:
+        """Yield ``(build_time, error_rate, coverage)`` without building objects."""
+
+        return zip(self.build_times, self.error_rates, self.coverage)
+
+    def means(self) -> Tuple[float, float, float]:
+        """Return the average build time, error rate and coverage."""
+
+        count = len(self.build_times)
+        return sum(self.build_times) / count, sum(self.error_rates) / count, sum(self.coverage) / count
+
+
+@dataclass(frozen=True, slots=True)
 class OptimizationReport:
-    """Summary of an optimisation cycle."""
+    """Summary of an optimisation cycle.
+
+    ``metrics`` is either a tuple of :class:`PipelineMetrics` or, for columnar
+    input, a snapshot of the analysed :class:`PipelineMetricsBatch`.  Reports
+    are immutable; use :func:`dataclasses.replace` to derive a changed one.
+    """
 
     reward: float
     recommendation: str
-    metrics: List[PipelineMetrics] = field(default_factory=list)
+    metrics: Tuple[PipelineMetrics, ...] | PipelineMetricsBatch = ()
     generated_at: float = field(default_factory=time.time)
+    _markdown: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_markdown(self) -> str:
+        if self._markdown is None:
+            object.__setattr__(self, "_markdown", self._render_markdown())
+        return self._markdown  # type: ignore[return-value]
+
+    def _render_markdown(self) -> str:
         header = ["# Optimisation Report", "", f"* Reward: {self.reward:.2f}", f"* Recommendation: {self.recommendation}"]
         if not self.metrics:
             header.append("\n_No metrics available._")
             return "\n".join(header)
         header.append("\n## Metrics")
-        for metric in self.metrics:
-            header.append(
-                f"- build_time={metric.build_time_seconds:.2f}s, "
-                f"error_rate={metric.error_rate:.3f}, coverage={metric.coverage:.3f}"
-            )
+        if isinstance(self.metrics, PipelineMetricsBatch):
+            rows: Iterable[Tuple[float, float, float]] = self.metrics.rows()
+        else:
+            rows = ((metric.build_time_seconds, metric.error_rate, metric.coverage) for metric in self.metrics)
+        header.extend(
+            f"- build_time={build_time:.2f}s, error_rate={error_rate:.3f}, coverage={coverage:.3f}"
+            for build_time, error_rate, coverage in rows
+        )
         return "\n".join(header)
 
 
+def _averages(metrics: Sequence[PipelineMetrics] | PipelineMetricsBatch) -> Tuple[float, float, float]:
+    if isinstance(metrics, PipelineMetricsBatch):
+        return metrics.means()
+    total_build = total_error = total_coverage = 0.0
+    for metric in metrics:
+        total_build += metric.build_time_seconds
+        total_error += metric.error_rate
+        total_coverage += metric.coverage
+    count = len(metrics)
+    return total_build / count, total_error / count, total_coverage / count
+
+
+def _flush_at_exit(ref: "weakref.ref[PipelineOptimizer]") -> None:
+    optimizer = ref()
+    if optimizer is not None:
+        optimizer.flush()
+
+
 class PipelineOptimizer:
     """Analyses pipeline telemetry and produces optimisation guidance."""
 
@@ -51,19 +144,31 @@ class PipelineOptimizer:
         *,
         report_path: str | Path | None = None,
         logger: ExplainabilityLogger | None = None,
+        flush_every: int = 1,
     ) -> None:
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
         base_path = Path(report_path) if report_path else Path("reports/optimizer_report.md")
         self.report_path = base_path
         self.report_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logger or ExplainabilityLogger()
+        self._flush_every = flush_every
+        self._pending: Optional[OptimizationReport] = None
+        self._pending_cycles = 0
+        # The exit hook holds only a weak reference so it never keeps the
+        # optimizer alive; ``close`` unregisters it.
+        self._exit_hook: Optional[partial[None]] = None
+        if flush_every > 1:
+            self._exit_hook = partial(_flush_at_exit, weakref.ref(self))
+            atexit.register(self._exit_hook)
 
     # ------------------------------------------------------------------
-    def analyse(self, metrics: Sequence[PipelineMetrics]) -> OptimizationReport:
+    def analyse(self, metrics: Sequence[PipelineMetrics] | PipelineMetricsBatch) -> OptimizationReport:
         """Analyse telemetry and derive an optimisation recommendation."""
 
         if not metrics:
             recommendation = "Collect more telemetry before optimising."
-            report = OptimizationReport(reward=0.0, recommendation=recommendation, metrics=[])
+            report = OptimizationReport(reward=0.0, recommendation=recommendation)
             self.logger.log_decision(
                 "optimizer",
                 reason="Insufficient metrics for optimisation.",
@@ -73,9 +178,7 @@ class PipelineOptimizer:
             self._write_report(report)
             return report
 
-        avg_build = statistics.mean(metric.build_time_seconds for metric in metrics)
-        avg_error = statistics.mean(metric.error_rate for metric in metrics)
-        avg_coverage = statistics.mean(metric.coverage for metric in metrics)
+        avg_build, avg_error, avg_coverage = _averages(metrics)
 
         performance_gain = max(0.0, 1.0 - avg_build / max(metrics[0].build_time_seconds, 1e-6))
         reward = (performance_gain * 100.0) - (avg_error * 100.0)
@@ -90,7 +193,10 @@ class PipelineOptimizer:
         report = OptimizationReport(
             reward=reward,
             recommendation=recommendation,
-            metrics=list(metrics),
+            # Batches stay columnar; rows are only materialised when rendered.
+            # Snapshot the columns so later changes to the caller's batch do
+            # not diverge from the memoised Markdown.
+            metrics=metrics.copy() if isinstance(metrics, PipelineMetricsBatch) else tuple(metrics),
         )
         self.logger.log_decision(
             "optimizer",
@@ -107,8 +213,42 @@ class PipelineOptimizer:
         return report
 
     # ------------------------------------------------------------------
+    def flush(self) -> None:
+        """Write the most recent pending report to :attr:`report_path`.
+
+        Unlike the per-cycle writes, an explicit flush also syncs the report
+        to disk.
+        """
+
+        self._flush(durable=True)
+
+    def _flush(self, *, durable: bool) -> None:
+        report, self._pending = self._pending, None
+        self._pending_cycles = 0
+        if report is not None:
+            write_atomic(self.report_path, report.to_markdown().encode("utf-8"), durable=durable)
+
+    def close(self) -> None:
+        """Write any pending report and drop the interpreter exit hook."""
+
+        self.flush()
+        hook, self._exit_hook = self._exit_hook, None
+        if hook is not None:
+            atexit.unregister(hook)
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:  # pragma: no cover - interpreter shutdown
+            pass
+
     def _write_report(self, report: OptimizationReport) -> None:
-        self.report_path.write_text(report.to_markdown(), encoding="utf-8")
+        # The report file is overwritten on every cycle, so coalescing only
+        # needs to keep the latest report until the next flush.
+        self._pending = report
+        self._pending_cycles += 1
+        if self._pending_cycles >= self._flush_every:
+            self._flush(durable=False)
 
 
-__all__ = ["OptimizationReport", "PipelineMetrics", "PipelineOptimizer"]
+__all__ = ["OptimizationReport", "PipelineMetrics", "PipelineMetricsBatch", "PipelineOptimizer"]
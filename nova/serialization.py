@@ -0,0 +1,59 @@
+"""JSON helpers shared by Nova's hot serialisation paths.
+
+:mod:`orjson` is used when it is installed; otherwise the standard library
+:mod:`json` module provides the same compact, key-sorted output.
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+from typing import Any, Callable
+
+if importlib.util.find_spec("orjson") is not None:  # pragma: no branch - depends on environment
+    _orjson: Any = importlib.import_module("orjson")
+    _SORTED_OPTIONS = _orjson.OPT_SORT_KEYS | _orjson.OPT_NON_STR_KEYS
+else:  # pragma: no cover - optional dependency fallback
+    _orjson = None
+
+
+def dumps_sorted(value: Any) -> str:
+    """Serialise ``value`` to compact JSON with deterministic key order.
+
+    Values :mod:`orjson` rejects, such as integers wider than 64 bits, are
+    serialised by the standard library instead.
+    """
+
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value, option=_SORTED_OPTIONS).decode("utf-8")
+        except _orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def dumps_bytes(value: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialise ``value`` to compact UTF-8 encoded JSON bytes.
+
+    ``default`` converts objects neither backend handles natively, such as
+    read-only mapping views.  Like :func:`dumps_sorted`, values :mod:`orjson`
+    rejects fall back to the standard library.
+    """
+
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value, default=default, option=_orjson.OPT_NON_STR_KEYS)
+        except _orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, default=default, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from ``data``."""
+
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps_bytes", "dumps_sorted", "loads"]
@@ -0,0 +1,30 @@
+"""Line-oriented Markdown buffer shared by the report builders."""
+
+from __future__ import annotations
+
+import io
+
+
+class MarkdownWriter:
+    """Accumulate Markdown lines in a single :class:`io.StringIO` buffer."""
+
+    __slots__ = ("_buffer", "_write")
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._write = self._buffer.write
+
+    def line(self, text: str = "") -> None:
+        """Write ``text`` followed by a newline."""
+
+        write = self._write
+        write(text)
+        write("\n")
+
+    def getvalue(self) -> str:
+        """Return everything written so far."""
+
+        return self._buffer.getvalue()
+
+
+__all__ = ["MarkdownWriter"]
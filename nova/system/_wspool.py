@@ -0,0 +1,190 @@
+"""Small work-stealing thread pool used by the orchestrator."""
+
+from __future__ import annotations
+
+import random
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+_WorkItem = Tuple[Future, Callable[..., Any], tuple, dict]
+
+_current = threading.local()
+
+# Like ``concurrent.futures``, workers are not daemon threads: at interpreter
+# exit every live pool is shut down and joined, so running work finishes
+# instead of being killed.  The hook runs before non-daemon threads are
+# joined, which is what lets the parked workers wake up and exit.
+_pools: "weakref.WeakSet[WorkStealingPool]" = weakref.WeakSet()
+_pools_lock = threading.Lock()
+_interpreter_exiting = False
+
+
+def _python_exit() -> None:
+    global _interpreter_exiting
+    with _pools_lock:
+        _interpreter_exiting = True
+        pools = list(_pools)
+    for pool in pools:
+        pool.shutdown(wait=False)
+    for pool in pools:
+        pool._join()
+
+
+threading._register_atexit(_python_exit)  # type: ignore[attr-defined]
+
+
+class WorkStealingPool:
+    """Fixed-size pool where every worker owns a double-ended queue.
+
+    Work submitted from inside a worker is pushed onto that worker's own
+    deque and popped LIFO by its owner; idle workers steal FIFO from the
+    opposite end of a random victim.  Submissions from other threads go to a
+    shared queue.  Workers spin briefly before parking on a condition.
+    """
+
+    def __init__(self, max_workers: int, *, spin: int = 64, thread_name_prefix: str = "nova-ws"):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._spin = spin
+        self._deques: List[Deque[_WorkItem]] = [deque() for _ in range(max_workers)]
+        self._locks = [threading.Lock() for _ in range(max_workers)]
+        self._submissions: Deque[_WorkItem] = deque()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(index,),
+                name=f"{thread_name_prefix}_{index}",
+            )
+            for index in range(max_workers)
+        ]
+        with _pools_lock:
+            if _interpreter_exiting:
+                raise RuntimeError("cannot create a pool after interpreter shutdown")
+            _pools.add(self)
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> "WorkStealingPool":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.shutdown(wait=True)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` and return its :class:`Future`."""
+
+        future: Future = Future()
+        item: _WorkItem = (future, fn, args, kwargs)
+        index = getattr(_current, "index", None) if getattr(_current, "pool", None) is self else None
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new work after shutdown")
+            if index is None:
+                self._submissions.append(item)
+            else:
+                with self._locks[index]:
+                    self._deques[index].append(item)
+            # Condition waiters are woken in the order they parked, so this
+            # hands the item to the least recently parked worker.
+            self._condition.notify()
+        return future
+
+    def submit_local(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Push work onto the calling worker's own deque for depth-first runs.
+
+        The first item is left for the caller, which is still running and
+        will pop it next; a parked sibling is only woken once the deque holds
+        more than that one item.  Outside a worker this is :meth:`submit`.
+        """
+
+        index = getattr(_current, "index", None) if getattr(_current, "pool", None) is self else None
+        if index is None:
+            return self.submit(fn, *args, **kwargs)
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new work after shutdown")
+            with self._locks[index]:
+                backlog = len(self._deques[index])
+                self._deques[index].append((future, fn, args, kwargs))
+            if backlog:
+                self._condition.notify()
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; queued items still run before workers exit.
+
+        Waiting from one of the pool's own workers would join that worker
+        with itself, so it raises :class:`RuntimeError` instead.
+        """
+
+        if wait and getattr(_current, "pool", None) is self:
+            raise RuntimeError("cannot shutdown(wait=True) from a worker of the same pool")
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            self._join()
+
+    def _join(self) -> None:
+        current = threading.current_thread()
+        for thread in self._threads:
+            if thread is not current:
+                thread.join()
+
+    def _has_work(self) -> bool:
+        return bool(self._submissions) or any(self._deques)
+
+    def _take(self, index: int) -> Optional[_WorkItem]:
+        with self._locks[index]:
+            if self._deques[index]:
+                return self._deques[index].pop()
+        count = len(self._deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim == index or not self._deques[victim]:
+                continue
+            with self._locks[victim]:
+                if self._deques[victim]:
+                    return self._deques[victim].popleft()
+        with self._condition:
+            if self._submissions:
+                return self._submissions.popleft()
+        return None
+
+    def _worker(self, index: int) -> None:
+        _current.pool = self
+        _current.index = index
+        while True:
+            item = None
+            for _ in range(self._spin):
+                item = self._take(index)
+                if item is not None or not self._has_work():
+                    break
+            if item is None:
+                with self._condition:
+                    if self._has_work():
+                        continue
+                    if self._shutdown:
+                        return
+                    self._condition.wait()
+                continue
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            del item, future, fn, args, kwargs
+
+
+__all__ = ["WorkStealingPool"]
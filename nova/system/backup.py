@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Callable, Iterable, List
+from typing import Callable, List
 
 
 @dataclass(slots=True)
@@ -25,29 +25,22 @@ class BackupPlan:
     def to_markdown(self) -> str:
         """Render the plan as a Markdown document."""
 
-        lines: list[str] = [f"# {self.title}", ""]
-        lines.append("## Zusammenfassung")
-        lines.append(self.summary)
-        lines.append("")
-
-        def render_section(title: str, items: Iterable[str]) -> None:
-            entries = list(items)
-            if not entries:
-                return
-            lines.append(f"## {title}")
-            for entry in entries:
-                lines.append(f"- {entry}")
-            lines.append("")
-
-        render_section("Schutzumfang & Ziele", self.scope)
-        render_section("Backup-Jobs", self.backup_jobs)
-        render_section("Recovery-Übungen", self.recovery_drills)
-        render_section("Validierung & Überwachung", self.validation_steps)
-        render_section("Aufbewahrung & Compliance", self.retention_policies)
-        render_section("Automatisierung & Integration", self.automation_hooks)
-        render_section("Nova-spezifische Hinweise", self.integration_notes)
-
-        return "\n".join(lines).strip()
+        sections = (
+            ("Schutzumfang & Ziele", self.scope),
+            ("Backup-Jobs", self.backup_jobs),
+            ("Recovery-Übungen", self.recovery_drills),
+            ("Validierung & Überwachung", self.validation_steps),
+            ("Aufbewahrung & Compliance", self.retention_policies),
+            ("Automatisierung & Integration", self.automation_hooks),
+            ("Nova-spezifische Hinweise", self.integration_notes),
+        )
+        parts = [f"# {self.title}", "", "## Zusammenfassung", self.summary, ""]
+        parts += [
+            f"## {title}\n" + "\n".join(f"- {entry}" for entry in items) + "\n"
+            for title, items in sections
+            if items
+        ]
+        return "\n".join(parts).strip()
 
 
 def _default_backup_plan() -> BackupPlan:
@@ -119,8 +112,26 @@ def _default_backup_plan() -> BackupPlan:
     )
 
 
+# The default plan is static, so it is built and rendered once at import.
+_DEFAULT_PLAN = _default_backup_plan()
+_DEFAULT_MARKDOWN = _DEFAULT_PLAN.to_markdown()
+
+
+def _copy_default_backup_plan() -> BackupPlan:
+    return replace(
+        _DEFAULT_PLAN,
+        scope=list(_DEFAULT_PLAN.scope),
+        backup_jobs=list(_DEFAULT_PLAN.backup_jobs),
+        recovery_drills=list(_DEFAULT_PLAN.recovery_drills),
+        validation_steps=list(_DEFAULT_PLAN.validation_steps),
+        retention_policies=list(_DEFAULT_PLAN.retention_policies),
+        automation_hooks=list(_DEFAULT_PLAN.automation_hooks),
+        integration_notes=list(_DEFAULT_PLAN.integration_notes),
+    )
+
+
 _PLAN_BUILDERS: dict[str, Callable[[], BackupPlan]] = {
-    "default": _default_backup_plan,
+    "default": _copy_default_backup_plan,
 }
 
 
@@ -149,8 +160,9 @@ def build_backup_plan(plan_name: str) -> BackupPlan:
 def export_backup_plan(plan: BackupPlan, path: Path) -> Path:
     """Persist ``plan`` as Markdown and return the written path."""
 
+    markdown = _DEFAULT_MARKDOWN if plan == _DEFAULT_PLAN else plan.to_markdown()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(plan.to_markdown() + "\n", encoding="utf-8")
+    path.write_text(markdown + "\n", encoding="utf-8")
     return path
 
 
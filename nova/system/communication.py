@@ -2,9 +2,30 @@
 
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from threading import RLock
-from typing import Any, Iterable, Tuple
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Tuple
+
+_RECIPIENT_CACHE_LIMIT = 1024
+_RECIPIENT_CACHE: dict[str, str] = {}
+
+
+def _normalise_recipient(recipient: str) -> str:
+    """Return the interned, normalised form of ``recipient``.
+
+    Recipients come from a small vocabulary of agent names, so the
+    normalised strings are memoised by their raw spelling.
+    """
+
+    cached = _RECIPIENT_CACHE.get(recipient)
+    if cached is None:
+        cached = sys.intern(recipient.strip().lower())
+        if len(_RECIPIENT_CACHE) < _RECIPIENT_CACHE_LIMIT:
+            _RECIPIENT_CACHE[recipient] = cached
+    return cached
 
 
 @dataclass(slots=True)
@@ -15,9 +36,23 @@ class AgentMessage:
     recipients: Tuple[str, ...]
     subject: str
     body: str
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        """Return the message as a dictionary.
+
+        With ``copy=False`` the recipients tuple and a read-only view of the
+        metadata are returned instead of fresh containers.
+        """
+
+        if not copy:
+            return {
+                "sender": self.sender,
+                "recipients": self.recipients,
+                "subject": self.subject,
+                "body": self.body,
+                "metadata": MappingProxyType(self.metadata),
+            }
         return {
             "sender": self.sender,
             "recipients": list(self.recipients),
@@ -32,21 +67,38 @@ class CommunicationHub:
 
     def __init__(self) -> None:
         self._messages: list[AgentMessage] = []
-        self._lock = RLock()
+        # Inverted index of recipient -> positions in ``_messages``.
+        self._by_recipient: defaultdict[str, list[int]] = defaultdict(list)
+        # Governance decisions are routed here at publish time so reports do
+        # not have to rescan the whole log.
+        self._governance: list[AgentMessage] = []
+        self._lock = Lock()
 
     @staticmethod
     def _normalise_recipients(recipients: Iterable[str] | None) -> Tuple[str, ...]:
         if not recipients:
             return ("orchestrator",)
-        return tuple(recipient.strip().lower() for recipient in recipients if recipient.strip())
+        normalised = (_normalise_recipient(recipient) for recipient in recipients)
+        return tuple(recipient for recipient in normalised if recipient)
 
     def publish(self, message: AgentMessage) -> AgentMessage:
         """Store ``message`` in the log and return it."""
 
-        with self._lock:
-            self._messages.append(message)
+        self.publish_many((message,))
         return message
 
+    def publish_many(self, messages: Iterable[AgentMessage]) -> None:
+        """Store several ``messages`` in order while taking the lock once."""
+
+        with self._lock:
+            for message in messages:
+                position = len(self._messages)
+                for recipient in set(message.recipients):
+                    self._by_recipient[recipient].append(position)
+                self._messages.append(message)
+                if message.subject.startswith("governance"):
+                    self._governance.append(message)
+
     def send(
         self,
         *,
@@ -97,11 +149,15 @@ class CommunicationHub:
 
         recipient_key = recipient.strip().lower()
         with self._lock:
-            return [
-                message
-                for message in self._messages
-                if "all" in message.recipients or recipient_key in message.recipients
-            ]
+            positions = set(self._by_recipient.get(recipient_key, ()))
+            positions.update(self._by_recipient.get("all", ()))
+            return [self._messages[position] for position in sorted(positions)]
+
+    def governance_messages(self) -> Tuple[AgentMessage, ...]:
+        """Return the messages whose subject starts with ``governance``."""
+
+        with self._lock:
+            return tuple(self._governance)
 
     def latest(self) -> AgentMessage | None:
         """Return the newest message in the log if available."""
@@ -116,6 +172,8 @@ class CommunicationHub:
 
         with self._lock:
             self._messages.clear()
+            self._by_recipient.clear()
+            self._governance.clear()
 
 
 __all__ = ["AgentMessage", "CommunicationHub"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 import os
 from pathlib import Path
@@ -60,6 +61,8 @@ class ContainerInspectionReport:
     runtimes: List[RuntimeCheckResult]
 
     def all_healthy(self) -> bool:
+        # Computed on demand: there are only a handful of runtimes, and the
+        # list may be changed in place.
         return all(result.health == "ok" for result in self.runtimes)
 
     def to_dict(self) -> dict:
@@ -92,6 +95,28 @@ class ContainerInspectionReport:
         return "\n".join(lines).strip()
 
 
+_WHICH_CACHE_LIMIT = 32
+_WHICH_CACHE: dict[tuple[str, str | None], str] = {}
+
+
+def _which_cached(binary: str, search_path: str | None) -> str | None:
+    """Resolve ``binary`` once per ``PATH`` value.
+
+    Only found binaries are remembered; a miss is looked up again on the next
+    call so runtimes installed after start-up are picked up.
+    """
+
+    key = (binary, search_path)
+    found = _WHICH_CACHE.get(key)
+    if found is None:
+        found = shutil.which(binary, path=search_path)
+        if found is not None:
+            if len(_WHICH_CACHE) >= _WHICH_CACHE_LIMIT:
+                _WHICH_CACHE.clear()
+            _WHICH_CACHE[key] = found
+    return found
+
+
 def _run_version_command(binary: str, version_args: Sequence[str]) -> tuple[str | None, list[str], str]:
     """Execute the version command and capture output and health state."""
 
@@ -100,7 +125,6 @@ def _run_version_command(binary: str, version_args: Sequence[str]) -> tuple[str
         completed = subprocess.run(  # noqa: S603,S607 - command built from trusted inputs
             [binary, *version_args],
             capture_output=True,
-            text=True,
             check=False,
             timeout=5,
         )
@@ -114,12 +138,16 @@ def _run_version_command(binary: str, version_args: Sequence[str]) -> tuple[str
         notes.append(f"Fehler beim Abrufen der Version: {exc}")
         return None, notes, "warning"
 
-    output = (completed.stdout or "").strip() or (completed.stderr or "").strip()
-    version = output.splitlines()[0] if output else None
+    # Only the first line is needed for the version, so decode just that
+    # slice of the raw output unless the full text is reported as a note.
+    raw = (completed.stdout or b"").strip() or (completed.stderr or b"").strip()
+    newline = raw.find(b"\n")
+    first_line = raw if newline < 0 else raw[:newline]
+    version = first_line.decode("utf-8", "replace").strip() or None
     if completed.returncode != 0:
         notes.append(f"Versionskommando endete mit Code {completed.returncode}.")
-        if output:
-            notes.append(output)
+        if raw:
+            notes.append(raw.decode("utf-8", "replace"))
         return version, notes, "warning"
     return version, notes, "ok"
 
@@ -133,7 +161,7 @@ def check_container_runtime(
 ) -> RuntimeCheckResult:
     """Verify the availability of a container runtime binary and configuration."""
 
-    binary_path = shutil.which(binary)
+    binary_path = _which_cached(binary, os.environ.get("PATH"))
     if binary_path is None:
         notes = [f"Binary '{binary}' wurde nicht im PATH gefunden."]
         return RuntimeCheckResult(
@@ -150,18 +178,18 @@ def check_container_runtime(
 
     config_ok: bool | None = None
     if config_paths:
-        expanded_paths = []
+        # Deduplicate on the normalised path string so each candidate costs a
+        # single stat() for the existence check instead of a full resolve().
+        existing = []
+        seen: set[str] = set()
         for path in config_paths:
-            expanded_paths.append(path.expanduser())
-        unique_paths = []
-        seen = set()
-        for path in expanded_paths:
-            key = path.resolve()
+            path = path.expanduser()
+            key = os.path.normpath(os.path.abspath(path))
             if key in seen:
                 continue
             seen.add(key)
-            unique_paths.append(path)
-        existing = [path for path in unique_paths if path.exists()]
+            if path.exists():
+                existing.append(path)
         if existing:
             config_ok = True
             note = "Gefundene Kubeconfig-Dateien: " + ", ".join(str(path) for path in existing)
@@ -203,15 +231,19 @@ def inspect_container_runtimes(kubeconfig: Path | None = None) -> ContainerInspe
 
     kubeconfig_candidates = _collect_kubeconfig_candidates(kubeconfig)
 
-    results = [
-        check_container_runtime("Docker Engine", "docker"),
-        check_container_runtime(
-            "Kubernetes CLI",
-            "kubectl",
-            version_args=("version", "--client", "--short"),
-            config_paths=kubeconfig_candidates,
-        ),
-    ]
+    # The version probes are independent subprocesses, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(check_container_runtime, "Docker Engine", "docker"),
+            executor.submit(
+                check_container_runtime,
+                "Kubernetes CLI",
+                "kubectl",
+                version_args=("version", "--client", "--short"),
+                config_paths=kubeconfig_candidates,
+            ),
+        ]
+        results = [future.result() for future in futures]
 
     return ContainerInspectionReport(runtimes=results)
 
@@ -284,8 +316,8 @@ def export_container_fix_plan(plan: str, destination: Path) -> Path:
 def log_container_report(report: ContainerInspectionReport) -> None:
     """Emit the inspection report via the Nova logger."""
 
-    for line in report.to_markdown().splitlines():
-        log_info(line)
+    # One multi-line record instead of one handler dispatch per Markdown line.
+    log_info("%s", report.to_markdown())
     if not report.all_healthy():
         log_warning(
             "Container-Prüfung meldet Warnungen oder fehlende Runtimes. Bitte Installationsplan prüfen."
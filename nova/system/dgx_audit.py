@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
-import json
-import shutil
+import atexit
+import errno
+import os
+import selectors
 import socket
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
+from ..fileio import write_atomic
+from ..serialization import dumps_bytes
 from .setup import _resolve_root
-from .checks import check_gpu
+from .checks import check_gpu, decode_nvml, detect_nvidia_smi, nvml_module
+
+# nvidia-smi calls slower than this usually mean the driver is re-initialised
+# on every invocation because persistence mode is off.
+_SMI_SLOW_SECONDS = 0.2
+
+_STATUS_ICONS = {"ok": "✅", "warning": "⚠️"}
+
+# A write probe younger than this still proves write access, so polling
+# audits skip rewriting it. Override with NOVA_DGX_FS_CACHE_TTL (seconds).
+_FS_PROBE_TTL_SECONDS = 60.0
+
+# GPU health thresholds: any uncorrected (double-bit) ECC error is an error,
+# thermal slowdown or a core temperature above this limit is a warning.
+_GPU_TEMPERATURE_WARNING_C = 88
+_THERMAL_THROTTLE_MASK = 0x20 | 0x40  # software and hardware thermal slowdown
 
 
 @dataclass(slots=True)
@@ -24,7 +46,9 @@ class AuditCheck:
     details: List[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, object]:
-        return {"name": self.name, "status": self.status, "details": list(self.details)}
+        # ``details`` is shared rather than copied; callers that mutate the
+        # result should copy it themselves.
+        return {"name": self.name, "status": self.status, "details": self.details}
 
 
 @dataclass(slots=True)
@@ -35,38 +59,41 @@ class DGXAuditResult:
     checks: List[AuditCheck]
     report_path: Path
     log_path: Path
+    passed: Optional[bool] = None
+    timestamp_iso: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def passed(self) -> bool:
-        return all(check.status == "ok" for check in self.checks)
+    def __post_init__(self) -> None:
+        self.timestamp_iso = self.timestamp.isoformat()
+        if self.passed is None:
+            self.passed = all(check.status == "ok" for check in self.checks)
 
     def to_dict(self) -> dict[str, object]:
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "passed": self.passed,
             "checks": [check.to_dict() for check in self.checks],
             "report_path": str(self.report_path),
             "log_path": str(self.log_path),
         }
 
+    def to_json(self) -> bytes:
+        """Serialise the result to compact UTF-8 JSON."""
+
+        return dumps_bytes(self.to_dict())
+
     def to_markdown(self) -> str:
-        lines: List[str] = [
-            "# DGX Audit Report",
-            "",
-            f"* Generated: {self.timestamp.isoformat()}",
-            f"* Overall status: {'pass' if self.passed else 'attention required'}",
-            "",
-        ]
-        for check in self.checks:
-            icon = "✅" if check.status == "ok" else "⚠️" if check.status == "warning" else "❌"
-            lines.append(f"## {check.name}")
-            lines.append(f"- Status: {icon} {check.status}")
-            if check.details:
-                lines.append("- Details:")
-                for detail in check.details:
-                    lines.append(f"  - {detail}")
-            lines.append("")
-        return "\n".join(lines).strip() + "\n"
+        header = (
+            "# DGX Audit Report\n\n"
+            f"* Generated: {self.timestamp_iso}\n"
+            f"* Overall status: {'pass' if self.passed else 'attention required'}\n\n"
+        )
+        body = "".join(
+            f"## {check.name}\n- Status: {_STATUS_ICONS.get(check.status, '❌')} {check.status}\n"
+            + ("- Details:\n" + "".join(f"  - {detail}\n" for detail in check.details) if check.details else "")
+            + "\n"
+            for check in self.checks
+        )
+        return (header + body).strip() + "\n"
 
 
 def _normalise_status(flag: bool | None, *, success: str, failure: str) -> tuple[str, List[str]]:
@@ -77,31 +104,153 @@ def _normalise_status(flag: bool | None, *, success: str, failure: str) -> tuple
     return "warning", ["Check could not be executed."]
 
 
+def _probe_nvml_devices() -> tuple[str, List[str]] | None:
+    """Describe GPUs through NVML, returning ``None`` to fall back to nvidia-smi."""
+
+    nvml = nvml_module()
+    if nvml is None:
+        return None
+    try:
+        driver = decode_nvml(nvml.nvmlSystemGetDriverVersion())
+        details = []
+        for index in range(nvml.nvmlDeviceGetCount()):
+            handle = nvml.nvmlDeviceGetHandleByIndex(index)
+            name = decode_nvml(nvml.nvmlDeviceGetName(handle))
+            memory_mib = nvml.nvmlDeviceGetMemoryInfo(handle).total // 1024**2
+            details.append(f"{name} | {driver} | {memory_mib} MiB")
+    except Exception:  # pragma: no cover - requires NVIDIA drivers
+        return None
+    if not details:
+        return "warning", ["NVML returned no GPU entries"]
+    return "ok", details
+
+
+def _optional_nvml_reading(read: Callable[[], int]) -> int | None:
+    # Counters such as ECC are not supported on every board.
+    try:
+        return read()
+    except Exception:
+        return None
+
+
+def _check_gpu_health() -> tuple[str, List[str]] | None:
+    """Summarise ECC, temperature and throttling counters through NVML.
+
+    Returns ``None`` when NVML is unavailable so the check is omitted.
+    """
+
+    nvml = nvml_module()
+    if nvml is None:
+        return None
+    status = "ok"
+    details: List[str] = []
+    try:
+        count = nvml.nvmlDeviceGetCount()
+        handles = [nvml.nvmlDeviceGetHandleByIndex(index) for index in range(count)]
+    except Exception:  # pragma: no cover - requires NVIDIA drivers
+        return None
+    for index, handle in enumerate(handles):
+        ecc = _optional_nvml_reading(
+            lambda: nvml.nvmlDeviceGetTotalEccErrors(
+                handle, nvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED, nvml.NVML_VOLATILE_ECC
+            )
+        )
+        temperature = _optional_nvml_reading(lambda: nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU))
+        reasons = _optional_nvml_reading(lambda: nvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle))
+        throttled = bool(reasons and reasons & _THERMAL_THROTTLE_MASK)
+
+        if ecc:
+            status = "error"
+        elif status == "ok" and (throttled or (temperature is not None and temperature > _GPU_TEMPERATURE_WARNING_C)):
+            status = "warning"
+        details.append(
+            f"GPU {index}: temperature={'n/a' if temperature is None else f'{temperature}°C'}, "
+            f"uncorrected ECC={'n/a' if ecc is None else ecc}, thermal throttling={'yes' if throttled else 'no'}"
+        )
+    if not details:
+        return "warning", ["NVML returned no GPU entries"]
+    return status, details
+
+
 def _run_cuda_probe() -> tuple[str, List[str]]:
-    executable = shutil.which("nvidia-smi")
+    nvml_result = _probe_nvml_devices()
+    if nvml_result is not None:
+        return nvml_result
+    executable = detect_nvidia_smi()
     if not executable:
         return "warning", ["nvidia-smi not available in PATH"]
+    started = time.perf_counter()
     try:
         output = subprocess.check_output(
-            [executable, "--query-gpu=name,driver_version,memory.total", "--format=csv,noheader"],
+            [executable, "--query-gpu=name,driver_version,memory.total", "--format=csv,noheader,nounits"],
             text=True,
             timeout=5,
         )
     except (OSError, subprocess.SubprocessError) as exc:
         return "warning", [f"Failed to execute nvidia-smi: {exc}"]
+    elapsed = time.perf_counter() - started
     lines = [line.strip() for line in output.splitlines() if line.strip()]
     if not lines:
         return "warning", ["nvidia-smi returned no GPU entries"]
-    return "ok", [line.replace(",", " | ") for line in lines]
+    details = [_format_smi_row(line) for line in lines]
+    if elapsed > _SMI_SLOW_SECONDS:
+        details.append(
+            f"nvidia-smi took {elapsed * 1000:.0f} ms; enable persistence mode "
+            "(`nvidia-smi -pm 1` or nvidia-persistenced) to avoid driver re-initialisation."
+        )
+    return "ok", details
+
+
+def _format_smi_row(line: str) -> str:
+    fields = [field.strip() for field in line.split(",")]
+    if len(fields) != 3:
+        return " | ".join(fields)
+    name, driver, memory = fields
+    return f"{name} | {driver} | {memory} MiB"
 
 
 def _check_ports(ports: Sequence[int], *, host: str = "127.0.0.1", timeout: float = 0.2) -> tuple[str, List[str]]:
+    # Connect to every port at once with non-blocking sockets so the check
+    # waits for at most one ``timeout`` instead of one per filtered port.
+    # Resolve the host once and connect with whichever family it maps to.
+    try:
+        family, socktype, proto, _, sockaddr = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0]
+    except (OSError, IndexError) as exc:
+        return "warning", [f"Could not resolve {host}: {exc}"]
+
+    results: dict[int, int] = {}
+    sockets: List[socket.socket] = []
+    selector = selectors.DefaultSelector()
+    try:
+        # Allocate every socket before the first connect so the connects are
+        # issued back to back.
+        for _ in ports:
+            sock = socket.socket(family, socktype, proto)
+            sockets.append(sock)
+            sock.setblocking(False)
+        for port, sock in zip(ports, sockets):
+            code = sock.connect_ex((sockaddr[0], port, *sockaddr[2:]))
+            if code in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                selector.register(sock, selectors.EVENT_WRITE, port)
+            else:
+                results[port] = code
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _events in selector.select(remaining):
+                results[key.data] = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                selector.unregister(key.fileobj)
+    finally:
+        selector.close()
+        for sock in sockets:
+            sock.close()
+
     details: List[str] = []
     all_ok = True
     for port in ports:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
+        result = results.get(port, errno.ETIMEDOUT)
         if result == 0:
             details.append(f"Port {port} reachable on {host}")
         else:
@@ -110,6 +259,23 @@ def _check_ports(ports: Sequence[int], *, host: str = "127.0.0.1", timeout: floa
     return ("ok" if all_ok else "warning", details)
 
 
+def _filesystem_probe_ttl() -> float:
+    try:
+        return float(os.environ.get("NOVA_DGX_FS_CACHE_TTL", _FS_PROBE_TTL_SECONDS))
+    except ValueError:
+        return _FS_PROBE_TTL_SECONDS
+
+
+def _recent_probe_age(probe_file: Path) -> float | None:
+    """Return the probe file's age if it is fresh enough to trust, else ``None``."""
+
+    try:
+        age = time.time() - probe_file.stat().st_mtime
+    except OSError:
+        return None
+    return age if 0 <= age < _filesystem_probe_ttl() else None
+
+
 def _check_filesystem(root: Path) -> tuple[str, List[str]]:
     details: List[str] = []
     try:
@@ -118,37 +284,88 @@ def _check_filesystem(root: Path) -> tuple[str, List[str]]:
         logs_dir.mkdir(parents=True, exist_ok=True)
         reports_dir.mkdir(parents=True, exist_ok=True)
         probe_file = logs_dir / "dgx_write_test.log"
-        probe_file.write_text("dgx-audit-write-test\n", encoding="utf-8")
-        details.append(f"Write access confirmed in {logs_dir}")
+        if _recent_probe_age(probe_file) is None:
+            probe_file.write_text("dgx-audit-write-test\n", encoding="utf-8")
+            details.append(f"Write access confirmed in {logs_dir}")
+        else:
+            details.append(f"Write access confirmed in {logs_dir} (recent probe reused)")
         details.append(f"Reports directory available at {reports_dir}")
         return "ok", details
     except OSError as exc:
         return "error", [f"Filesystem write failed: {exc}"]
 
 
+_AUDIT_LOG_QUEUE: Dict[Path, List[bytes]] = {}
+_AUDIT_LOG_LOCK = threading.Lock()
+
+
+def _queue_audit_log(path: Path, record: bytes) -> None:
+    with _AUDIT_LOG_LOCK:
+        _AUDIT_LOG_QUEUE.setdefault(path, []).append(record)
+
+
+def _flush_audit_log() -> None:
+    """Append every queued audit record with one write per log file."""
+
+    with _AUDIT_LOG_LOCK:
+        pending = dict(_AUDIT_LOG_QUEUE)
+        _AUDIT_LOG_QUEUE.clear()
+    for path, records in pending.items():
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            data = memoryview(b"".join(records))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+
+atexit.register(_flush_audit_log)
+
+
 def run_dgx_audit(
     *,
     base_path: Path | None = None,
     ports: Iterable[int] = (22, 443, 50051),
+    flush: bool = True,
 ) -> DGXAuditResult:
-    """Execute the DGX audit and persist a Markdown report."""
+    """Execute the DGX audit and persist a Markdown report.
+
+    With ``flush=False`` the JSONL log entry is queued and written together
+    with other pending entries on the next flush or at interpreter exit.
+    """
 
     root = _resolve_root(base_path)
-    timestamp = datetime.utcnow()
+    timestamp = datetime.now(timezone.utc)
+
+    # The probes block on independent subprocess, socket and filesystem I/O,
+    # so they run side by side and the audit takes as long as the slowest.
+    port_list = list(ports)
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="dgx-audit") as executor:
+        gpu_future = executor.submit(check_gpu)
+        cuda_future = executor.submit(_run_cuda_probe)
+        health_future = executor.submit(_check_gpu_health)
+        network_future = executor.submit(_check_ports, port_list)
+        fs_future = executor.submit(_check_filesystem, root)
+        gpu_info = gpu_future.result()
+        cuda_status, cuda_details = cuda_future.result()
+        network_status, network_details = network_future.result()
+        fs_status, fs_details = fs_future.result()
+        gpu_health = health_future.result()
 
-    gpu_info = check_gpu()
     gpu_status, gpu_details = _normalise_status(
         gpu_info.get("available"),
         success="GPU detected via system check.",
         failure=gpu_info.get("details", "GPU unavailable"),
     )
-    cuda_status, cuda_details = _run_cuda_probe()
-    network_status, network_details = _check_ports(list(ports))
-    fs_status, fs_details = _check_filesystem(root)
 
     checks = [
         AuditCheck(name="GPU Availability", status=gpu_status, details=gpu_details),
         AuditCheck(name="CUDA Probe", status=cuda_status, details=cuda_details),
+    ]
+    if gpu_health is not None:
+        checks.append(AuditCheck(name="GPU Health", status=gpu_health[0], details=gpu_health[1]))
+    checks += [
         AuditCheck(name="Network Ports", status=network_status, details=network_details),
         AuditCheck(name="Filesystem Access", status=fs_status, details=fs_details),
     ]
@@ -160,11 +377,16 @@ def run_dgx_audit(
     log_dir = root / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / "dgx_audit.jsonl"
-    with log_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps({"timestamp": timestamp.isoformat(), "checks": [c.to_dict() for c in checks]}) + "\n")
+    passed = all(check.status == "ok" for check in checks)
+    result = DGXAuditResult(
+        timestamp=timestamp, checks=checks, report_path=report_path, log_path=log_path, passed=passed
+    )
+    record = {"timestamp": result.timestamp_iso, "checks": [check.to_dict() for check in checks]}
+    _queue_audit_log(log_path, dumps_bytes(record) + b"\n")
+    if flush:
+        _flush_audit_log()
 
-    result = DGXAuditResult(timestamp=timestamp, checks=checks, report_path=report_path, log_path=log_path)
-    report_path.write_text(result.to_markdown(), encoding="utf-8")
+    write_atomic(report_path, result.to_markdown().encode("utf-8"), durable=True)
     return result
 
 
@@ -2,31 +2,94 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+import sys
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionPhase:
-    """Represents a logical phase within the orchestration lifecycle."""
+    """Represents a logical phase within the orchestration lifecycle.
+
+    Phases are immutable; use :func:`dataclasses.replace` to derive a changed
+    phase.
+    """
 
     name: str
     goal: str
     agents: Tuple[str, ...]
+    after: Optional[Tuple[str, ...]] = None
+    _agent_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_agent_set", frozenset(self.agents))
+
+    @property
+    def agent_set(self) -> FrozenSet[str]:
+        """Return the phase's agents as a set for membership checks."""
+
+        return self._agent_set
 
     def to_dict(self) -> dict[str, object]:
-        return {
+        data: dict[str, object] = {
             "name": self.name,
             "goal": self.goal,
             "agents": list(self.agents),
         }
+        if self.after is not None:
+            data["after"] = list(self.after)
+        return data
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionPlan:
-    """Sequence of :class:`ExecutionPhase` objects describing execution order."""
+    """Sequence of :class:`ExecutionPhase` objects describing execution order.
+
+    Plans are immutable, so the execution order and dependency index are
+    built once when the plan is created.
+    """
 
     phases: Tuple[ExecutionPhase, ...]
+    _order: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _positions: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _prerequisites: Dict[str, Tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    _ancestors: Dict[str, FrozenSet[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Flattened execution order plus the first position of every agent,
+        # so dependency lookups do not rescan the phases.
+        order = tuple(agent for phase in self.phases for agent in phase.agents)
+        positions: Dict[str, int] = {}
+        for position, agent in enumerate(order):
+            positions.setdefault(agent, position)
+        # Phases wait for every earlier phase unless ``after`` narrows that
+        # down; only earlier phases count, so the result is always acyclic.
+        # ``ancestors`` keeps the transitive closure of those edges by phase
+        # name so :meth:`filtered` can preserve ordering through dropped phases.
+        prerequisites: Dict[str, Tuple[str, ...]] = {}
+        ancestors: Dict[str, FrozenSet[str]] = {}
+        earlier: List[ExecutionPhase] = []
+        for phase in self.phases:
+            direct = [
+                previous
+                for previous in earlier
+                if phase.after is None or previous.name in phase.after
+            ]
+            required = tuple(agent for previous in direct for agent in previous.agents)
+            for agent in phase.agents:
+                prerequisites.setdefault(agent, required)
+            ancestors.setdefault(
+                phase.name,
+                frozenset(previous.name for previous in direct).union(
+                    *(ancestors.get(previous.name, ()) for previous in direct)
+                ),
+            )
+            earlier.append(phase)
+        object.__setattr__(self, "_order", order)
+        object.__setattr__(self, "_positions", positions)
+        object.__setattr__(self, "_prerequisites", prerequisites)
+        object.__setattr__(self, "_ancestors", ancestors)
 
     def filtered(self, agent_types: Iterable[str]) -> "ExecutionPlan":
         """Return a plan containing only the requested ``agent_types``.
@@ -35,20 +98,31 @@ class ExecutionPlan:
         plan so that orchestrator extensions can still execute them.
         """
 
-        sequence: List[str] = [agent.lower() for agent in agent_types]
+        # Interned names compare by identity against the plan's agent names.
+        sequence: List[str] = [sys.intern(agent.lower()) for agent in agent_types]
         if not sequence:
             return ExecutionPlan(())
 
+        requested = frozenset(sequence)
         covered: set[str] = set()
         phases: List[ExecutionPhase] = []
         for phase in self.phases:
-            members = tuple(agent for agent in phase.agents if agent in sequence)
+            if phase._agent_set.isdisjoint(requested):
+                continue
+            members = tuple(agent for agent in phase.agents if agent in requested)
             if members:
+                after = phase.after
+                if after is not None:
+                    # Re-point ``after`` at the kept phases this one transitively
+                    # depends on, so dropping an intermediate phase keeps order.
+                    required = self._ancestors.get(phase.name, frozenset())
+                    after = tuple(kept.name for kept in phases if kept.name in required)
                 phases.append(
                     ExecutionPhase(
                         name=phase.name,
                         goal=phase.goal,
                         agents=members,
+                        after=after,
                     )
                 )
                 covered.update(members)
@@ -68,32 +142,34 @@ class ExecutionPlan:
     def iter_agents(self) -> Sequence[str]:
         """Return the flattened execution order for the plan."""
 
-        ordered: List[str] = []
-        for phase in self.phases:
-            ordered.extend(phase.agents)
-        return tuple(ordered)
+        return self._order
 
     def dependencies_for(self, agent_type: str) -> Tuple[str, ...]:
         """Return the agents that are planned to run before ``agent_type``."""
 
-        key = agent_type.lower()
-        predecessors: List[str] = []
-        for phase in self.phases:
-            if key in phase.agents:
-                for agent in phase.agents:
-                    if agent == key:
-                        break
-                    predecessors.append(agent)
-                break
-            predecessors.extend(phase.agents)
-        return tuple(predecessors)
+        return self._order[: self._positions.get(agent_type.lower(), len(self._order))]
+
+    def prerequisites_for(self, agent_type: str) -> Tuple[str, ...]:
+        """Return the agents that must finish before ``agent_type`` may start.
+
+        Unlike :meth:`dependencies_for` this ignores agents sharing the same
+        phase, which is what allows a phase to run its agents concurrently.
+        """
+
+        return self._prerequisites.get(agent_type.lower(), self._order)
 
     def to_dict(self) -> dict[str, object]:
         return {"phases": [phase.to_dict() for phase in self.phases]}
 
 
+@cache
 def build_default_plan() -> ExecutionPlan:
-    """Return the default execution plan covering all built-in agents."""
+    """Return the default execution plan covering all built-in agents.
+
+    The plan is immutable, so it is built once and shared.  Its phases
+    declare no ``after`` edges, so each phase waits for all earlier ones;
+    narrower ordering is opt-in for custom plans.
+    """
 
     phases = (
         ExecutionPhase(
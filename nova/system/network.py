@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
 
 _SUPPORTED_VPN_TYPES = {"wireguard", "openvpn"}
@@ -23,27 +23,20 @@ class VPNPlan:
     integration_notes: List[str] = field(default_factory=list)
 
     def to_markdown(self) -> str:
-        lines: list[str] = [f"# {self.vpn_type.title()} Remote Access Plan", ""]
-        lines.append("## Zusammenfassung")
-        lines.append(self.summary)
-        lines.append("")
-
-        def render_section(title: str, items: Iterable[str]) -> None:
-            entries = list(items)
-            if not entries:
-                return
-            lines.append(f"## {title}")
-            for entry in entries:
-                lines.append(f"- {entry}")
-            lines.append("")
-
-        render_section("Voraussetzungen", self.prerequisites)
-        render_section("Installationsschritte", self.setup_steps)
-        render_section("Validierung", self.validation_steps)
-        render_section("Härtung & Betrieb", self.hardening_steps)
-        render_section("Integration in Nova", self.integration_notes)
-
-        return "\n".join(lines).strip()
+        sections = (
+            ("Voraussetzungen", self.prerequisites),
+            ("Installationsschritte", self.setup_steps),
+            ("Validierung", self.validation_steps),
+            ("Härtung & Betrieb", self.hardening_steps),
+            ("Integration in Nova", self.integration_notes),
+        )
+        parts = [f"# {self.vpn_type.title()} Remote Access Plan", "", "## Zusammenfassung", self.summary, ""]
+        parts += [
+            f"## {title}\n" + "\n".join(f"- {entry}" for entry in items) + "\n"
+            for title, items in sections
+            if items
+        ]
+        return "\n".join(parts).strip()
 
 
 def _wireguard_plan() -> VPNPlan:
@@ -145,6 +138,24 @@ def _openvpn_plan() -> VPNPlan:
     )
 
 
+# The plans are static, so build them and their encoded Markdown only once.
+_CACHED_PLANS: dict[str, VPNPlan] = {"wireguard": _wireguard_plan(), "openvpn": _openvpn_plan()}
+_CACHED_MARKDOWN: dict[str, bytes] = {
+    key: (plan.to_markdown() + "\n").encode("utf-8") for key, plan in _CACHED_PLANS.items()
+}
+
+
+def _copy_plan(plan: VPNPlan) -> VPNPlan:
+    return replace(
+        plan,
+        prerequisites=list(plan.prerequisites),
+        setup_steps=list(plan.setup_steps),
+        validation_steps=list(plan.validation_steps),
+        hardening_steps=list(plan.hardening_steps),
+        integration_notes=list(plan.integration_notes),
+    )
+
+
 def build_vpn_plan(vpn_type: str) -> VPNPlan:
     """Return the rollout plan for the requested VPN implementation."""
 
@@ -156,16 +167,19 @@ def build_vpn_plan(vpn_type: str) -> VPNPlan:
         supported = ", ".join(sorted(_SUPPORTED_VPN_TYPES))
         raise ValueError(f"Unsupported VPN type: {vpn_type}. Supported values: {supported}")
 
-    if normalised == "wireguard":
-        return _wireguard_plan()
-    return _openvpn_plan()
+    return _copy_plan(_CACHED_PLANS[normalised])
 
 
 def export_vpn_plan(plan: VPNPlan, path: Path) -> Path:
     """Persist ``plan`` as Markdown to ``path`` and return the final location."""
 
+    key = plan.vpn_type.lower()
+    if plan == _CACHED_PLANS.get(key):
+        data = _CACHED_MARKDOWN[key]
+    else:
+        data = (plan.to_markdown() + "\n").encode("utf-8")
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(plan.to_markdown() + "\n", encoding="utf-8")
+    path.write_bytes(data)
     return path
 
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, MutableMapping, Tuple
 
+import asyncio
+import hashlib
 import sys
+import threading
 
 try:  # pragma: no cover - optional on some platforms
     import resource
@@ -17,10 +21,94 @@ from ..agents.base import AgentRunReport
 from ..agents.registry import get_agent_class, list_agent_types
 from ..blueprints.generator import create_blueprint
 from ..blueprints.models import AgentBlueprint
+from ..system._markdown import MarkdownWriter
+from ..system._wspool import WorkStealingPool
 from ..system.communication import AgentMessage, CommunicationHub
 from ..system.mission import ExecutionPhase, ExecutionPlan, build_default_plan
 from ..monitoring.alerts import notify_info, notify_warning
 from ..monitoring.logging import log_error, log_info
+from ..serialization import dumps_bytes, dumps_sorted
+
+
+# ``ru_maxrss`` is reported in bytes on macOS and in kilobytes elsewhere.
+_RSS_DIVISOR = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+
+@lru_cache(maxsize=256)
+def _shared_blueprint(agent_type: str) -> AgentBlueprint:
+    """Return the process-wide blueprint for ``agent_type``.
+
+    Blueprints are built from in-code definitions, so the agent type alone
+    identifies them.  The instances are shared; treat them as read-only and
+    seed ``Orchestrator._blueprint_cache`` to run a customised blueprint.
+    """
+
+    return create_blueprint(agent_type)
+
+
+_GOV_TMPL = "- **{action}** → {verdict}{rationale_text}{details_text}"
+
+
+def _governance_row(decision: Any) -> Dict[str, Any]:
+    """Return the :data:`_GOV_TMPL` fields for a governance ``decision``."""
+
+    if not isinstance(decision, dict):
+        return {"action": "unknown", "verdict": decision, "rationale_text": "", "details_text": ""}
+    rationale = decision.get("rationale")
+    extra = decision.get("details")
+    details = ", ".join(f"{k}={v}" for k, v in extra.items()) if isinstance(extra, dict) else ""
+    return {
+        "action": decision.get("action", "unknown"),
+        "verdict": decision.get("verdict", "UNKNOWN"),
+        "rationale_text": f" ({rationale})" if rationale else "",
+        "details_text": f" – details: {details}" if details else "",
+    }
+
+
+def _phase_metrics(
+    plan: ExecutionPlan, reports: Iterable[AgentRunReport]
+) -> Dict[str, Dict[str, int]]:
+    """Return completed/total task counts per phase of ``plan``."""
+
+    # Tally each agent once, then sum the tallies of the agents in a phase.
+    stats: Dict[str, List[int]] = {}
+    for report in reports:
+        tally = stats.setdefault(report.agent_type, [0, 0])
+        statuses = report.statuses
+        tally[0] += statuses.count("completed")
+        tally[1] += len(statuses)
+    metrics: Dict[str, Dict[str, int]] = {}
+    for phase in plan.phases:
+        tallies = [stats[agent] for agent in phase.agent_set if agent in stats]
+        metrics[phase.name] = {
+            "completed": sum(tally[0] for tally in tallies),
+            "total": sum(tally[1] for tally in tallies),
+        }
+    return metrics
+
+
+def _dag_layout(
+    plan: ExecutionPlan,
+) -> Tuple[List[str], Dict[str, ExecutionPhase], Dict[str, FrozenSet[str]]]:
+    """Return the agents of ``plan`` with their phase and prerequisite set."""
+
+    agent_list = list(dict.fromkeys(plan.iter_agents()))
+    phase_of: Dict[str, ExecutionPhase] = {}
+    for phase in plan.phases:
+        for agent in phase.agents:
+            phase_of.setdefault(agent, phase)
+    requirements = {agent: frozenset(plan.prerequisites_for(agent)) for agent in agent_list}
+    return agent_list, phase_of, requirements
+
+
+def _copy_report(report: AgentRunReport) -> AgentRunReport:
+    """Return ``report`` with fresh task and message lists."""
+
+    return replace(
+        report,
+        task_reports=list(report.task_reports),
+        pre_run_messages=list(report.pre_run_messages),
+    )
 
 
 @dataclass(slots=True)
@@ -28,7 +116,7 @@ class OrchestrationReport:
     """Summary describing the result of an orchestration run."""
 
     agent_reports: List[AgentRunReport]
-    communication_log: List[AgentMessage]
+    communication_log: Tuple[AgentMessage, ...]
     execution_mode: str = "sequential"
     execution_plan: ExecutionPlan | None = None
     phase_metrics: Dict[str, Dict[str, int]] | None = None
@@ -39,104 +127,98 @@ class OrchestrationReport:
     def success(self) -> bool:
         return all(report.success for report in self.agent_reports)
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, copy: bool = True) -> dict:
+        """Return the report as a dictionary.
+
+        With ``copy=False`` messages are returned as views (see
+        :meth:`AgentMessage.to_dict`) and the metric, memory and governance
+        containers are shared instead of copied.
+        """
+
         return {
             "success": self.success,
             "agents": [report.to_dict() for report in self.agent_reports],
-            "messages": [message.to_dict() for message in self.communication_log],
+            "messages": [message.to_dict(copy=copy) for message in self.communication_log],
             "execution_mode": self.execution_mode,
             "execution_plan": self.execution_plan.to_dict()
             if self.execution_plan
             else None,
             "phase_metrics": self.phase_metrics,
-            "memory_usage": dict(self.memory_usage) if self.memory_usage is not None else None,
-            "governance_verdicts": list(self.governance_verdicts)
+            "memory_usage": dict(self.memory_usage)
+            if copy and self.memory_usage is not None
+            else self.memory_usage,
+            "governance_verdicts": (list(self.governance_verdicts) if copy else self.governance_verdicts)
             if self.governance_verdicts
             else [],
         }
 
+    def to_json(self) -> bytes:
+        """Serialise :meth:`to_dict` to JSON bytes without copying messages."""
+
+        return dumps_bytes(self.to_dict(copy=False), default=dict)
+
     def to_markdown(self) -> str:
         """Render the orchestration summary as a Markdown report."""
 
-        lines: List[str] = [
-            "# Orchestration Report",
-            "",
-            f"* Overall status: {'success' if self.success else 'issues detected'}",
-            f"* Execution mode: {self.execution_mode}",
-            "",
-        ]
+        out = MarkdownWriter()
+        self._emit(out.line)
+        return out.getvalue().strip()
+
+    def _emit(self, write: Callable[[str], None]) -> None:
+        """Stream the Markdown report line by line into ``write``."""
+
+        write("# Orchestration Report")
+        write("")
+        write(f"* Overall status: {'success' if self.success else 'issues detected'}")
+        write(f"* Execution mode: {self.execution_mode}")
+        write("")
         if self.execution_plan and self.execution_plan.phases:
-            lines.append("## Execution Plan")
+            write("## Execution Plan")
             for phase in self.execution_plan.phases:
-                lines.append(f"- **{phase.name}**: {phase.goal}")
-                lines.append("  - Agents: " + ", ".join(phase.agents))
-            lines.append("")
+                write(f"- **{phase.name}**: {phase.goal}")
+                write("  - Agents: " + ", ".join(phase.agents))
+            write("")
         metrics = self.phase_metrics or {}
         if not metrics and self.execution_plan and self.execution_plan.phases:
-            metrics = {}
-            for phase in self.execution_plan.phases:
-                agents = {agent for agent in phase.agents}
-                total = 0
-                completed = 0
-                for report in self.agent_reports:
-                    if report.agent_type in agents:
-                        total += len(report.task_reports)
-                        completed += sum(
-                            1 for task in report.task_reports if task.status == "completed"
-                        )
-                metrics[phase.name] = {"completed": completed, "total": total}
-        lines.append("## Phase Metrics")
+            metrics = _phase_metrics(self.execution_plan, self.agent_reports)
+        write("## Phase Metrics")
         if metrics:
             for name, data in metrics.items():
                 completed = data.get("completed") or data.get("completed_tasks") or 0
                 total = data.get("total") or data.get("total_tasks") or 0
                 percent = int(round((completed / total) * 100)) if total else 0
-                lines.append(f"- **{name}**: {completed}/{total} completed ({percent}%)")
+                write(f"- **{name}**: {completed}/{total} completed ({percent}%)")
         else:
-            lines.append("- No phase metrics available.")
-        lines.append("")
-        lines.append("## Memory Usage")
+            write("- No phase metrics available.")
+        write("")
+        write("## Memory Usage")
         memory_usage = self.memory_usage or {}
         if memory_usage:
             for key, value in memory_usage.items():
-                lines.append(f"- {key}: {value}")
+                write(f"- {key}: {value}")
         else:
-            lines.append("- Memory usage data unavailable.")
-        lines.append("")
-        lines.append("## Governance Verdicts")
+            write("- Memory usage data unavailable.")
+        write("")
+        write("## Governance Verdicts")
         decisions = self.governance_verdicts or []
         if decisions:
-            for decision in decisions:
-                action = decision.get("action", "unknown") if isinstance(decision, dict) else "unknown"
-                verdict = decision.get("verdict", "UNKNOWN") if isinstance(decision, dict) else str(decision)
-                rationale = ""
-                details = ""
-                if isinstance(decision, dict):
-                    rationale = decision.get("rationale") or ""
-                    extra = decision.get("details")
-                    if isinstance(extra, dict) and extra:
-                        details = ", ".join(f"{k}={v}" for k, v in extra.items())
-                rationale_text = f" ({rationale})" if rationale else ""
-                details_text = f" – details: {details}" if details else ""
-                lines.append(f"- **{action}** → {verdict}{rationale_text}{details_text}")
+            for row in map(_governance_row, decisions):
+                write(_GOV_TMPL.format_map(row))
         else:
-            lines.append("- No governance decisions recorded.")
-        lines.append("")
-        lines.append("## Agent Runs")
-        lines.append("")
+            write("- No governance decisions recorded.")
+        write("")
+        write("## Agent Runs")
+        write("")
         for report in self.agent_reports:
-            lines.append(report.to_markdown())
-            lines.append("")
-        lines.append("## Communication Log")
+            write(report.to_markdown())
+            write("")
+        write("## Communication Log")
         if not self.communication_log:
-            lines.append("- No messages recorded.")
+            write("- No messages recorded.")
         else:
             for message in self.communication_log:
                 recipients = ", ".join(message.recipients)
-                lines.append(
-                    f"- `{message.sender}` → `{recipients}`: {message.subject}"
-                )
-        return "\n".join(lines).strip()
+                write(f"- `{message.sender}` → `{recipients}`: {message.subject}")
 
 
 class Orchestrator:
@@ -150,13 +232,17 @@ class Orchestrator:
         execution_mode: str = "sequential",
         max_workers: int | None = None,
         execution_plan: ExecutionPlan | None = None,
+        result_cache: MutableMapping[str, AgentRunReport] | None = None,
+        preload: bool = True,
+        scheduling_policy: str = "bfs",
     ):
         available_agents = list_agent_types()
         if agent_types:
+            known = frozenset(available_agents)
             normalised: List[str] = []
             for agent in agent_types:
                 key = agent.lower()
-                if key not in available_agents:
+                if key not in known:
                     notify_warning(
                         f"Unknown agent '{agent}'. It will be ignored during orchestration."
                     )
@@ -168,43 +254,104 @@ class Orchestrator:
         self.communication_hub = communication_hub or CommunicationHub()
         self.execution_mode = execution_mode
         self.max_workers = max_workers
+        if scheduling_policy not in {"bfs", "dfs"}:
+            notify_warning(
+                f"Unknown scheduling policy '{scheduling_policy}'. Falling back to breadth-first scheduling."
+            )
+            scheduling_policy = "bfs"
+        self.scheduling_policy = scheduling_policy
         self._blueprint_cache: dict[str, AgentBlueprint] = {}
+        # Opt-in: a cached report skips the agent's tasks and the messages
+        # they would send, so only share a cache between equivalent runs.
+        self.result_cache = result_cache
+        self._inflight: dict[str, Future] = {}
+        # Cache keys are memoised per blueprint so the canonical serialisation
+        # and hash are paid once per agent type, not on every run.
+        self._cache_keys: dict[str, Tuple[AgentBlueprint, str]] = {}
+        self._inflight_lock = threading.Lock()
+        self._pool: WorkStealingPool | None = None
         base_plan = execution_plan or build_default_plan()
         self.execution_plan = base_plan.filtered(self.agent_types)
         self.agent_types = list(self.execution_plan.iter_agents())
+        # Resolved once; ``agent_types`` and ``execution_plan`` are treated as
+        # fixed after construction.
+        self._run_plan = self._resolve_plan()
+        # A plan of single-agent phases that each wait for everything before
+        # them is a chain: its critical path is the whole plan, so parallel
+        # mode runs it inline without the dependency scheduler or the pool.
+        self._plan_is_chain = all(
+            len(phase.agents) <= 1 and phase.after is None for phase in self._run_plan.phases
+        )
+        if preload:
+            # Build every blueprint up front so worker threads only ever read
+            # the cache and blueprint construction stays off the run path.
+            for agent_type in self.agent_types:
+                self._get_blueprint(agent_type)
+
+    def __enter__(self) -> "Orchestrator":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Shut down the worker pool used for parallel execution."""
+
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _executor(self) -> WorkStealingPool:
+        # One pool per orchestrator, reused by every parallel run.
+        if self._pool is None:
+            self._pool = WorkStealingPool(self.max_workers or max(len(self.agent_types), 1))
+        return self._pool
 
     def _get_blueprint(self, agent_type: str) -> AgentBlueprint:
         blueprint = self._blueprint_cache.get(agent_type)
         if blueprint is None:
-            blueprint = create_blueprint(agent_type)
+            blueprint = _shared_blueprint(agent_type)
             self._blueprint_cache[agent_type] = blueprint
         return blueprint
 
     def _announce_phase_start(self, phase: ExecutionPhase) -> None:
         if not phase.agents:
             return
-        self.communication_hub.broadcast(
+        messages = [self._phase_message(phase)]
+        messages.extend(self._agent_message(agent_type, phase) for agent_type in phase.agents)
+        self.communication_hub.publish_many(messages)
+
+    def _phase_message(self, phase: ExecutionPhase) -> AgentMessage:
+        return AgentMessage(
             sender="orchestrator",
+            recipients=("all",),
             subject=f"phase-start::{phase.name}",
             body=phase.goal,
             metadata={"agents": list(phase.agents)},
         )
-        for agent_type in phase.agents:
-            blueprint = self._get_blueprint(agent_type)
-            dependencies = self.execution_plan.dependencies_for(agent_type)
-            self.communication_hub.send(
-                sender="orchestrator",
-                subject=f"agent-start::{agent_type}",
-                body=(
-                    f"Agent {agent_type} requested to begin execution during phase {phase.name}."
-                ),
-                recipients=(agent_type,),
-                metadata={
-                    "tasks": len(blueprint.tasks),
-                    "phase": phase.name,
-                    "depends_on": list(dependencies),
-                },
-            )
+
+    def _agent_message(self, agent_type: str, phase: ExecutionPhase) -> AgentMessage:
+        # Every message gets its own plain metadata dict so consumers may
+        # mutate it or pass it straight to ``json.dumps``.
+        metadata = {
+            "tasks": len(self._get_blueprint(agent_type).tasks),
+            "phase": phase.name,
+            "depends_on": list(self.execution_plan.dependencies_for(agent_type)),
+        }
+        return AgentMessage(
+            sender="orchestrator",
+            recipients=(agent_type,),
+            subject=f"agent-start::{agent_type}",
+            body=(
+                f"Agent {agent_type} requested to begin execution during phase {phase.name}."
+            ),
+            metadata=metadata,
+        )
 
     def _run_agent(self, agent_type: str) -> AgentRunReport | None:
         agent_cls = get_agent_class(agent_type)
@@ -217,22 +364,78 @@ class Orchestrator:
                 f"Blueprint for agent '{agent_type}' defines no tasks. Skipping execution."
             )
             return None
-        agent = agent_cls(blueprint, communication_hub=self.communication_hub)
-        log_info(f"Executing agent '{agent_type}' with {len(blueprint.tasks)} tasks.")
-        try:
-            report = agent.execute()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            log_error(f"Agent '{agent_type}' failed: {exc}")
-            raise
+        if self.result_cache is None:
+            report, cached = self._execute_agent(agent_cls, blueprint), False
+        else:
+            report, cached = self._cached_execution(agent_cls, blueprint)
+        metadata: Dict[str, Any] = {"tasks": len(report.task_reports), "success": report.success}
+        if cached:
+            metadata["cached"] = True
         self.communication_hub.send(
             sender="orchestrator",
             subject=f"agent-run::{agent_type}",
             body=f"Agent {agent_type} completed execution.",
             recipients=(agent_type,),
-            metadata={"tasks": len(report.task_reports), "success": report.success},
+            metadata=metadata,
         )
         return report
 
+    def _execute_agent(self, agent_cls: type, blueprint: AgentBlueprint) -> AgentRunReport:
+        agent_type = blueprint.agent_type
+        agent = agent_cls(blueprint, communication_hub=self.communication_hub)
+        log_info(f"Executing agent '{agent_type}' with {len(blueprint.tasks)} tasks.")
+        try:
+            return agent.execute()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            log_error(f"Agent '{agent_type}' failed: {exc}")
+            raise
+
+    def _cached_execution(
+        self, agent_cls: type, blueprint: AgentBlueprint
+    ) -> Tuple[AgentRunReport, bool]:
+        """Return ``(report, cached)`` reusing reports for identical blueprints.
+
+        Concurrent requests for the same blueprint wait for the first one
+        instead of executing the agent twice. Reused reports are shallow
+        copies, so callers may modify their lists.
+        """
+
+        assert self.result_cache is not None
+        key = self._cache_key(blueprint)
+        report = self.result_cache.get(key)
+        if report is not None:
+            return _copy_report(report), True
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return _copy_report(future.result()), True
+        try:
+            report = self._execute_agent(agent_cls, blueprint)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            self.result_cache[key] = _copy_report(report)
+            future.set_result(report)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return report, False
+
+    def _cache_key(self, blueprint: AgentBlueprint) -> str:
+        agent_type = blueprint.agent_type
+        memo = self._cache_keys.get(agent_type)
+        if memo is not None and memo[0] is blueprint:
+            return memo[1]
+        key = hashlib.blake2b(
+            dumps_sorted(blueprint.to_dict()).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        self._cache_keys[agent_type] = (blueprint, key)
+        return key
+
     def _sequential_execution(self, agent_sequence: Iterable[str]) -> List[AgentRunReport]:
         reports: List[AgentRunReport] = []
         for agent_type in agent_sequence:
@@ -241,22 +444,226 @@ class Orchestrator:
                 reports.append(report)
         return reports
 
-    def _parallel_execution(self, agent_sequence: Iterable[str]) -> List[AgentRunReport]:
-        reports: List[AgentRunReport] = []
-        agent_list = list(agent_sequence)
+    def _release_ready(
+        self,
+        pending: List[str],
+        done: set[str],
+        requirements: Dict[str, FrozenSet[str]],
+        phase_of: Dict[str, ExecutionPhase],
+        announced: set[str],
+    ) -> Tuple[List[str], List[str]]:
+        """Split ``pending`` into ``(ready, waiting)`` and announce the ready agents."""
+
+        ready: List[str] = []
+        waiting: List[str] = []
+        for agent in pending:
+            (ready if requirements[agent] <= done else waiting).append(agent)
+        messages: List[AgentMessage] = []
+        for agent in ready:
+            phase = phase_of[agent]
+            if phase.name not in announced:
+                announced.add(phase.name)
+                messages.append(self._phase_message(phase))
+            messages.append(self._agent_message(agent, phase))
+        if messages:
+            self.communication_hub.publish_many(messages)
+        return ready, waiting
+
+    def _parallel_execution(self, plan: ExecutionPlan) -> List[AgentRunReport]:
+        """Run ``plan`` as a dependency graph instead of phase by phase.
+
+        An agent is dispatched as soon as every agent returned by
+        :meth:`ExecutionPlan.prerequisites_for` has finished, so the run takes
+        as long as the critical path rather than the sum of all phases.
+        """
+
+        agent_list, phase_of, requirements = _dag_layout(plan)
         if not agent_list:
-            return reports
-        workers = self.max_workers or len(agent_list)
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(self._run_agent, agent): agent for agent in agent_list}
-            for future in as_completed(futures):
-                report = future.result()
-                if report is not None:
-                    reports.append(report)
-        reports.sort(key=lambda item: agent_list.index(item.agent_type))
-        return reports
+            return []
+        if self.scheduling_policy == "dfs":
+            return self._depth_first_execution(agent_list, phase_of, requirements)
+
+        done: set[str] = set()
+        announced: set[str] = set()
+        finished: List[Tuple[str, Future]] = []
+        condition = threading.Condition()
+        results: Dict[str, AgentRunReport] = {}
+
+        def _completed(agent: str, future: Future) -> None:
+            with condition:
+                finished.append((agent, future))
+                condition.notify()
+
+        pending = agent_list
+        running = 0
+        submitted: List[Future] = []
+        executor = self._executor()
+        try:
+            while pending or running:
+                ready, pending = self._release_ready(pending, done, requirements, phase_of, announced)
+                for agent in ready:
+                    future = executor.submit(self._run_agent, agent)
+                    future.add_done_callback(partial(_completed, agent))
+                    submitted.append(future)
+                    running += 1
+                with condition:
+                    while not finished:
+                        condition.wait()
+                    batch = finished[:]
+                    finished.clear()
+                for agent, future in batch:
+                    running -= 1
+                    done.add(agent)
+                    report = future.result()
+                    if report is not None:
+                        results[agent] = report
+        except BaseException:
+            # The pool outlives this run, so let in-flight agents settle
+            # before the failure propagates.
+            wait(submitted)
+            raise
+        return [results[agent] for agent in agent_list if agent in results]
+
+    def _depth_first_execution(
+        self,
+        agent_list: List[str],
+        phase_of: Dict[str, ExecutionPhase],
+        requirements: Dict[str, FrozenSet[str]],
+    ) -> List[AgentRunReport]:
+        """Dependency-graph run that keeps successors on their parent's worker.
+
+        Completion callbacks run on the worker that finished the agent, so
+        newly ready agents are pushed onto that worker's own deque and it
+        continues depth-first; idle workers still steal breadth-first.
+        """
+
+        executor = self._executor()
+        condition = threading.Condition(threading.RLock())
+        done: set[str] = set()
+        announced: set[str] = set()
+        results: Dict[str, AgentRunReport] = {}
+        errors: List[BaseException] = []
+        state = {"pending": agent_list, "running": 0}
+
+        def _dispatch(submit: Callable[..., Future]) -> None:
+            ready, state["pending"] = self._release_ready(
+                state["pending"], done, requirements, phase_of, announced
+            )
+            for agent in ready:
+                state["running"] += 1
+                submit(self._run_agent, agent).add_done_callback(partial(_completed, agent))
+
+        def _completed(agent: str, future: Future) -> None:
+            with condition:
+                state["running"] -= 1
+                done.add(agent)
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                else:
+                    report = future.result()
+                    if report is not None:
+                        results[agent] = report
+                if not errors:
+                    _dispatch(executor.submit_local)
+                condition.notify_all()
+
+        with condition:
+            _dispatch(executor.submit)
+            while state["running"]:
+                condition.wait()
+        if errors:
+            raise errors[0]
+        return [results[agent] for agent in agent_list if agent in results]
 
     def execute(self) -> OrchestrationReport:
+        mode, plan = self._start_run()
+        reports: List[AgentRunReport] = []
+        if mode == "parallel" and not self._plan_is_chain:
+            reports.extend(self._parallel_execution(plan))
+        else:
+            for phase in plan.phases:
+                if not phase.agents:
+                    continue
+                self._announce_phase_start(phase)
+                reports.extend(self._sequential_execution(phase.agents))
+        return self._finish_run(mode, plan, reports)
+
+    async def aexecute(self) -> OrchestrationReport:
+        """Asynchronous counterpart of :meth:`execute`.
+
+        Agents are still synchronous, so each one runs through
+        :func:`asyncio.to_thread`; the dependency scheduling happens on the
+        event loop with at most ``max_workers`` agents in flight.
+        """
+
+        mode, plan = self._start_run()
+        reports: List[AgentRunReport] = []
+        if mode == "parallel" and not self._plan_is_chain:
+            reports.extend(await self._aparallel_execution(plan))
+        else:
+            for phase in plan.phases:
+                if not phase.agents:
+                    continue
+                self._announce_phase_start(phase)
+                for agent_type in phase.agents:
+                    report = await self._arun_agent(agent_type)
+                    if report is not None:
+                        reports.append(report)
+        return self._finish_run(mode, plan, reports)
+
+    async def _arun_agent(self, agent_type: str) -> AgentRunReport | None:
+        return await asyncio.to_thread(self._run_agent, agent_type)
+
+    async def _aparallel_execution(self, plan: ExecutionPlan) -> List[AgentRunReport]:
+        agent_list, phase_of, requirements = _dag_layout(plan)
+        if not agent_list:
+            return []
+        semaphore = asyncio.Semaphore(self.max_workers or len(agent_list))
+
+        async def _run(agent: str) -> Tuple[str, AgentRunReport | None]:
+            async with semaphore:
+                return agent, await self._arun_agent(agent)
+
+        done: set[str] = set()
+        announced: set[str] = set()
+        results: Dict[str, AgentRunReport] = {}
+        pending = agent_list
+        running: set[asyncio.Task] = set()
+        try:
+            while pending or running:
+                ready, pending = self._release_ready(pending, done, requirements, phase_of, announced)
+                running.update(asyncio.create_task(_run(agent)) for agent in ready)
+                finished, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    agent, report = task.result()
+                    done.add(agent)
+                    if report is not None:
+                        results[agent] = report
+        except BaseException:
+            if running:
+                await asyncio.wait(running)
+            raise
+        return [results[agent] for agent in agent_list if agent in results]
+
+    def _resolve_plan(self) -> ExecutionPlan:
+        """Return the plan to run, wrapping unplanned agents in an ad-hoc phase."""
+
+        if self.execution_plan.phases or not self.agent_types:
+            return self.execution_plan
+        return ExecutionPlan(
+            (
+                ExecutionPhase(
+                    name="ad-hoc",
+                    goal="Default execution phase for unplanned agents.",
+                    agents=tuple(self.agent_types),
+                ),
+            )
+        )
+
+    def _start_run(self) -> Tuple[str, ExecutionPlan]:
+        """Announce the run and return the effective mode and plan."""
+
         mode = self.execution_mode.lower()
         if mode not in {"sequential", "parallel"}:
             notify_warning(
@@ -278,75 +685,50 @@ class Orchestrator:
                 else None,
             },
         )
-        reports: List[AgentRunReport] = []
-        phases = self.execution_plan.phases if self.execution_plan else ()
-        plan_for_report: ExecutionPlan | None = self.execution_plan
-        if not phases and self.agent_types:
-            phases = (
-                ExecutionPhase(
-                    name="ad-hoc",
-                    goal="Default execution phase for unplanned agents.",
-                    agents=tuple(self.agent_types),
-                ),
-            )
-            plan_for_report = ExecutionPlan(phases)
+        return mode, self._run_plan
 
-        for phase in phases:
-            if not phase.agents:
-                continue
-            self._announce_phase_start(phase)
-            if mode == "parallel":
-                reports.extend(self._parallel_execution(phase.agents))
-            else:
-                reports.extend(self._sequential_execution(phase.agents))
+    def _finish_run(
+        self, mode: str, plan_for_report: ExecutionPlan, reports: List[AgentRunReport]
+    ) -> OrchestrationReport:
+        """Collect metrics and governance verdicts into the final report."""
 
         phase_metrics: Dict[str, Dict[str, int]] = {}
-        if plan_for_report and plan_for_report.phases:
-            for phase in plan_for_report.phases:
-                agents = {agent for agent in phase.agents}
-                total_tasks = 0
-                completed_tasks = 0
-                for agent_report in reports:
-                    if agent_report.agent_type in agents:
-                        total_tasks += len(agent_report.task_reports)
-                        completed_tasks += sum(
-                            1
-                            for task_report in agent_report.task_reports
-                            if task_report.status == "completed"
-                        )
-                phase_metrics[phase.name] = {
-                    "completed": completed_tasks,
-                    "total": total_tasks,
-                }
+        if plan_for_report.phases:
+            phase_metrics = _phase_metrics(plan_for_report, reports)
         memory_stats: Dict[str, Any] = {}
-        if resource is not None:
-            usage = resource.getrusage(resource.RUSAGE_SELF)
-            peak_rss = getattr(usage, "ru_maxrss", 0)
-            if peak_rss:
-                if sys.platform == "darwin":
-                    rss_mb = round(peak_rss / (1024 * 1024), 2)
-                else:
-                    rss_mb = round(peak_rss / 1024, 2)
-                memory_stats["peak_rss_mb"] = rss_mb
+        peak_rss = getattr(resource.getrusage(resource.RUSAGE_SELF), "ru_maxrss", 0) if resource is not None else 0
+        if peak_rss:
+            memory_stats["peak_rss_mb"] = round(peak_rss / _RSS_DIVISOR, 2)
         if reports:
             memory_stats.setdefault("agent_reports", len(reports))
         governance_records: List[Dict[str, Any]] = []
-        for message in self.communication_hub.messages:
+        governance_messages = getattr(self.communication_hub, "governance_messages", None)
+        if governance_messages is not None:
+            candidates: Iterable[AgentMessage] = governance_messages()
+        else:
+            candidates = (
+                message
+                for message in self.communication_hub.messages
+                if message.subject.startswith("governance")
+            )
+        # Records are normalised here, once, to plain dicts carrying all four
+        # keys with string rationales and dict details.
+        for message in candidates:
             metadata = message.metadata or {}
-            if not isinstance(metadata, dict):
+            if not isinstance(metadata, Mapping):
                 continue
-            if message.subject.startswith("governance"):
-                governance_records.append(
-                    {
-                        "action": metadata.get("action", message.subject),
-                        "verdict": metadata.get("verdict", metadata.get("decision", "UNKNOWN")),
-                        "rationale": metadata.get("rationale", ""),
-                        "details": metadata.get("details", {}),
-                    }
-                )
+            details = metadata.get("details")
+            governance_records.append(
+                {
+                    "action": metadata.get("action", message.subject),
+                    "verdict": metadata.get("verdict", metadata.get("decision", "UNKNOWN")),
+                    "rationale": metadata.get("rationale") or "",
+                    "details": dict(details) if isinstance(details, Mapping) else {},
+                }
+            )
         orchestration_report = OrchestrationReport(
             agent_reports=reports,
-            communication_log=list(self.communication_hub.messages),
+            communication_log=self.communication_hub.messages,
             execution_mode=mode,
             execution_plan=plan_for_report,
             phase_metrics=phase_metrics or None,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from itertools import islice
 from typing import Sequence
 
-from .tasks import AgentTask, group_tasks_by_agent, is_task_complete
+from ._markdown import MarkdownWriter
+from .tasks import AgentTask
 
 
 def _percentage(completed: int, total: int) -> int:
@@ -16,29 +19,28 @@ def _percentage(completed: int, total: int) -> int:
 
 
 def _render_pending_tasks(
-    tasks: Sequence[AgentTask], pending_limit: int | None
-) -> list[str]:
-    """Render a bullet list of pending tasks constrained by ``pending_limit``."""
+    out: MarkdownWriter, pending: Sequence[AgentTask], pending_limit: int | None
+) -> None:
+    """Render a bullet list of ``pending`` tasks constrained by ``pending_limit``."""
 
-    pending = [task for task in tasks if not is_task_complete(task.status)]
     if not pending:
-        return ["Alle Aufgaben abgeschlossen. ✅"]
+        out.line("Alle Aufgaben abgeschlossen. ✅")
+        return
 
-    lines = ["### Nächste Schritte"]
-    if pending_limit is None or pending_limit <= 0:
-        selected = list(pending)
-    else:
-        selected = list(pending[:pending_limit])
+    out.line("### Nächste Schritte")
+    remaining = len(pending)
+    limit = None if pending_limit is None or pending_limit <= 0 else pending_limit
+    for task in islice(pending, limit):
+        out.line(f"- [ ] {task.description} (Status: {task.status})")
+        remaining -= 1
 
-    for task in selected:
-        lines.append(f"- [ ] {task.description} (Status: {task.status})")
-
-    remaining = len(pending) - len(selected)
     if remaining > 0:
         plural = "n" if remaining != 1 else ""
-        lines.append(f"- … {remaining} weitere Aufgabe{plural} offen.")
+        out.line(f"- … {remaining} weitere Aufgabe{plural} offen.")
+
 
-    return lines
+def _description_key(task: AgentTask) -> str:
+    return task.description.lower()
 
 
 def build_progress_report(
@@ -49,40 +51,52 @@ def build_progress_report(
     if not tasks:
         return "# Nova Fortschrittsbericht\n\nKeine Aufgaben gefunden."
 
+    # One pass groups the tasks and tallies completion globally and per agent.
+    grouped: defaultdict[str, list[AgentTask]] = defaultdict(list)
+    pending_by_agent: defaultdict[str, list[AgentTask]] = defaultdict(list)
+    completed_by_agent: defaultdict[str, int] = defaultdict(int)
+    for task in tasks:
+        display_name = task.agent_display_name
+        grouped[display_name].append(task)
+        if task.is_complete:
+            completed_by_agent[display_name] += 1
+        else:
+            pending_by_agent[display_name].append(task)
+
     total = len(tasks)
-    completed = sum(1 for task in tasks if is_task_complete(task.status))
+    completed = sum(completed_by_agent.values())
     percentage = _percentage(completed, total)
 
-    lines: list[str] = [
-        "# Nova Fortschrittsbericht",
-        "",
-        f"- Gesamtaufgaben: {total}",
-        f"- Abgeschlossen: {completed}",
-        f"- Fortschritt: {percentage}%",
-        "",
-    ]
-
-    grouped = group_tasks_by_agent(tasks)
-    for display_name, agent_tasks in grouped.items():
-        lines.append(f"## {display_name}")
-        role = agent_tasks[0].agent_role
+    out = MarkdownWriter()
+    out.line("# Nova Fortschrittsbericht")
+    out.line()
+    out.line(f"- Gesamtaufgaben: {total}")
+    out.line(f"- Abgeschlossen: {completed}")
+    out.line(f"- Fortschritt: {percentage}%")
+    out.line()
+
+    # Same ordering as ``group_tasks_by_agent``: agents alphabetically, tasks
+    # by description within each agent.
+    for display_name in sorted(grouped, key=str.lower):
+        agent_tasks = grouped[display_name]
+        out.line(f"## {display_name}")
+        role = min(agent_tasks, key=_description_key).agent_role
         if role:
-            lines.append(f"*Rolle:* {role}")
+            out.line(f"*Rolle:* {role}")
 
         agent_total = len(agent_tasks)
-        agent_completed = sum(
-            1 for task in agent_tasks if is_task_complete(task.status)
-        )
+        agent_completed = completed_by_agent[display_name]
         agent_percentage = _percentage(agent_completed, agent_total)
 
-        lines.append(f"- Aufgaben: {agent_total}")
-        lines.append(f"- Abgeschlossen: {agent_completed}")
-        lines.append(f"- Fortschritt: {agent_percentage}%")
-        lines.append("")
-        lines.extend(_render_pending_tasks(agent_tasks, pending_limit))
-        lines.append("")
+        out.line(f"- Aufgaben: {agent_total}")
+        out.line(f"- Abgeschlossen: {agent_completed}")
+        out.line(f"- Fortschritt: {agent_percentage}%")
+        out.line()
+        pending = sorted(pending_by_agent[display_name], key=_description_key)
+        _render_pending_tasks(out, pending, pending_limit)
+        out.line()
 
-    return "\n".join(lines).rstrip()
+    return out.getvalue().rstrip()
 
 
 __all__ = ["build_progress_report"]
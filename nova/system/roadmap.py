@@ -2,83 +2,117 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import chain
 from typing import Iterable, Sequence
 
+from ._markdown import MarkdownWriter
 from .mission import ExecutionPhase, ExecutionPlan, build_default_plan
 from .tasks import (
     AgentTask,
     group_tasks_by_agent,
-    is_task_complete,
     normalise_agent_identifier,
 )
 
 
-def _tasks_for_agents(
-    tasks: Sequence[AgentTask], agents: Iterable[str]
-) -> list[AgentTask]:
-    """Return tasks assigned to the provided ``agents``."""
+@lru_cache(maxsize=256)
+def _agent_key_set(agents: tuple[str, ...]) -> frozenset[str]:
+    """Return the normalised identifiers for a phase's ``agents`` tuple."""
 
-    agent_keys = {normalise_agent_identifier(agent) for agent in agents}
-    if not agent_keys:
-        return []
-    return [task for task in tasks if task.agent_identifier in agent_keys]
+    return frozenset(normalise_agent_identifier(agent) for agent in agents)
 
 
-def _render_pending_steps(pending: Sequence[AgentTask]) -> list[str]:
+def _bucket_tasks(
+    tasks: Sequence[AgentTask],
+) -> tuple[dict[str, list[AgentTask]], dict[str, int]]:
+    """Group ``tasks`` by agent identifier and count completed tasks per agent."""
+
+    by_agent: dict[str, list[AgentTask]] = {}
+    completed_by_agent: dict[str, int] = {}
+    for task in tasks:
+        agent_id = task.agent_identifier
+        bucket = by_agent.get(agent_id)
+        if bucket is None:
+            bucket = by_agent[agent_id] = []
+            completed_by_agent[agent_id] = 0
+        bucket.append(task)
+        if task.is_complete:
+            completed_by_agent[agent_id] += 1
+    return by_agent, completed_by_agent
+
+
+def _render_pending_steps(out: MarkdownWriter, pending: Sequence[AgentTask]) -> None:
     if not pending:
-        return []
+        return
 
-    lines: list[str] = ["### Schritt-für-Schritt"]
+    out.line("### Schritt-für-Schritt")
     grouped = group_tasks_by_agent(pending)
     step = 1
     for display_name, agent_tasks in grouped.items():
-        lines.append(f"#### {display_name}")
+        out.line(f"#### {display_name}")
         role = agent_tasks[0].agent_role
         if role:
-            lines.append(f"*Rolle:* {role}")
+            out.line(f"*Rolle:* {role}")
         for task in agent_tasks:
-            lines.append(f"{step}. [ ] {task.description} (Status: {task.status})")
+            out.line(f"{step}. [ ] {task.description} (Status: {task.status})")
             step += 1
-        lines.append("")
-    return lines
+        out.line()
 
 
-def _render_phase_section(phase: ExecutionPhase, tasks: Sequence[AgentTask]) -> list[str]:
-    section: list[str] = [
-        f"## {phase.name.title()}",
-        phase.goal,
-    ]
+def _render_phase_section(
+    out: MarkdownWriter,
+    phase: ExecutionPhase,
+    by_agent: dict[str, list[AgentTask]],
+    completed_by_agent: dict[str, int],
+) -> None:
+    out.line(f"## {phase.name.title()}")
+    out.line(phase.goal)
     if phase.agents:
-        section.append("*Agenten:* " + ", ".join(phase.agents))
+        out.line("*Agenten:* " + ", ".join(phase.agents))
 
-    phase_tasks = _tasks_for_agents(tasks, phase.agents)
+    agent_keys = sorted(_agent_key_set(phase.agents))
+    phase_tasks = list(chain.from_iterable(by_agent.get(key, ()) for key in agent_keys))
     total = len(phase_tasks)
-    completed = sum(1 for task in phase_tasks if is_task_complete(task.status))
+    completed = sum(completed_by_agent.get(key, 0) for key in agent_keys)
     percent = int(round((completed / total) * 100)) if total else 0
-    section.append(f"*Fortschritt:* {completed}/{total} ({percent}%)")
+    out.line(f"*Fortschritt:* {completed}/{total} ({percent}%)")
 
     if not total:
-        section.append("*Hinweis:* Für diese Phase sind noch keine Aufgaben im CSV hinterlegt.")
-        section.append("")
-        return section
+        out.line("*Hinweis:* Für diese Phase sind noch keine Aufgaben im CSV hinterlegt.")
+        out.line()
+        return
 
-    pending = [task for task in phase_tasks if not is_task_complete(task.status)]
+    pending = [task for task in phase_tasks if not task.is_complete]
     if not pending:
-        section.append("Alle Schritte abgeschlossen. ✅")
-        section.append("")
-        return section
+        out.line("Alle Schritte abgeschlossen. ✅")
+        out.line()
+        return
 
-    section.append("")
-    section.extend(_render_pending_steps(pending))
-    return section
+    out.line()
+    _render_pending_steps(out, pending)
 
 
+@lru_cache(maxsize=256)
 def _normalise_phase_name(name: str) -> str:
     """Return a case-insensitive key for matching phase names."""
 
     return name.strip().lower().replace(" ", "-")
 
 
+def _select_phases(
+    plan: ExecutionPlan, normalised_filters: frozenset[str] | None
+) -> tuple[ExecutionPhase, ...]:
+    """Return the phases of ``plan`` whose names match ``normalised_filters``."""
+
+    if normalised_filters is None:
+        return plan.phases
+    return tuple(
+        phase
+        for phase in plan.phases
+        if _normalise_phase_name(phase.name) in normalised_filters
+    )
+
+
 def build_phase_roadmap(
     tasks: Sequence[AgentTask],
     plan: ExecutionPlan | None = None,
@@ -90,49 +124,42 @@ def build_phase_roadmap(
     effective_plan = plan or build_default_plan()
 
     filter_names = [name.strip() for name in phase_filters or [] if name and name.strip()]
-    normalised_filters = {
+    normalised_filters = frozenset(
         _normalise_phase_name(name) for name in filter_names
-    } or None
+    ) or None
 
-    if normalised_filters is None:
-        selected_phases = effective_plan.phases
-    else:
-        selected_phases = tuple(
-            phase
-            for phase in effective_plan.phases
-            if _normalise_phase_name(phase.name) in normalised_filters
-        )
+    selected_phases = _select_phases(effective_plan, normalised_filters)
 
+    by_agent, completed_by_agent = _bucket_tasks(tasks)
     total_tasks = len(tasks)
-    completed_tasks = sum(1 for task in tasks if is_task_complete(task.status))
+    completed_tasks = sum(completed_by_agent.values())
 
-    lines: list[str] = [
-        "# Nova Phasen-Roadmap",
-        "",
-        f"- Gesamtaufgaben: {total_tasks}",
-        f"- Abgeschlossen: {completed_tasks}",
-        f"- Offen: {total_tasks - completed_tasks}",
-        "",
-    ]
+    out = MarkdownWriter()
+    out.line("# Nova Phasen-Roadmap")
+    out.line()
+    out.line(f"- Gesamtaufgaben: {total_tasks}")
+    out.line(f"- Abgeschlossen: {completed_tasks}")
+    out.line(f"- Offen: {total_tasks - completed_tasks}")
+    out.line()
 
     if filter_names:
-        lines.append("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
-        lines.append("")
+        out.line("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
+        out.line()
 
     if not effective_plan.phases:
-        lines.append("Keine Phasen definiert.")
-        return "\n".join(lines).strip()
+        out.line("Keine Phasen definiert.")
+        return out.getvalue().strip()
 
     if normalised_filters is not None and not selected_phases:
-        lines.append(
+        out.line(
             "*Hinweis:* Keine der angeforderten Phasen wurden im Ausführungsplan gefunden."
         )
-        return "\n".join(lines).strip()
+        return out.getvalue().strip()
 
     for phase in selected_phases:
-        lines.extend(_render_phase_section(phase, tasks))
+        _render_phase_section(out, phase, by_agent, completed_by_agent)
 
-    return "\n".join(lines).rstrip()
+    return out.getvalue().rstrip()
 
 
 def _pending_tasks_by_agent(tasks: Sequence[AgentTask]) -> tuple[dict[str, list[AgentTask]], dict[str, tuple[str, str | None]]]:
@@ -140,22 +167,23 @@ def _pending_tasks_by_agent(tasks: Sequence[AgentTask]) -> tuple[dict[str, list[
     metadata: dict[str, tuple[str, str | None]] = {}
     for task in tasks:
         metadata.setdefault(task.agent_identifier, (task.agent_display_name, task.agent_role))
-        if is_task_complete(task.status):
+        if task.is_complete:
             continue
         pending.setdefault(task.agent_identifier, []).append(task)
     return pending, metadata
 
 
 def _render_agent_next_steps(
+    out: MarkdownWriter,
     agent_id: str,
     tasks: Sequence[AgentTask],
     metadata: dict[str, tuple[str, str | None]],
     limit: int | None,
-) -> list[str]:
+) -> None:
     display_name, role = metadata.get(agent_id, (agent_id.title(), None))
-    block: list[str] = [f"### {display_name}"]
+    out.line(f"### {display_name}")
     if role:
-        block.append(f"*Rolle:* {role}")
+        out.line(f"*Rolle:* {role}")
 
     if limit is None:
         selected = list(tasks)
@@ -164,15 +192,14 @@ def _render_agent_next_steps(
         selected = list(tasks[:limit])
 
     for task in selected:
-        block.append(f"- {task.description} (Status: {task.status})")
+        out.line(f"- {task.description} (Status: {task.status})")
 
     remaining = len(tasks) - len(selected)
     if remaining > 0:
         plural = "n" if remaining != 1 else ""
-        block.append(f"- … {remaining} weitere Aufgabe{plural} offen.")
+        out.line(f"- … {remaining} weitere Aufgabe{plural} offen.")
 
-    block.append("")
-    return block
+    out.line()
 
 
 def build_next_steps_summary(
@@ -192,55 +219,43 @@ def build_next_steps_summary(
     limit = None if limit_per_agent <= 0 else limit_per_agent
 
     filter_names = [name.strip() for name in (phase_filters or []) if name and name.strip()]
-    normalised_filters = {
+    normalised_filters = frozenset(
         _normalise_phase_name(name) for name in filter_names
-    } or None
+    ) or None
 
     total_pending = sum(len(agent_tasks) for agent_tasks in pending.values())
     limit_label = "alle" if limit is None else str(limit)
 
-    lines: list[str] = [
-        "# Nova Nächste Schritte",
-        "",
-        f"- Offene Aufgaben gesamt: {total_pending}",
-        f"- Angezeigte Schritte pro Agent: {limit_label}",
-        "",
-    ]
+    out = MarkdownWriter()
+    out.line("# Nova Nächste Schritte")
+    out.line()
+    out.line(f"- Offene Aufgaben gesamt: {total_pending}")
+    out.line(f"- Angezeigte Schritte pro Agent: {limit_label}")
+    out.line()
 
     if filter_names:
-        lines.append("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
-        lines.append("")
+        out.line("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
+        out.line()
 
     if not effective_plan.phases:
-        lines.append("Keine Phasen definiert.")
-        return "\n".join(lines).strip()
+        out.line("Keine Phasen definiert.")
+        return out.getvalue().strip()
 
-    if normalised_filters is None:
-        selected_phases = effective_plan.phases
-    else:
-        selected_phases = tuple(
-            phase
-            for phase in effective_plan.phases
-            if _normalise_phase_name(phase.name) in normalised_filters
-        )
+    selected_phases = _select_phases(effective_plan, normalised_filters)
 
     if normalised_filters is not None and not selected_phases:
-        lines.append(
+        out.line(
             "*Hinweis:* Keine der angeforderten Phasen wurden im Ausführungsplan gefunden."
         )
-        return "\n".join(lines).strip()
+        return out.getvalue().strip()
 
     seen_agents: set[str] = set()
-    selected_phase_agent_ids = {
-        normalise_agent_identifier(agent)
-        for phase in selected_phases
-        for agent in phase.agents
-    }
-    all_plan_agents = {
-        normalise_agent_identifier(agent)
-        for phase in effective_plan.phases
-        for agent in phase.agents
-    }
+    selected_phase_agent_ids = frozenset().union(
+        *(_agent_key_set(phase.agents) for phase in selected_phases)
+    )
+    all_plan_agents = frozenset().union(
+        *(_agent_key_set(phase.agents) for phase in effective_plan.phases)
+    )
 
     for phase in selected_phases:
         phase_agents: list[str] = []
@@ -251,14 +266,12 @@ def build_next_steps_summary(
         if not phase_agents:
             continue
 
-        lines.append(f"## {phase.name.title()}")
-        lines.append(phase.goal)
-        lines.append("")
+        out.line(f"## {phase.name.title()}")
+        out.line(phase.goal)
+        out.line()
 
         for agent_id in phase_agents:
-            lines.extend(
-                _render_agent_next_steps(agent_id, pending[agent_id], metadata, limit)
-            )
+            _render_agent_next_steps(out, agent_id, pending[agent_id], metadata, limit)
             seen_agents.add(agent_id)
 
     remaining_agents: list[str] = []
@@ -273,15 +286,13 @@ def build_next_steps_summary(
             continue
         remaining_agents.append(agent_id)
     if remaining_agents:
-        lines.append("## Ad-Hoc")
-        lines.append("Aufgaben ohne Phasenzuordnung im aktuellen Ausführungsplan.")
-        lines.append("")
+        out.line("## Ad-Hoc")
+        out.line("Aufgaben ohne Phasenzuordnung im aktuellen Ausführungsplan.")
+        out.line()
         for agent_id in remaining_agents:
-            lines.extend(
-                _render_agent_next_steps(agent_id, pending[agent_id], metadata, limit)
-            )
+            _render_agent_next_steps(out, agent_id, pending[agent_id], metadata, limit)
 
-    return "\n".join(lines).rstrip()
+    return out.getvalue().rstrip()
 
 
 def build_global_step_plan(
@@ -298,55 +309,40 @@ def build_global_step_plan(
     effective_plan = plan or build_default_plan()
 
     filter_names = [name.strip() for name in phase_filters or [] if name and name.strip()]
-    normalised_filters = {
+    normalised_filters = frozenset(
         _normalise_phase_name(name) for name in filter_names
-    } or None
+    ) or None
 
-    if normalised_filters is None:
-        selected_phases = effective_plan.phases
-    else:
-        selected_phases = tuple(
-            phase
-            for phase in effective_plan.phases
-            if _normalise_phase_name(phase.name) in normalised_filters
-        )
+    selected_phases = _select_phases(effective_plan, normalised_filters)
 
+    tasks_by_agent, completed_by_agent = _bucket_tasks(tasks)
     total_tasks = len(tasks)
-    completed_tasks = sum(1 for task in tasks if is_task_complete(task.status))
+    completed_tasks = sum(completed_by_agent.values())
 
-    lines: list[str] = [
-        "# Nova Schritt-für-Schritt Plan",
-        "",
-        f"- Gesamtaufgaben: {total_tasks}",
-        f"- Abgeschlossen: {completed_tasks}",
-        f"- Offen: {total_tasks - completed_tasks}",
-        "",
-    ]
+    out = MarkdownWriter()
+    out.line("# Nova Schritt-für-Schritt Plan")
+    out.line()
+    out.line(f"- Gesamtaufgaben: {total_tasks}")
+    out.line(f"- Abgeschlossen: {completed_tasks}")
+    out.line(f"- Offen: {total_tasks - completed_tasks}")
+    out.line()
 
     if filter_names:
-        lines.append("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
-        lines.append("")
+        out.line("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
+        out.line()
 
     if not effective_plan.phases:
-        lines.append("Keine Phasen definiert.")
-        return "\n".join(lines).strip()
+        out.line("Keine Phasen definiert.")
+        return out.getvalue().strip()
 
     if normalised_filters is not None and not selected_phases:
-        lines.append("*Hinweis:* Keine der angeforderten Phasen wurden im Ausführungsplan gefunden.")
-        return "\n".join(lines).strip()
+        out.line("*Hinweis:* Keine der angeforderten Phasen wurden im Ausführungsplan gefunden.")
+        return out.getvalue().strip()
 
-    tasks_by_agent: dict[str, list[AgentTask]] = {}
-    metadata: dict[str, tuple[str, str | None]] = {}
-    agent_order: list[str] = []
-    for task in tasks:
-        if task.agent_identifier not in tasks_by_agent:
-            tasks_by_agent[task.agent_identifier] = []
-            agent_order.append(task.agent_identifier)
-        tasks_by_agent[task.agent_identifier].append(task)
-        metadata.setdefault(
-            task.agent_identifier,
-            (task.agent_display_name, task.agent_role),
-        )
+    metadata: dict[str, tuple[str, str | None]] = {
+        agent_id: (agent_tasks[0].agent_display_name, agent_tasks[0].agent_role)
+        for agent_id, agent_tasks in tasks_by_agent.items()
+    }
 
     step = 1
     seen_agents: set[str] = set()
@@ -362,28 +358,28 @@ def build_global_step_plan(
         if not phase_agent_ids:
             continue
 
-        lines.append(f"## {phase.name.title()}")
-        lines.append(phase.goal)
-        lines.append("")
+        out.line(f"## {phase.name.title()}")
+        out.line(phase.goal)
+        out.line()
 
         for agent_id in phase_agent_ids:
             display_name, role = metadata.get(agent_id, (agent_id.title(), None))
-            lines.append(f"### {display_name}")
+            out.line(f"### {display_name}")
             if role:
-                lines.append(f"*Rolle:* {role}")
+                out.line(f"*Rolle:* {role}")
 
             for task in tasks_by_agent[agent_id]:
-                checkbox = "x" if is_task_complete(task.status) else " "
-                lines.append(
+                checkbox = "x" if task.is_complete else " "
+                out.line(
                     f"{step}. [{checkbox}] {task.description} (Status: {task.status})"
                 )
                 step += 1
 
-            lines.append("")
+            out.line()
             seen_agents.add(agent_id)
 
     remaining_agents: list[str] = []
-    for agent_id in agent_order:
+    for agent_id in tasks_by_agent:
         if agent_id in seen_agents:
             continue
         if agent_id in selected_phase_agent_ids:
@@ -394,26 +390,26 @@ def build_global_step_plan(
         remaining_agents.append(agent_id)
 
     if remaining_agents:
-        lines.append("## Ad-Hoc")
-        lines.append("Aufgaben ohne Zuordnung in den ausgewählten Phasen.")
-        lines.append("")
+        out.line("## Ad-Hoc")
+        out.line("Aufgaben ohne Zuordnung in den ausgewählten Phasen.")
+        out.line()
 
         for agent_id in remaining_agents:
             display_name, role = metadata.get(agent_id, (agent_id.title(), None))
-            lines.append(f"### {display_name}")
+            out.line(f"### {display_name}")
             if role:
-                lines.append(f"*Rolle:* {role}")
+                out.line(f"*Rolle:* {role}")
 
             for task in tasks_by_agent[agent_id]:
-                checkbox = "x" if is_task_complete(task.status) else " "
-                lines.append(
+                checkbox = "x" if task.is_complete else " "
+                out.line(
                     f"{step}. [{checkbox}] {task.description} (Status: {task.status})"
                 )
                 step += 1
 
-            lines.append("")
+            out.line()
 
-    return "\n".join(lines).rstrip()
+    return out.getvalue().rstrip()
 
 
 def build_executive_summary(
@@ -430,83 +426,70 @@ def build_executive_summary(
 
     effective_plan = plan or build_default_plan()
 
+    by_agent, completed_by_agent = _bucket_tasks(tasks)
     total = len(tasks)
-    completed = sum(1 for task in tasks if is_task_complete(task.status))
+    completed = sum(completed_by_agent.values())
 
     pending_by_agent, metadata = _pending_tasks_by_agent(tasks)
     limit = None if limit_per_agent <= 0 else limit_per_agent
 
-    lines: list[str] = [
-        "# Nova Roadmap Snapshot",
-        "",
-        f"- Gesamtaufgaben: {total}",
-        f"- Abgeschlossen: {completed}",
-        f"- Offen: {total - completed}",
-        "",
-    ]
+    out = MarkdownWriter()
+    out.line("# Nova Roadmap Snapshot")
+    out.line()
+    out.line(f"- Gesamtaufgaben: {total}")
+    out.line(f"- Abgeschlossen: {completed}")
+    out.line(f"- Offen: {total - completed}")
+    out.line()
 
     if not effective_plan.phases:
-        lines.append("Keine Phasen definiert.")
-        return "\n".join(lines).rstrip()
+        out.line("Keine Phasen definiert.")
+        return out.getvalue().rstrip()
 
     filter_names = [name.strip() for name in phase_filters or [] if name and name.strip()]
-    normalised_filters = {_normalise_phase_name(name) for name in filter_names} or None
+    normalised_filters = frozenset(_normalise_phase_name(name) for name in filter_names) or None
 
     if filter_names:
-        lines.append("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
-        lines.append("")
+        out.line("*Gefiltert nach Phasen:* " + ", ".join(filter_names))
+        out.line()
 
-    if normalised_filters is None:
-        selected_phases = effective_plan.phases
-    else:
-        selected_phases = tuple(
-            phase
-            for phase in effective_plan.phases
-            if _normalise_phase_name(phase.name) in normalised_filters
+    selected_phases = _select_phases(effective_plan, normalised_filters)
+    if normalised_filters is not None and not selected_phases:
+        out.line(
+            "*Hinweis:* Keine der angeforderten Phasen wurden im Ausführungsplan gefunden."
         )
-        if not selected_phases:
-            lines.append(
-                "*Hinweis:* Keine der angeforderten Phasen wurden im Ausführungsplan gefunden."
-            )
-            return "\n".join(lines).rstrip()
+        return out.getvalue().rstrip()
 
     seen_agents: set[str] = set()
-    all_plan_agents = {
-        normalise_agent_identifier(agent)
-        for phase in effective_plan.phases
-        for agent in phase.agents
-    }
-    selected_phase_agents = {
-        normalise_agent_identifier(agent)
-        for phase in selected_phases
-        for agent in phase.agents
-    }
+    all_plan_agents = frozenset().union(
+        *(_agent_key_set(phase.agents) for phase in effective_plan.phases)
+    )
+    selected_phase_agents = frozenset().union(
+        *(_agent_key_set(phase.agents) for phase in selected_phases)
+    )
 
     for phase in selected_phases:
-        lines.append(f"## {phase.name.title()}")
-        lines.append(phase.goal)
+        out.line(f"## {phase.name.title()}")
+        out.line(phase.goal)
 
-        phase_tasks = _tasks_for_agents(tasks, phase.agents)
-        total_phase = len(phase_tasks)
-        completed_phase = sum(
-            1 for task in phase_tasks if is_task_complete(task.status)
-        )
+        agent_keys = _agent_key_set(phase.agents)
+        total_phase = sum(len(by_agent.get(key, ())) for key in agent_keys)
+        completed_phase = sum(completed_by_agent.get(key, 0) for key in agent_keys)
         percent = int(round((completed_phase / total_phase) * 100)) if total_phase else 0
-        lines.append(f"- Fortschritt: {completed_phase}/{total_phase} ({percent}%)")
+        out.line(f"- Fortschritt: {completed_phase}/{total_phase} ({percent}%)")
 
         if not total_phase:
-            lines.append("*Hinweis:* Für diese Phase sind noch keine Aufgaben im CSV hinterlegt.")
-            lines.append("")
+            out.line("*Hinweis:* Für diese Phase sind noch keine Aufgaben im CSV hinterlegt.")
+            out.line()
             continue
 
         pending_agents = [agent for agent in phase.agents if agent in pending_by_agent]
         if not pending_agents:
-            lines.append("Alle Aufgaben dieser Phase abgeschlossen. ✅")
-            lines.append("")
+            out.line("Alle Aufgaben dieser Phase abgeschlossen. ✅")
+            out.line()
             continue
 
-        lines.append("")
-        lines.append("### Offene Schritte")
+        out.line()
+        out.line("### Offene Schritte")
         for agent_id in pending_agents:
             display_name, role = metadata.get(agent_id, (agent_id.title(), None))
             label = (
@@ -514,20 +497,20 @@ def build_executive_summary(
                 if role and role not in display_name
                 else display_name
             )
-            lines.append(f"- {label}")
+            out.line(f"- {label}")
 
             agent_tasks = pending_by_agent[agent_id]
             selected = list(agent_tasks) if limit is None else list(agent_tasks[:limit])
             for task in selected:
-                lines.append(f"  - [ ] {task.description} (Status: {task.status})")
+                out.line(f"  - [ ] {task.description} (Status: {task.status})")
 
             remaining = len(agent_tasks) - len(selected)
             if remaining > 0:
                 plural = "n" if remaining != 1 else ""
-                lines.append(f"  - … {remaining} weitere Aufgabe{plural} offen.")
+                out.line(f"  - … {remaining} weitere Aufgabe{plural} offen.")
 
             seen_agents.add(agent_id)
-        lines.append("")
+        out.line()
 
     remaining_agents = []
     for agent in pending_by_agent:
@@ -537,9 +520,9 @@ def build_executive_summary(
             continue
         remaining_agents.append(agent)
     if remaining_agents:
-        lines.append("## Ad-Hoc")
-        lines.append("Aufgaben ohne Phasenzuordnung im aktuellen Ausführungsplan.")
-        lines.append("")
+        out.line("## Ad-Hoc")
+        out.line("Aufgaben ohne Phasenzuordnung im aktuellen Ausführungsplan.")
+        out.line()
         for agent_id in remaining_agents:
             display_name, role = metadata.get(agent_id, (agent_id.title(), None))
             label = (
@@ -547,20 +530,20 @@ def build_executive_summary(
                 if role and role not in display_name
                 else display_name
             )
-            lines.append(f"- {label}")
+            out.line(f"- {label}")
 
             agent_tasks = pending_by_agent[agent_id]
             selected = list(agent_tasks) if limit is None else list(agent_tasks[:limit])
             for task in selected:
-                lines.append(f"  - [ ] {task.description} (Status: {task.status})")
+                out.line(f"  - [ ] {task.description} (Status: {task.status})")
 
             remaining = len(agent_tasks) - len(selected)
             if remaining > 0:
                 plural = "n" if remaining != 1 else ""
-                lines.append(f"  - … {remaining} weitere Aufgabe{plural} offen.")
-        lines.append("")
+                out.line(f"  - … {remaining} weitere Aufgabe{plural} offen.")
+        out.line()
 
-    return "\n".join(lines).rstrip()
+    return out.getvalue().rstrip()
 
 
 __all__ = [
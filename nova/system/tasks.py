@@ -11,6 +11,7 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 import csv
 from dataclasses import dataclass
+from functools import cached_property
 import os
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -28,6 +29,12 @@ class AgentTask:
     description: str
     status: str
 
+    @cached_property
+    def is_complete(self) -> bool:
+        """Whether :attr:`status` marks the task as done, evaluated once."""
+
+        return is_task_complete(self.status)
+
 
 _DEFAULT_TASK_CSV = Path(__file__).resolve().parents[2] / "Agenten_Aufgaben_Uebersicht.csv"
 
@@ -203,7 +210,7 @@ def build_stepwise_task_checklist(tasks: Sequence[AgentTask]) -> str:
         if role:
             lines.append(f"*Rolle:* {role}")
         for task in agent_tasks:
-            checkbox = "x" if is_task_complete(task.status) else " "
+            checkbox = "x" if task.is_complete else " "
             lines.append(
                 f"{step}. [{checkbox}] {task.description} (Status: {task.status})"
             )
@@ -1,6 +1,8 @@
 """gRPC service definitions for the Nova task queue."""
 from __future__ import annotations
 
+from typing import Iterator
+
 import grpc
 
 from . import proto
@@ -30,6 +32,11 @@ class TaskQueueStub:
             request_serializer=proto.ListTasksRequest.SerializeToString,
             response_deserializer=proto.ListTasksResponse.FromString,
         )
+        self.EnqueueStream = channel.stream_stream(
+            "/nova.taskqueue.TaskQueue/EnqueueStream",
+            request_serializer=proto.EnqueueRequest.SerializeToString,
+            response_deserializer=proto.EnqueueResponse.FromString,
+        )
 
 
 class TaskQueueServicer:
@@ -50,6 +57,13 @@ class TaskQueueServicer:
     def ListTasks(self, request: proto.ListTasksRequest, context: grpc.ServicerContext) -> proto.ListTasksResponse:  # noqa: N802
         raise NotImplementedError
 
+    def EnqueueStream(  # noqa: N802
+        self,
+        request_iterator: Iterator[proto.EnqueueRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[proto.EnqueueResponse]:
+        raise NotImplementedError
+
 
 def add_TaskQueueServicer_to_server(servicer: TaskQueueServicer, server: grpc.Server) -> None:  # noqa: N802
     rpc_method_handlers = {
@@ -73,6 +87,11 @@ def add_TaskQueueServicer_to_server(servicer: TaskQueueServicer, server: grpc.Se
             request_deserializer=proto.ListTasksRequest.FromString,
             response_serializer=proto.ListTasksResponse.SerializeToString,
         ),
+        "EnqueueStream": grpc.stream_stream_rpc_method_handler(
+            servicer.EnqueueStream,
+            request_deserializer=proto.EnqueueRequest.FromString,
+            response_serializer=proto.EnqueueResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "nova.taskqueue.TaskQueue", rpc_method_handlers
@@ -32,9 +32,24 @@ def _build_file_descriptor() -> descriptor_pb2.FileDescriptorProto:
     field.label = descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
     field.type = descriptor_pb2.FieldDescriptorProto.TYPE_STRING
 
+    def _add_metadata_map_entry(message: descriptor_pb2.DescriptorProto) -> None:
+        # ``map<string, string>`` fields are encoded exactly like a repeated
+        # key/value entry message, so this stays wire compatible with
+        # ``TaskMetadataEntry`` while exposing a dict-like API.
+        entry = message.nested_type.add()
+        entry.name = "MetadataEntry"
+        entry.options.map_entry = True
+        for entry_name, entry_number in (("key", 1), ("value", 2)):
+            entry_field = entry.field.add()
+            entry_field.name = entry_name
+            entry_field.number = entry_number
+            entry_field.label = descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
+            entry_field.type = descriptor_pb2.FieldDescriptorProto.TYPE_STRING
+
     # Task message definition
     task_msg = file_proto.message_type.add()
     task_msg.name = "Task"
+    _add_metadata_map_entry(task_msg)
 
     fields = [
         ("id", 1, descriptor_pb2.FieldDescriptorProto.TYPE_STRING),
@@ -60,11 +75,12 @@ def _build_file_descriptor() -> descriptor_pb2.FileDescriptorProto:
         )
         field.type = field_type
         if name == "metadata":
-            field.type_name = ".nova.taskqueue.TaskMetadataEntry"
+            field.type_name = ".nova.taskqueue.Task.MetadataEntry"
 
     # EnqueueRequest message
     enqueue_request = file_proto.message_type.add()
     enqueue_request.name = "EnqueueRequest"
+    _add_metadata_map_entry(enqueue_request)
 
     field = enqueue_request.field.add()
     field.name = "type"
@@ -83,7 +99,7 @@ def _build_file_descriptor() -> descriptor_pb2.FileDescriptorProto:
     field.number = 3
     field.label = descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED
     field.type = descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE
-    field.type_name = ".nova.taskqueue.TaskMetadataEntry"
+    field.type_name = ".nova.taskqueue.EnqueueRequest.MetadataEntry"
 
     # EnqueueResponse message
     enqueue_response = file_proto.message_type.add()
@@ -181,15 +197,24 @@ def _build_file_descriptor() -> descriptor_pb2.FileDescriptorProto:
     service = file_proto.service.add()
     service.name = "TaskQueue"
 
-    def _add_rpc(name: str, input_type: str, output_type: str) -> None:
+    def _add_rpc(name: str, input_type: str, output_type: str, *, streaming: bool = False) -> None:
         method = service.method.add()
         method.name = name
         method.input_type = input_type
         method.output_type = output_type
+        if streaming:
+            method.client_streaming = True
+            method.server_streaming = True
     _add_rpc("Enqueue", ".nova.taskqueue.EnqueueRequest", ".nova.taskqueue.EnqueueResponse")
     _add_rpc("Dequeue", ".nova.taskqueue.DequeueRequest", ".nova.taskqueue.DequeueResponse")
     _add_rpc("Ack", ".nova.taskqueue.AckRequest", ".nova.taskqueue.AckResponse")
     _add_rpc("ListTasks", ".nova.taskqueue.ListTasksRequest", ".nova.taskqueue.ListTasksResponse")
+    _add_rpc(
+        "EnqueueStream",
+        ".nova.taskqueue.EnqueueRequest",
+        ".nova.taskqueue.EnqueueResponse",
+        streaming=True,
+    )
 
     return file_proto
 
@@ -5,7 +5,7 @@ import json
 import threading
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 try:  # pragma: no cover - import is optional for real Redis deployments
     from redis import Redis  # type: ignore
@@ -85,6 +85,13 @@ class RedisTaskRepository:
         )
         return record
 
+    def enqueue_many(
+        self,
+        tasks: Iterable[tuple[str, str, Optional[Dict[str, str]]]],
+    ) -> List[TaskRecord]:
+        """Enqueue several ``(task_type, payload, metadata)`` triples in order."""
+        return [self.enqueue(task_type, payload, metadata) for task_type, payload, metadata in tasks]
+
     def dequeue(self, worker_id: str) -> Optional[TaskRecord]:
         popped = self._client.zpopmin(self._pending_key, count=1)
         if not popped:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from concurrent import futures
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterator, Mapping, Optional
 
 import grpc
 
@@ -43,6 +43,23 @@ class TaskQueueService(TaskQueueServicer):
         self._audit.record_event("task_enqueued", subject="queue", details={"task_id": record.id})
         return _record_to_proto(record)
 
+    def EnqueueStream(  # noqa: N802
+        self,
+        request_iterator: Iterator[proto.EnqueueRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[proto.EnqueueResponse]:
+        batch = [
+            (request.type, request.payload, _metadata_to_dict(request.metadata))
+            for request in request_iterator
+        ]
+        records = self._repository.enqueue_many(batch)
+        self._logger.info("Task batch enqueued", extra={"count": len(records)})
+        if records:
+            self._kpi.increment("tasks_enqueued", len(records))
+        for record in records:
+            self._audit.record_event("task_enqueued", subject="queue", details={"task_id": record.id})
+            yield _record_to_proto(record)
+
     def Dequeue(self, request: proto.DequeueRequest, context: grpc.ServicerContext) -> proto.DequeueResponse:  # noqa: N802
         requeued, failed = self._repository.recover_overdue_tasks(
             self._visibility_timeout_ms,
@@ -78,7 +95,7 @@ class TaskQueueService(TaskQueueServicer):
             response.has_task = False
             return response
         response.has_task = True
-        response.task.CopyFrom(_record_to_proto(record).task)
+        _populate_task(response.task, record)
         self._logger.info(
             "Task dispatched",
             extra={"task_id": record.id, "worker_id": request.worker_id},
@@ -112,7 +129,7 @@ class TaskQueueService(TaskQueueServicer):
             context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Unsupported status {status_filter}")
         response = proto.ListTasksResponse()
         for record in self._repository.list_tasks(status_filter):
-            response.tasks.append(_record_to_proto(record).task)
+            _populate_task(response.tasks.add(), record)
         return response
 
 
@@ -153,12 +170,18 @@ class TaskQueueServer:
         return f"{self._host}:{self._port}"
 
 
-def _metadata_to_dict(entries: Iterable[proto.TaskMetadataEntry]) -> Dict[str, str]:
-    return {entry.key: entry.value for entry in entries}
+def _metadata_to_dict(entries: Mapping[str, str]) -> Dict[str, str]:
+    return dict(entries)
 
 
 def _record_to_proto(record: TaskRecord) -> proto.EnqueueResponse:
-    task_message = proto.Task()
+    response = proto.EnqueueResponse()
+    _populate_task(response.task, record)
+    return response
+
+
+def _populate_task(task_message: proto.Task, record: TaskRecord) -> None:
+    """Write ``record`` into ``task_message`` in place (no intermediate copy)."""
     task_message.id = record.id
     task_message.type = record.type
     task_message.payload = record.payload
@@ -170,14 +193,7 @@ def _record_to_proto(record: TaskRecord) -> proto.EnqueueResponse:
     if record.worker_id is not None:
         task_message.worker_id = record.worker_id
     task_message.attempts = record.attempts
-    for key, value in record.metadata.items():
-        entry = task_message.metadata.add()
-        entry.key = key
-        entry.value = value
-
-    response = proto.EnqueueResponse()
-    response.task.CopyFrom(task_message)
-    return response
+    task_message.metadata.update(record.metadata)
 
 
 __all__ = ["TaskQueueService", "TaskQueueServer"]
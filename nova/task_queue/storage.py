@@ -81,42 +81,60 @@ class TaskRepository:
         self._connection.close()
 
     def enqueue(self, task_type: str, payload: str, metadata: Optional[Dict[str, str]] = None) -> TaskRecord:
-        metadata = metadata or {}
-        task_id = str(uuid.uuid4())
+        return self.enqueue_many([(task_type, payload, metadata)])[0]
+
+    def enqueue_many(
+        self,
+        tasks: Iterable[tuple[str, str, Optional[Dict[str, str]]]],
+    ) -> List[TaskRecord]:
+        """Persist several tasks in a single transaction.
+
+        ``tasks`` yields ``(task_type, payload, metadata)`` triples. All rows
+        are written with one ``executemany`` call and one commit.
+        """
         now = self._now()
-        record = TaskRecord(
-            id=task_id,
-            type=task_type,
-            payload=payload,
-            metadata=metadata,
-            status="PENDING",
-            created_at=now,
-            updated_at=now,
-            result=None,
-            worker_id=None,
-            attempts=0,
-        )
-        self._logger.debug("Persisting new task", extra={"task_id": task_id, "task_type": task_type})
+        records = [
+            TaskRecord(
+                id=str(uuid.uuid4()),
+                type=task_type,
+                payload=payload,
+                metadata=metadata or {},
+                status="PENDING",
+                created_at=now,
+                updated_at=now,
+                result=None,
+                worker_id=None,
+                attempts=0,
+            )
+            for task_type, payload, metadata in tasks
+        ]
+        if not records:
+            return records
+        for record in records:
+            self._logger.debug("Persisting new task", extra={"task_id": record.id, "task_type": record.type})
         with self._lock, self._connection:
-            self._connection.execute(
+            self._connection.executemany(
                 """
                 INSERT INTO tasks (id, type, payload, metadata, status, created_at, updated_at, result, worker_id, attempts)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    record.id,
-                    record.type,
-                    record.payload,
-                    json.dumps(record.metadata, sort_keys=True),
-                    record.status,
-                    record.created_at,
-                    record.updated_at,
-                    record.result,
-                    record.worker_id,
-                    record.attempts,
-                ),
+                [
+                    (
+                        record.id,
+                        record.type,
+                        record.payload,
+                        json.dumps(record.metadata, sort_keys=True),
+                        record.status,
+                        record.created_at,
+                        record.updated_at,
+                        record.result,
+                        record.worker_id,
+                        record.attempts,
+                    )
+                    for record in records
+                ],
             )
-        return record
+        return records
 
     def dequeue(self, worker_id: str) -> Optional[TaskRecord]:
         with self._lock:
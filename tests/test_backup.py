@@ -31,3 +31,12 @@ def test_export_backup_plan(tmp_path: Path):
     assert output.exists()
     content = output.read_text(encoding="utf-8")
     assert "Default Backup & Recovery Plan" in content
+
+
+def test_default_backup_plan_copies_are_independent(tmp_path: Path):
+    plan = backup.build_backup_plan("default")
+    plan.scope.append("Zusätzliche Sicherung der Grafana-Dashboards.")
+
+    assert plan.scope != backup.build_backup_plan("default").scope
+    output = backup.export_backup_plan(plan, tmp_path / "plan.md")
+    assert "Grafana-Dashboards" in output.read_text(encoding="utf-8")
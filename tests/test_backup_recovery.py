@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 from nova.security.backup_recovery import BackupManager, ensure_weekly_backup
@@ -18,3 +19,60 @@ def test_ensure_weekly_backup(tmp_path: Path) -> None:
     manager.run_backup()
     result = ensure_weekly_backup(tmp_path)
     assert result is None or result.location.exists()
+
+
+def test_list_snapshots_lists_backup_directory(tmp_path: Path) -> None:
+    manager = BackupManager(tmp_path)
+    assert manager.list_snapshots() == []
+
+    snapshot = manager.run_backup()
+    [listed] = manager.list_snapshots()
+    assert listed.timestamp == snapshot.timestamp
+    assert listed.location == snapshot.location
+    assert [artifact.name for artifact in listed.artifacts] == ["postgres.sql", "vector-store.snapshot"]
+
+
+def test_scanned_snapshots_list_artifacts_lazily(tmp_path: Path) -> None:
+    manager = BackupManager(tmp_path)
+    snapshot_dir = manager.backup_dir / "20240101000000"
+    snapshot_dir.mkdir()
+    [snapshot] = manager.list_snapshots()
+
+    (snapshot_dir / "late.sql").write_text("-- added after listing --\n", encoding="utf-8")
+    assert [artifact.name for artifact in snapshot.artifacts] == ["late.sql"]
+
+
+def test_list_snapshots_only_trusts_the_backup_directory(tmp_path: Path) -> None:
+    manager = BackupManager(tmp_path)
+    kept = manager.run_backup()
+    (kept.location / "postgres.sql").unlink()
+    with (tmp_path / "logs" / "backups.jsonl").open("a", encoding="utf-8") as journal:
+        journal.write('{"timestamp": "2021')
+    removed = manager.backup_dir / "20200101000000"
+    removed.mkdir()
+    shutil.rmtree(removed)
+    (manager.backup_dir / "20240101000000").mkdir()
+
+    listed = manager.list_snapshots()
+    assert [snapshot.timestamp for snapshot in listed] == sorted([kept.timestamp, "20240101000000"])
+    listed_kept = next(s for s in listed if s.timestamp == kept.timestamp)
+    assert [artifact.name for artifact in listed_kept.artifacts] == ["vector-store.snapshot"]
+
+
+def test_latest_timestamp_scans_once_and_tracks_new_backups(tmp_path: Path) -> None:
+    manager = BackupManager(tmp_path)
+    assert manager.latest_timestamp() is None
+
+    (manager.backup_dir / "20240101000000").mkdir()
+    assert manager.latest_timestamp() is None
+    snapshot = manager.run_backup()
+    assert manager.latest_timestamp() == snapshot.timestamp
+    assert BackupManager(tmp_path).latest_timestamp() == snapshot.timestamp
+
+
+def test_ensure_weekly_backup_skips_when_newest_snapshot_is_current(tmp_path: Path) -> None:
+    (tmp_path / "backups" / "20200106000000").mkdir(parents=True)
+    created = ensure_weekly_backup(tmp_path)
+    assert created is not None
+    assert ensure_weekly_backup(tmp_path) is None
+    assert len(BackupManager(tmp_path).list_snapshots()) == 2
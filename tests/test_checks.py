@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nova.system import checks
+
+
+def test_check_gpu_caches_probe_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def _probe() -> dict[str, object]:
+        calls.append(1)
+        return {"available": False, "details": "nvidia-smi executable not found"}
+
+    monkeypatch.setattr(checks, "_GPU_CACHE", None)
+    monkeypatch.setattr(checks, "_probe_gpu", _probe)
+
+    first = checks.check_gpu()
+    second = checks.check_gpu()
+    assert first == second
+    assert len(calls) == 1
+
+    monkeypatch.setattr(checks, "_GPU_CACHE_TTL_SECONDS", 0.0)
+    checks.check_gpu()
+    assert len(calls) == 2
+
+
+def test_detect_nvidia_smi_retries_until_found(monkeypatch: pytest.MonkeyPatch) -> None:
+    found: list[str | None] = [None]
+    monkeypatch.setattr(checks, "_NVIDIA_SMI", None)
+    monkeypatch.setattr(checks.shutil, "which", lambda _name: found[0])
+
+    assert checks.detect_nvidia_smi() is None
+    found[0] = "/usr/bin/nvidia-smi"
+    assert checks.detect_nvidia_smi() == "/usr/bin/nvidia-smi"
+    found[0] = None
+    assert checks.detect_nvidia_smi() == "/usr/bin/nvidia-smi"
+
+
+class _FakeNVML:
+    def __init__(self) -> None:
+        self.initialised = 0
+
+    def nvmlInit(self) -> None:
+        self.initialised += 1
+
+    def nvmlShutdown(self) -> None:
+        pass
+
+    def nvmlDeviceGetCount(self) -> int:
+        return 2
+
+    def nvmlDeviceGetHandleByIndex(self, index: int) -> int:
+        return index
+
+    def nvmlDeviceGetName(self, handle: int) -> bytes | str:
+        return b"NVIDIA A100" if handle == 0 else "NVIDIA H100"
+
+
+def test_check_gpu_prefers_nvml(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeNVML()
+    monkeypatch.setattr(checks, "_pynvml", fake)
+    monkeypatch.setattr(checks, "_GPU_CACHE", None)
+    monkeypatch.setattr(checks.atexit, "register", lambda func: func)
+    monkeypatch.setattr(checks, "_NVML_READY", None)
+    result = checks.check_gpu()
+
+    assert result == {"available": True, "details": ["GPU 0: NVIDIA A100", "GPU 1: NVIDIA H100"]}
+    assert fake.initialised == 1
+
+
+def test_nvml_is_initialised_once_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeNVML()
+    start = threading.Barrier(8)
+
+    def _slow_init() -> None:
+        time.sleep(0.01)
+        fake.initialised += 1
+
+    monkeypatch.setattr(fake, "nvmlInit", _slow_init)
+    monkeypatch.setattr(checks, "_pynvml", fake)
+    monkeypatch.setattr(checks.atexit, "register", lambda func: func)
+    monkeypatch.setattr(checks, "_NVML_READY", None)
+
+    def _probe() -> None:
+        start.wait()
+        assert checks.nvml_module() is fake
+
+    threads = [threading.Thread(target=_probe) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fake.initialised == 1
+
+
+def test_check_network_only_resolves_localhost(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("no TCP connection expected")
+
+    monkeypatch.setattr(checks.socket, "create_connection", _fail)
+    assert checks.check_network()["online"] is True
+
+    def _unresolvable(_host: str) -> str:
+        raise OSError("resolution failed")
+
+    monkeypatch.setattr(checks.socket, "gethostbyname", _unresolvable)
+    result = checks.check_network()
+    assert result["online"] is False
+    assert "resolution failed" in result["details"]
@@ -1,5 +1,7 @@
+import pytest
+
 from nova.blueprints.generator import create_blueprint
-from nova.system.communication import CommunicationHub
+from nova.system.communication import AgentMessage, CommunicationHub
 from nova.agents.nova import NovaAgent
 
 
@@ -24,3 +26,52 @@ def test_agent_emits_messages_on_task_completion():
     assert hub.messages
     subjects = {message.subject for message in hub.messages}
     assert any(subject.startswith("task-completed::") for subject in subjects)
+
+
+def test_messages_for_preserves_order_across_direct_and_broadcast_messages():
+    hub = CommunicationHub()
+    hub.send(sender="nova", subject="first", body="", recipients=("lumina", "all"))
+    hub.send(sender="nova", subject="skip", body="", recipients=("orion",))
+    hub.broadcast(sender="nova", subject="second", body="")
+    hub.send(sender="nova", subject="third", body="", recipients=(" Lumina ",))
+
+    assert [message.subject for message in hub.messages_for("LUMINA")] == ["first", "second", "third"]
+    hub.clear()
+    assert hub.messages_for("lumina") == []
+
+
+def test_agent_message_to_dict_without_copy_returns_views():
+    hub = CommunicationHub()
+    message = hub.send(sender="nova", subject="s", body="b", recipients=("lumina",), metadata={"k": "v"})
+
+    view = message.to_dict(copy=False)
+    assert view["recipients"] is message.recipients
+    assert view["metadata"] == {"k": "v"}
+    with pytest.raises(TypeError):
+        view["metadata"]["k"] = "changed"
+    assert message.to_dict() == {**view, "recipients": ["lumina"], "metadata": {"k": "v"}}
+
+
+def test_governance_messages_are_indexed_at_publish_time():
+    hub = CommunicationHub()
+    hub.send(sender="nova", subject="task-completed::setup", body="")
+    decision = hub.send(sender="nova", subject="governance::deploy", body="", metadata={"verdict": "APPROVED"})
+
+    assert hub.governance_messages() == (decision,)
+    hub.clear()
+    assert hub.governance_messages() == ()
+
+
+def test_publish_many_records_messages_in_order():
+    hub = CommunicationHub()
+    hub.send(sender="nova", subject="before", body="", recipients=("lumina",))
+    hub.publish_many(
+        [
+            AgentMessage(sender="orchestrator", recipients=("all",), subject="phase-start::x", body=""),
+            AgentMessage(sender="orchestrator", recipients=("lumina",), subject="agent-start::lumina", body=""),
+            AgentMessage(sender="orchestrator", recipients=("orion",), subject="governance::check", body=""),
+        ]
+    )
+
+    assert [m.subject for m in hub.messages_for("lumina")] == ["before", "phase-start::x", "agent-start::lumina"]
+    assert [m.subject for m in hub.governance_messages()] == ["governance::check"]
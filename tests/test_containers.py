@@ -1,15 +1,24 @@
+import pytest
+
 from nova.system import containers
 
 
+@pytest.fixture(autouse=True)
+def _clear_which_cache():
+    containers._WHICH_CACHE.clear()
+    yield
+    containers._WHICH_CACHE.clear()
+
+
 class DummyCompleted:
-    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0):
+    def __init__(self, stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0):
         self.stdout = stdout
         self.stderr = stderr
         self.returncode = returncode
 
 
 def test_check_container_runtime_missing_binary(monkeypatch):
-    monkeypatch.setattr(containers.shutil, "which", lambda _: None)
+    monkeypatch.setattr(containers.shutil, "which", lambda *_, **__: None)
     result = containers.check_container_runtime("Docker Engine", "docker")
     assert result.health == "missing"
     assert not result.found
@@ -17,11 +26,11 @@ def test_check_container_runtime_missing_binary(monkeypatch):
 
 
 def test_check_container_runtime_with_version(monkeypatch):
-    monkeypatch.setattr(containers.shutil, "which", lambda _: "/usr/bin/docker")
+    monkeypatch.setattr(containers.shutil, "which", lambda *_, **__: "/usr/bin/docker")
     monkeypatch.setattr(
         containers.subprocess,
         "run",
-        lambda *_, **__: DummyCompleted(stdout="Docker version 26.0.0"),
+        lambda *_, **__: DummyCompleted(stdout=b"Docker version 26.0.0\n"),
     )
     result = containers.check_container_runtime("Docker Engine", "docker")
     assert result.health == "ok"
@@ -29,11 +38,11 @@ def test_check_container_runtime_with_version(monkeypatch):
 
 
 def test_check_container_runtime_kubeconfig_warning(tmp_path, monkeypatch):
-    monkeypatch.setattr(containers.shutil, "which", lambda _: "/usr/bin/kubectl")
+    monkeypatch.setattr(containers.shutil, "which", lambda *_, **__: "/usr/bin/kubectl")
     monkeypatch.setattr(
         containers.subprocess,
         "run",
-        lambda *_, **__: DummyCompleted(stdout="kubectl version v1.30.0", returncode=0),
+        lambda *_, **__: DummyCompleted(stdout=b"kubectl version v1.30.0", returncode=0),
     )
     kubeconfig = tmp_path / "config"
     result = containers.check_container_runtime(
@@ -161,3 +170,89 @@ def test_export_container_fix_plan_writes_markdown(tmp_path):
     content = output_path.read_text(encoding="utf-8")
     assert "# Nova Container Fix-Plan" in content
     assert content.endswith("\n")
+
+
+def test_check_container_runtime_deduplicates_kubeconfig_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(containers.shutil, "which", lambda *_, **__: "/usr/bin/kubectl")
+    monkeypatch.setattr(
+        containers.subprocess,
+        "run",
+        lambda *_, **__: DummyCompleted(stdout=b"kubectl version v1.30.0", returncode=0),
+    )
+    kubeconfig = tmp_path / "config"
+    kubeconfig.write_text("apiVersion: v1\n", encoding="utf-8")
+    result = containers.check_container_runtime(
+        "Kubernetes CLI",
+        "kubectl",
+        config_paths=[kubeconfig, tmp_path / "nested" / ".." / "config"],
+    )
+    assert result.config_ok is True
+    assert result.notes == [f"Gefundene Kubeconfig-Dateien: {kubeconfig}"]
+
+
+def test_check_container_runtime_reports_failed_version_output(monkeypatch):
+    monkeypatch.setattr(containers.shutil, "which", lambda *_, **__: "/usr/bin/docker")
+    monkeypatch.setattr(
+        containers.subprocess,
+        "run",
+        lambda *_, **__: DummyCompleted(stderr=b"Cannot connect\nIs the daemon running?\n", returncode=1),
+    )
+    result = containers.check_container_runtime("Docker Engine", "docker")
+    assert result.health == "warning"
+    assert result.version == "Cannot connect"
+    assert result.notes[-1] == "Cannot connect\nIs the daemon running?"
+
+
+def test_check_container_runtime_caches_found_binaries_only(monkeypatch):
+    lookups = []
+    installed = {"docker": None}
+
+    def _which(binary, path=None):
+        lookups.append(binary)
+        return installed[binary]
+
+    monkeypatch.setattr(containers.shutil, "which", _which)
+    monkeypatch.setattr(containers.subprocess, "run", lambda *_, **__: DummyCompleted(stdout=b"Docker version 26.0.0\n"))
+    assert containers.check_container_runtime("Docker Engine", "docker").health == "missing"
+    assert containers.check_container_runtime("Docker Engine", "docker").health == "missing"
+    assert lookups == ["docker", "docker"]
+
+    installed["docker"] = "/usr/bin/docker"
+    containers.check_container_runtime("Docker Engine", "docker")
+    assert containers.check_container_runtime("Docker Engine", "docker").health == "ok"
+    assert lookups == ["docker"] * 3
+
+    monkeypatch.setenv("PATH", "/opt/nova/bin")
+    containers.check_container_runtime("Docker Engine", "docker")
+    assert lookups == ["docker"] * 4
+
+
+def test_inspection_report_health_follows_runtime_changes():
+    healthy = containers.RuntimeCheckResult(
+        name="Docker Engine", binary="docker", found=True, version="26.0.0", health="ok"
+    )
+    missing = containers.RuntimeCheckResult(
+        name="Kubernetes CLI", binary="kubectl", found=False, version=None, health="missing"
+    )
+    report = containers.ContainerInspectionReport(runtimes=[healthy])
+    assert report.all_healthy() is True
+    assert report.to_dict()["all_healthy"] is True
+
+    report.runtimes.append(missing)
+    assert report.all_healthy() is False
+    assert report.to_dict()["all_healthy"] is False
+
+    report.runtimes = [healthy]
+    assert report.all_healthy() is True
+
+
+def test_log_container_report_emits_markdown_as_one_record(monkeypatch):
+    messages = []
+    monkeypatch.setattr(containers, "log_info", lambda message, *args: messages.append(message % args))
+    monkeypatch.setattr(containers, "log_warning", lambda message, *args: messages.append(message))
+    report = containers.ContainerInspectionReport(
+        runtimes=[containers.RuntimeCheckResult(name="Docker Engine", binary="docker", found=True, version=None, health="ok")]
+    )
+
+    containers.log_container_report(report)
+    assert messages == [report.to_markdown(), "Alle Container-Runtimes sind einsatzbereit."]
@@ -14,6 +14,7 @@ from nova.monitoring.dashboards import (
     load_lux_compliance_slice,
     load_migration_dashboard,
 )
+from nova.serialization import dumps_bytes
 
 
 def _get_panel(dashboard: dict[str, object], title: str) -> dict[str, object]:
@@ -62,7 +63,7 @@ def test_export_and_load_roundtrip(tmp_path: Path):
     assert payload["uid"] == "spark-migration-kpis"
 
     loaded = load_migration_dashboard(target)
-    assert loaded == payload
+    assert json.loads(dumps_bytes(loaded, default=dict)) == payload
 
 
 def test_export_uses_default_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
@@ -95,7 +96,7 @@ def test_export_and_load_lux_slice(tmp_path: Path):
     payload = json.loads(target.read_text())
     assert payload["title"].startswith("Spark Migration Compliance")
     loaded = load_lux_compliance_slice(target)
-    assert loaded == payload
+    assert json.loads(dumps_bytes(loaded, default=dict)) == payload
 
 
 def test_export_lux_uses_default_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
@@ -105,3 +106,31 @@ def test_export_lux_uses_default_path(tmp_path: Path, monkeypatch: pytest.Monkey
     exported = export_lux_compliance_slice()
     assert exported == default_path
     assert default_path.exists()
+
+
+def test_load_reuses_parsed_payload_until_file_changes(tmp_path: Path):
+    target = tmp_path / "dashboard.json"
+    export_migration_dashboard(target)
+
+    first = load_migration_dashboard(target)
+    assert load_migration_dashboard(target) is first
+    with pytest.raises(TypeError):
+        first["uid"] = "changed"  # type: ignore[index]
+    assert isinstance(first["panels"], tuple)
+    with pytest.raises(TypeError):
+        first["panels"][0]["title"] = "changed"  # type: ignore[index]
+    assert json.loads(dumps_bytes(first, default=dict)) == json.loads(target.read_text())
+
+    target.write_text(json.dumps({"uid": "updated-dashboard"}), encoding="utf-8")
+    refreshed = load_migration_dashboard(target)
+    assert refreshed["uid"] == "updated-dashboard"
+    assert load_migration_dashboard(target) is refreshed
+
+
+def test_export_all_dashboards_writes_both_payloads(tmp_path: Path):
+    dashboard_path, lux_path = dashboards_module.export_all_dashboards(tmp_path)
+
+    assert dashboard_path.parent == tmp_path
+    assert lux_path.parent == tmp_path
+    assert json.loads(dashboard_path.read_text())["uid"] == "spark-migration-kpis"
+    assert json.loads(lux_path.read_text())["id"] == "lux-compliance-evidence"
@@ -1,5 +1,12 @@
+import json
+import socket
+from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+
+from nova.system import checks, dgx_audit
 from nova.system.dgx_audit import run_dgx_audit
 
 
@@ -10,3 +17,189 @@ def test_run_dgx_audit_creates_report(tmp_path: Path) -> None:
     content = result.report_path.read_text(encoding="utf-8")
     assert "DGX Audit Report" in content
     assert any(check.status in {"ok", "warning", "error"} for check in result.checks)
+
+
+def test_cuda_probe_reads_devices_through_nvml(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_nvml = SimpleNamespace(
+        nvmlInit=lambda: None,
+        nvmlShutdown=lambda: None,
+        nvmlSystemGetDriverVersion=lambda: b"550.54.15",
+        nvmlDeviceGetCount=lambda: 2,
+        nvmlDeviceGetHandleByIndex=lambda index: index,
+        nvmlDeviceGetName=lambda handle: f"NVIDIA H100 #{handle}",
+        nvmlDeviceGetMemoryInfo=lambda handle: SimpleNamespace(total=80 * 1024**3),
+    )
+    monkeypatch.setattr(checks, "_pynvml", fake_nvml)
+    monkeypatch.setattr(checks.atexit, "register", lambda func: func)
+    monkeypatch.setattr(dgx_audit.subprocess, "check_output", lambda *_, **__: pytest.fail("nvidia-smi spawned"))
+    monkeypatch.setattr(checks, "_NVML_READY", None)
+    status, details = dgx_audit._run_cuda_probe()
+
+    assert status == "ok"
+    assert details == ["NVIDIA H100 #0 | 550.54.15 | 81920 MiB", "NVIDIA H100 #1 | 550.54.15 | 81920 MiB"]
+
+
+def test_cuda_probe_parses_unitless_nvidia_smi_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def _check_output(command, **_kwargs):
+        calls.append(command)
+        return "NVIDIA A100-SXM4-80GB, 550.54.15, 81920\n\n"
+
+    monkeypatch.setattr(dgx_audit, "nvml_module", lambda: None)
+    monkeypatch.setattr(dgx_audit, "detect_nvidia_smi", lambda: "/usr/bin/nvidia-smi")
+    monkeypatch.setattr(dgx_audit.subprocess, "check_output", _check_output)
+    monkeypatch.setattr(dgx_audit, "_SMI_SLOW_SECONDS", float("inf"))
+
+    status, details = dgx_audit._run_cuda_probe()
+    assert status == "ok"
+    assert details == ["NVIDIA A100-SXM4-80GB | 550.54.15 | 81920 MiB"]
+    assert calls[0][-1] == "--format=csv,noheader,nounits"
+
+
+def test_check_ports_probes_ports_concurrently() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener, socket.socket() as unused:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        unused.bind(("127.0.0.1", 0))
+        open_port = listener.getsockname()[1]
+        closed_port = unused.getsockname()[1]
+
+        status, details = dgx_audit._check_ports([open_port, closed_port])
+
+    assert status == "warning"
+    assert details[0] == f"Port {open_port} reachable on 127.0.0.1"
+    assert details[1].startswith(f"Port {closed_port} closed or filtered")
+
+
+def test_run_dgx_audit_can_defer_log_writes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dgx_audit, "_run_cuda_probe", lambda: ("warning", ["nvidia-smi not available in PATH"]))
+    monkeypatch.setattr(dgx_audit, "_check_ports", lambda ports: ("ok", []))
+
+    first = run_dgx_audit(base_path=tmp_path, flush=False)
+    run_dgx_audit(base_path=tmp_path, flush=False)
+    assert not first.log_path.exists()
+
+    dgx_audit._flush_audit_log()
+    entries = [json.loads(line) for line in first.log_path.read_text(encoding="utf-8").splitlines()]
+    assert len(entries) == 2
+    assert entries[0]["checks"][1]["name"] == "CUDA Probe"
+
+
+def _health_nvml(**readings: object) -> SimpleNamespace:
+    return SimpleNamespace(
+        NVML_MEMORY_ERROR_TYPE_UNCORRECTED=1,
+        NVML_VOLATILE_ECC=0,
+        NVML_TEMPERATURE_GPU=0,
+        nvmlDeviceGetCount=lambda: 1,
+        nvmlDeviceGetHandleByIndex=lambda index: index,
+        nvmlDeviceGetTotalEccErrors=lambda handle, error_type, counter: readings.get("ecc", 0),
+        nvmlDeviceGetTemperature=lambda handle, sensor: readings.get("temperature", 60),
+        nvmlDeviceGetCurrentClocksThrottleReasons=lambda handle: readings.get("reasons", 0),
+    )
+
+
+@pytest.mark.parametrize(
+    ("readings", "expected_status"),
+    [
+        ({}, "ok"),
+        ({"temperature": 91}, "warning"),
+        ({"reasons": 0x40}, "warning"),
+        ({"ecc": 2, "reasons": 0x40}, "error"),
+    ],
+)
+def test_gpu_health_grades_nvml_counters(
+    monkeypatch: pytest.MonkeyPatch, readings: dict[str, int], expected_status: str
+) -> None:
+    monkeypatch.setattr(dgx_audit, "nvml_module", lambda: _health_nvml(**readings))
+    status, details = dgx_audit._check_gpu_health()
+    assert status == expected_status
+    assert details[0].startswith("GPU 0: temperature=")
+
+
+def test_gpu_health_is_skipped_without_nvml(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dgx_audit, "nvml_module", lambda: None)
+    assert dgx_audit._check_gpu_health() is None
+
+
+def test_run_dgx_audit_records_timezone_aware_timestamps(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dgx_audit, "_check_ports", lambda ports: ("ok", []))
+    result = run_dgx_audit(base_path=tmp_path)
+
+    assert result.timestamp.tzinfo is not None
+    assert result.timestamp_iso.endswith("+00:00")
+    assert result.to_dict()["timestamp"] == result.timestamp_iso
+    assert f"* Generated: {result.timestamp_iso}" in result.to_markdown()
+
+
+def test_run_dgx_audit_replaces_report_atomically(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dgx_audit, "_check_ports", lambda ports: ("ok", []))
+    report_path = tmp_path / "reports" / "dgx_audit_report.md"
+    report_path.parent.mkdir(parents=True)
+    report_path.write_text("stale report with a much longer body than the new one\n" * 50, encoding="utf-8")
+
+    result = run_dgx_audit(base_path=tmp_path)
+    assert report_path.read_text(encoding="utf-8") == result.to_markdown()
+    assert list(report_path.parent.glob("*.tmp")) == []
+
+
+def test_dgx_audit_result_derives_passed_when_not_given() -> None:
+    checks = [dgx_audit.AuditCheck(name="Filesystem Access", status="ok")]
+    result = dgx_audit.DGXAuditResult(
+        timestamp=datetime.now(timezone.utc), checks=checks, report_path=Path("r.md"), log_path=Path("l.jsonl")
+    )
+    assert result.passed is True
+    assert "* Overall status: pass" in result.to_markdown()
+
+
+def test_filesystem_probe_reuses_recent_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    status, details = dgx_audit._check_filesystem(tmp_path)
+    assert status == "ok"
+    assert details[0] == f"Write access confirmed in {tmp_path / 'logs'}"
+
+    status, details = dgx_audit._check_filesystem(tmp_path)
+    assert status == "ok"
+    assert details[0].endswith("(recent probe reused)")
+
+    monkeypatch.setenv("NOVA_DGX_FS_CACHE_TTL", "0")
+    _, details = dgx_audit._check_filesystem(tmp_path)
+    assert details[0] == f"Write access confirmed in {tmp_path / 'logs'}"
+
+
+def test_check_ports_resolves_host_names_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups = []
+    real_getaddrinfo = socket.getaddrinfo
+
+    def _getaddrinfo(host, *args, **kwargs):
+        lookups.append(host)
+        return real_getaddrinfo("127.0.0.1", *args, **kwargs)
+
+    monkeypatch.setattr(dgx_audit.socket, "getaddrinfo", _getaddrinfo)
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        status, details = dgx_audit._check_ports([port, port], host="nova-dgx.local")
+
+    assert lookups == ["nova-dgx.local"]
+    assert status == "ok"
+    assert details == [f"Port {port} reachable on nova-dgx.local"] * 2
+
+
+def test_check_ports_reports_unresolvable_hosts(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*_args, **_kwargs):
+        raise socket.gaierror("Name or service not known")
+
+    monkeypatch.setattr(dgx_audit.socket, "getaddrinfo", _fail)
+    status, details = dgx_audit._check_ports([22], host="missing.invalid")
+    assert status == "warning"
+    assert details[0].startswith("Could not resolve missing.invalid")
+
+
+def test_dgx_audit_result_to_json_matches_to_dict() -> None:
+    checks = [dgx_audit.AuditCheck(name="CUDA Probe", status="warning", details=["nvidia-smi not available in PATH"])]
+    result = dgx_audit.DGXAuditResult(
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc), checks=checks, report_path=Path("r.md"), log_path=Path("l.jsonl")
+    )
+    assert json.loads(result.to_json()) == result.to_dict()
+    assert result.to_dict()["checks"][0]["details"] is checks[0].details
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from pathlib import Path
+
+import pytest
+
+from nova.fileio import write_atomic
+
+
+def test_write_atomic_supports_concurrent_writers(tmp_path: Path) -> None:
+    target = tmp_path / "report.md"
+    payloads = [bytes([65 + index]) * 200_000 for index in range(8)]
+    errors = []
+
+    def _write(data: bytes) -> None:
+        try:
+            write_atomic(target, data, durable=data[0] % 2 == 0)
+        except Exception as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_write, args=(data,)) for data in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert target.read_bytes() in payloads
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_write_atomic_keeps_existing_mode(tmp_path: Path) -> None:
+    target = tmp_path / "report.md"
+    target.write_bytes(b"old")
+    target.chmod(0o640)
+
+    write_atomic(target, b"new")
+    assert target.read_bytes() == b"new"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+def test_write_atomic_respects_umask_for_new_files(tmp_path: Path) -> None:
+    target = tmp_path / "report.md"
+    previous = os.umask(0o027)
+    try:
+        write_atomic(target, b"data")
+    finally:
+        os.umask(previous)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+def test_write_atomic_removes_temporary_file_on_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*_args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail)
+    with pytest.raises(OSError, match="disk full"):
+        write_atomic(tmp_path / "report.md", b"data")
+    assert list(tmp_path.iterdir()) == []
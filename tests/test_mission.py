@@ -1,3 +1,7 @@
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
 from nova.system.mission import ExecutionPlan, ExecutionPhase, build_default_plan
 
 
@@ -21,3 +25,66 @@ def test_plan_retains_unknown_agents():
     filtered = plan.filtered(["alpha", "beta"])
     assert filtered.iter_agents() == ("alpha", "beta")
     assert filtered.dependencies_for("beta") == ("alpha",)
+
+
+def test_default_plan_is_shared_frozen_and_indexed():
+    plan = build_default_plan()
+    assert build_default_plan() is plan
+    with pytest.raises(FrozenInstanceError):
+        plan.phases[0].agents = ("nova", "extra")  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        plan.phases = plan.phases[1:]  # type: ignore[misc]
+    assert plan.iter_agents()[0] == "nova"
+    assert plan.dependencies_for("LUMINA") == ("nova", "orion", "chronos")
+    assert plan.dependencies_for("unknown") == plan.iter_agents()
+
+    custom = replace(ExecutionPlan(()), phases=(ExecutionPhase(name="custom", goal="", agents=("alpha", "beta")),))
+    assert custom.dependencies_for("beta") == ("alpha",)
+    assert replace(custom.phases[0], agents=("gamma",)).agent_set == frozenset({"gamma"})
+
+
+def test_filtered_skips_phases_without_requested_agents():
+    plan = ExecutionPlan(
+        (
+            ExecutionPhase(name="first", goal="", agents=("nova", "orion")),
+            ExecutionPhase(name="second", goal="", agents=("lumina",)),
+        )
+    )
+    filtered = plan.filtered(["LUMINA"])
+    assert [phase.name for phase in filtered.phases] == ["second"]
+
+    plan = ExecutionPlan((plan.phases[0], replace(plan.phases[1], agents=("echo",))))
+    assert plan.filtered(["lumina"]).phases[0].name == "ad-hoc"
+
+
+def test_prerequisites_follow_phases_and_after():
+    plan = ExecutionPlan(
+        (
+            ExecutionPhase(name="first", goal="", agents=("nova", "orion")),
+            ExecutionPhase(name="second", goal="", agents=("lumina",)),
+            ExecutionPhase(name="third", goal="", agents=("echo",), after=("first",)),
+            ExecutionPhase(name="fourth", goal="", agents=("aura",), after=()),
+        )
+    )
+    assert plan.prerequisites_for("orion") == ()
+    assert plan.prerequisites_for("lumina") == ("nova", "orion")
+    assert plan.prerequisites_for("echo") == ("nova", "orion")
+    assert plan.prerequisites_for("aura") == ()
+    assert plan.filtered(["echo", "lumina"]).phases[1].after == ()
+    assert plan.phases[2].to_dict()["after"] == ["first"]
+
+
+def test_filtered_keeps_transitive_after_edges():
+    plan = ExecutionPlan(
+        (
+            ExecutionPhase(name="a", goal="", agents=("nova",), after=()),
+            ExecutionPhase(name="b", goal="", agents=("orion",), after=("a",)),
+            ExecutionPhase(name="c", goal="", agents=("lumina",), after=("b",)),
+            ExecutionPhase(name="d", goal="", agents=("echo",), after=()),
+        )
+    )
+
+    filtered = plan.filtered(["nova", "lumina", "echo"])
+    assert [phase.after for phase in filtered.phases] == [(), ("a",), ()]
+    assert filtered.prerequisites_for("lumina") == ("nova",)
+    assert filtered.prerequisites_for("echo") == ()
@@ -30,3 +30,12 @@ def test_export_vpn_plan(tmp_path):
     assert exported == path
     assert path.exists()
     assert path.read_text(encoding="utf-8").startswith("# Wireguard Remote Access Plan")
+
+
+def test_vpn_plans_are_independent_copies(tmp_path):
+    plan = build_vpn_plan("openvpn")
+    plan.setup_steps.append("Zusätzlichen Client für das Monitoring-Team anlegen.")
+
+    assert build_vpn_plan("openvpn").setup_steps != plan.setup_steps
+    exported = export_vpn_plan(plan, tmp_path / "plan.md")
+    assert "Monitoring-Team" in exported.read_text(encoding="utf-8")
@@ -1,6 +1,14 @@
+import gc
+import weakref
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 
+import pytest
+
+from nova.explainability import ExplainabilityLogger
 from nova.monitoring.optimizer import optimize, summarize_build_times
+from nova.self_optimization import optimizer as optimizer_module
+from nova.self_optimization import OptimizationReport, PipelineMetrics, PipelineMetricsBatch, PipelineOptimizer
 
 
 def test_optimize_generates_report(tmp_path: Path) -> None:
@@ -14,3 +22,112 @@ def test_summarize_build_times_handles_values() -> None:
     stats = summarize_build_times([1.0, 2.0, 3.0])
     assert stats["count"] == 3.0
     assert stats["avg"] == 2.0
+
+
+def test_optimisation_report_memoises_markdown() -> None:
+    report = OptimizationReport(reward=1.0, recommendation="Keep going.", metrics=(PipelineMetrics(10.0, 0.01, 0.9),))
+    first = report.to_markdown()
+    assert report.to_markdown() is first
+    assert "build_time=10.00s" in first
+
+    with pytest.raises(FrozenInstanceError):
+        report.recommendation = "Refactor."  # type: ignore[misc]
+    changed = replace(report, recommendation="Refactor.")
+    assert "Refactor." in changed.to_markdown()
+    assert report.to_markdown() is first
+
+
+def test_pipeline_optimizer_averages_metrics(tmp_path: Path) -> None:
+    logger = ExplainabilityLogger(log_dir=tmp_path)
+    optimizer = PipelineOptimizer(report_path=tmp_path / "report.md", logger=logger)
+    report = optimizer.analyse([PipelineMetrics(10.0, 0.0, 0.8), PipelineMetrics(6.0, 0.02, 0.8)])
+
+    assert report.reward == pytest.approx(20.0 - 1.0)
+    assert report.recommendation.startswith("Increase test coverage")
+    assert (tmp_path / "report.md").read_text(encoding="utf-8") == report.to_markdown()
+
+
+def test_pipeline_optimizer_accepts_columnar_batches(tmp_path: Path) -> None:
+    metrics = [PipelineMetrics(10.0, 0.0, 0.8), PipelineMetrics(6.0, 0.02, 0.8)]
+    optimizer = PipelineOptimizer(report_path=tmp_path / "report.md", logger=ExplainabilityLogger(log_dir=tmp_path))
+
+    batch = PipelineMetricsBatch.from_metrics(metrics)
+    report = optimizer.analyse(batch)
+
+    assert len(batch) == 2
+    assert report.reward == pytest.approx(optimizer.analyse(metrics).reward)
+    assert isinstance(report.metrics, PipelineMetricsBatch)
+    assert tuple(report.metrics) == tuple(metrics)
+    markdown = report.to_markdown()
+    assert markdown == optimizer.analyse(metrics).to_markdown()
+
+    batch.build_times[0] = 99.0
+    batch.coverage.append(0.5)
+    assert tuple(report.metrics) == tuple(metrics)
+    assert report._render_markdown() == markdown
+    with pytest.raises(ValueError):
+        PipelineMetricsBatch([1.0], [], [0.9])
+
+
+def test_pipeline_optimizer_coalesces_report_writes(tmp_path: Path) -> None:
+    report_path = tmp_path / "report.md"
+    optimizer = PipelineOptimizer(report_path=report_path, logger=ExplainabilityLogger(log_dir=tmp_path), flush_every=3)
+
+    optimizer.analyse([PipelineMetrics(10.0, 0.0, 0.9)])
+    report = optimizer.analyse([PipelineMetrics(8.0, 0.0, 0.7)])
+    assert not report_path.exists()
+
+    optimizer.flush()
+    assert report_path.read_text(encoding="utf-8") == report.to_markdown()
+
+
+def test_pipeline_optimizer_replaces_reports_atomically(tmp_path: Path) -> None:
+    report_path = tmp_path / "report.md"
+    optimizer = PipelineOptimizer(report_path=report_path, logger=ExplainabilityLogger(log_dir=tmp_path))
+
+    optimizer.analyse([PipelineMetrics(10.0, 0.0, 0.9), PipelineMetrics(9.0, 0.0, 0.9)])
+    report = optimizer.analyse([])
+    assert report_path.read_text(encoding="utf-8") == report.to_markdown()
+
+    report_path.unlink()
+    report = optimizer.analyse([PipelineMetrics(7.0, 0.0, 0.9)])
+    assert report_path.read_text(encoding="utf-8") == report.to_markdown()
+    assert [path.name for path in tmp_path.glob("*.tmp")] == []
+
+    optimizer.close()
+    optimizer.close()
+
+
+def test_pipeline_optimizer_only_syncs_explicit_flushes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    writes: list[bool] = []
+    monkeypatch.setattr(optimizer_module, "write_atomic", lambda path, data, *, durable: writes.append(durable))
+    logger = ExplainabilityLogger(log_dir=tmp_path)
+
+    optimizer = PipelineOptimizer(report_path=tmp_path / "report.md", logger=logger)
+    optimizer.analyse([PipelineMetrics(10.0, 0.0, 0.9)])
+    optimizer.analyse([PipelineMetrics(9.0, 0.0, 0.9)])
+    assert writes == [False, False]
+
+    optimizer = PipelineOptimizer(report_path=tmp_path / "report.md", logger=logger, flush_every=3)
+    optimizer.analyse([PipelineMetrics(10.0, 0.0, 0.9)])
+    optimizer.flush()
+    assert writes == [False, False, True]
+    optimizer.close()
+
+
+def test_pipeline_optimizer_close_flushes_and_releases_exit_hook(tmp_path: Path) -> None:
+    report_path = tmp_path / "report.md"
+    optimizer = PipelineOptimizer(report_path=report_path, logger=ExplainabilityLogger(log_dir=tmp_path), flush_every=5)
+    report = optimizer.analyse([PipelineMetrics(10.0, 0.0, 0.9)])
+
+    optimizer.close()
+    assert report_path.read_text(encoding="utf-8") == report.to_markdown()
+
+    report_path.unlink()
+    optimizer = PipelineOptimizer(report_path=report_path, logger=ExplainabilityLogger(log_dir=tmp_path), flush_every=5)
+    report = optimizer.analyse([PipelineMetrics(8.0, 0.0, 0.9)])
+    ref = weakref.ref(optimizer)
+    del optimizer
+    gc.collect()
+    assert ref() is None
+    assert report_path.read_text(encoding="utf-8") == report.to_markdown()
@@ -1,7 +1,16 @@
+import asyncio
+import json
 import os
+import threading
+from dataclasses import replace
+from types import MappingProxyType
 
-from nova.system.communication import CommunicationHub
-from nova.system.orchestrator import Orchestrator
+import pytest
+
+from nova.blueprints.generator import create_blueprint
+from nova.system.communication import AgentMessage, CommunicationHub
+from nova.system.mission import ExecutionPhase, ExecutionPlan
+from nova.system.orchestrator import OrchestrationReport, Orchestrator
 
 
 def test_orchestrator_executes_all_agents(tmp_path, monkeypatch):
@@ -55,3 +64,300 @@ def test_orchestrator_parallel_execution(monkeypatch, tmp_path):
     assert report.execution_mode == "parallel"
     assert {r.agent_type for r in report.agent_reports} == set(orchestrator.agent_types)
     assert report.execution_plan is not None
+
+
+def test_parallel_execution_starts_independent_phases_together(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    plan = ExecutionPlan(
+        (
+            ExecutionPhase(name="foundation", goal="", agents=("nova",)),
+            ExecutionPhase(name="experience", goal="", agents=("echo",), after=()),
+            ExecutionPhase(name="observability", goal="", agents=("aura",)),
+        )
+    )
+    orchestrator = Orchestrator(["nova", "echo", "aura"], execution_mode="parallel", execution_plan=plan)
+    barrier = threading.Barrier(2, timeout=5)
+    started = []
+    run_agent = orchestrator._run_agent
+
+    def _run_agent(agent_type):
+        started.append(agent_type)
+        if agent_type != "aura":
+            barrier.wait()
+        return run_agent(agent_type)
+
+    monkeypatch.setattr(orchestrator, "_run_agent", _run_agent)
+    report = orchestrator.execute()
+    assert report.success
+    assert [r.agent_type for r in report.agent_reports] == ["nova", "echo", "aura"]
+    assert started[-1] == "aura"
+    subjects = [message.subject for message in report.communication_log]
+    assert subjects.index("agent-start::aura") > subjects.index("agent-run::echo")
+
+
+def test_result_cache_reuses_reports_across_runs(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    cache = {}
+    first = Orchestrator(["nova", "echo"], result_cache=cache).execute()
+    assert len(cache) == 2
+
+    orchestrator = Orchestrator(["nova", "echo"], result_cache=cache)
+    orchestrator._execute_agent = lambda *_args: pytest.fail("cached agent executed")
+    second = orchestrator.execute()
+    assert [a == b for a, b in zip(first.agent_reports, second.agent_reports)] == [True, True]
+    assert not any(a is b for a, b in zip(first.agent_reports, second.agent_reports))
+    second.agent_reports[0].task_reports.clear()
+    assert first.agent_reports[0].task_reports
+    runs = [m for m in second.communication_log if m.subject.startswith("agent-run::")]
+    assert all(message.metadata["cached"] for message in runs)
+    assert not any(m.subject.startswith("task-completed::") for m in second.communication_log)
+
+
+def test_result_cache_shares_concurrent_identical_runs(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    orchestrator = Orchestrator(["nova"], result_cache={})
+    release = threading.Event()
+    executions = []
+    execute_agent = orchestrator._execute_agent
+
+    def _execute_agent(agent_cls, blueprint):
+        executions.append(blueprint.agent_type)
+        release.wait(timeout=5)
+        return execute_agent(agent_cls, blueprint)
+
+    monkeypatch.setattr(orchestrator, "_execute_agent", _execute_agent)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(orchestrator._run_agent("nova"))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    while not orchestrator._inflight:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert executions == ["nova"]
+    assert results[0] == results[1] and results[0] is not results[1]
+
+
+def test_phase_metrics_are_shared_with_markdown_fallback(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    report = Orchestrator(["nova", "orion", "chronos"]).execute()
+    totals = {agent.agent_type: len(agent.task_reports) for agent in report.agent_reports}
+    assert report.phase_metrics["model-operations"] == {
+        "completed": totals["orion"] + totals["chronos"],
+        "total": totals["orion"] + totals["chronos"],
+    }
+
+    markdown = report.to_markdown()
+    report.phase_metrics = None
+    assert report.to_markdown() == markdown
+
+
+def test_markdown_is_streamed_through_emit(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    report = Orchestrator(["nova"]).execute()
+    lines = []
+    report._emit(lines.append)
+    assert lines[0] == "# Orchestration Report"
+    assert "\n".join(lines).strip() == report.to_markdown()
+
+
+def test_governance_verdicts_render_from_template():
+    report = OrchestrationReport(agent_reports=[], communication_log=())
+    report.governance_verdicts = [
+        {"action": "deploy", "verdict": "APPROVED", "rationale": "policy ok", "details": {"risk": "low"}},
+        {"details": "not-a-mapping"},
+        "raw-verdict",
+    ]
+    markdown = report.to_markdown()
+    assert "- **deploy** → APPROVED (policy ok) – details: risk=low" in markdown
+    assert "- **unknown** → UNKNOWN\n" in markdown
+    assert "- **unknown** → raw-verdict\n" in markdown
+
+
+def test_governance_verdicts_are_collected_from_hub(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    hub = CommunicationHub()
+    hub.send(sender="nova", subject="governance::deploy", body="", metadata={"decision": "APPROVED"})
+    report = Orchestrator(["nova"], communication_hub=hub).execute()
+    assert report.governance_verdicts == [
+        {"action": "governance::deploy", "verdict": "APPROVED", "rationale": "", "details": {}}
+    ]
+
+
+def test_blueprints_are_preloaded_unless_disabled():
+    assert set(Orchestrator(["nova", "echo"])._blueprint_cache) == {"nova", "echo"}
+    assert Orchestrator(["nova", "echo"], preload=False)._blueprint_cache == {}
+
+
+def test_blueprints_are_shared_across_orchestrators():
+    first = Orchestrator(["nova"])._get_blueprint("nova")
+    assert Orchestrator(["nova"])._get_blueprint("nova") is first
+
+    custom = Orchestrator(["nova"], preload=False)
+    custom._blueprint_cache["nova"] = replacement = create_blueprint("nova")
+    assert custom._get_blueprint("nova") is replacement
+
+
+def test_parallel_runs_reuse_one_worker_pool(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    with Orchestrator(["nova", "orion", "chronos"], execution_mode="parallel") as orchestrator:
+        assert orchestrator.execute().success
+        pool = orchestrator._pool
+        assert orchestrator.execute().success
+        assert orchestrator._pool is pool
+    assert orchestrator._pool is None
+    assert not any(thread.is_alive() for thread in pool._threads)
+
+
+def test_aexecute_matches_execute(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    expected = Orchestrator(["nova", "orion", "chronos"]).execute()
+    for mode in ("sequential", "parallel"):
+        report = asyncio.run(Orchestrator(["nova", "orion", "chronos"], execution_mode=mode).aexecute())
+        assert report.success
+        assert report.execution_mode == mode
+        assert [r.agent_type for r in report.agent_reports] == ["nova", "orion", "chronos"]
+        assert report.phase_metrics == expected.phase_metrics
+
+
+def test_aexecute_overlaps_independent_phases(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    plan = ExecutionPlan(
+        (
+            ExecutionPhase(name="foundation", goal="", agents=("nova",)),
+            ExecutionPhase(name="experience", goal="", agents=("echo",), after=()),
+        )
+    )
+    orchestrator = Orchestrator(["nova", "echo"], execution_mode="parallel", execution_plan=plan)
+    barrier = threading.Barrier(2, timeout=5)
+    run_agent = orchestrator._run_agent
+
+    def _run_agent(agent_type):
+        barrier.wait()
+        return run_agent(agent_type)
+
+    monkeypatch.setattr(orchestrator, "_run_agent", _run_agent)
+    assert asyncio.run(orchestrator.aexecute()).success
+
+
+def test_announcement_metadata_is_plain_json(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    orchestrator = Orchestrator(["nova", "orion"])
+
+    orchestrator.execute()
+    report = orchestrator.execute()
+    first, second = [m for m in report.communication_log if m.subject == "agent-start::orion"]
+    assert first.metadata is not second.metadata
+    assert first.metadata == {"tasks": first.metadata["tasks"], "phase": "model-operations", "depends_on": ["nova"]}
+    first.metadata["phase"] = "changed"
+    assert second.metadata["phase"] == "model-operations"
+
+    logged = json.loads(json.dumps([message.to_dict() for message in report.communication_log]))
+    assert {"agents": ["nova"]} in [message["metadata"] for message in logged]
+    json.dumps(report.to_dict())
+
+
+def test_agent_report_statuses_track_task_reports(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    report = Orchestrator(["nova"]).execute().agent_reports[0]
+    statuses = report.statuses
+    assert statuses == ("completed",) * len(report.task_reports)
+    report.task_reports[0] = replace(report.task_reports[0], status="failed")
+    assert report.statuses[0] == "failed"
+    assert statuses[0] == "completed"
+
+    report.task_reports.append(replace(report.task_reports[0], status="failed"))
+    assert report.statuses[-1] == "failed"
+    report.task_reports = report.task_reports[:1]
+    assert report.statuses == ("failed",)
+
+
+def test_governance_records_are_normalised(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    hub = CommunicationHub()
+    hub.publish_many(
+        [
+            AgentMessage(
+                sender="nova",
+                recipients=("orchestrator",),
+                subject="governance::rollout",
+                body="",
+                metadata=MappingProxyType({"verdict": "DENIED", "rationale": None, "details": "n/a"}),
+            )
+        ]
+    )
+    report = Orchestrator(["nova"], communication_hub=hub).execute()
+    assert report.governance_verdicts == [
+        {"action": "governance::rollout", "verdict": "DENIED", "rationale": "", "details": {}}
+    ]
+    assert "- **governance::rollout** → DENIED\n" in report.to_markdown()
+
+
+def test_report_to_json_matches_to_dict(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    report = Orchestrator(["nova", "orion"]).execute()
+    assert json.loads(report.to_json()) == json.loads(json.dumps(report.to_dict()))
+
+
+def test_report_keeps_hub_snapshot_tuple(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    hub = CommunicationHub()
+    report = Orchestrator(["nova"], communication_hub=hub).execute()
+    assert isinstance(report.communication_log, tuple)
+    hub.send(sender="nova", subject="after-run", body="")
+    assert report.communication_log[-1].subject != "after-run"
+
+
+def test_depth_first_policy_keeps_successors_on_the_same_worker(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    orchestrator = Orchestrator(
+        ["nova", "orion", "chronos", "lumina"], execution_mode="parallel", max_workers=3, scheduling_policy="dfs"
+    )
+    threads = {}
+    run_agent = orchestrator._run_agent
+
+    def _run_agent(agent_type):
+        threads[agent_type] = threading.current_thread().name
+        return run_agent(agent_type)
+
+    monkeypatch.setattr(orchestrator, "_run_agent", _run_agent)
+    with orchestrator:
+        report = orchestrator.execute()
+    assert [r.agent_type for r in report.agent_reports] == ["nova", "orion", "chronos", "lumina"]
+    assert threads["nova"] in {threads["orion"], threads["chronos"]}
+    assert threads["lumina"] in {threads["orion"], threads["chronos"]}
+
+
+def test_depth_first_policy_propagates_agent_failures(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    orchestrator = Orchestrator(["nova", "orion", "chronos"], execution_mode="parallel", scheduling_policy="dfs")
+
+    def _run_agent(agent_type):
+        raise RuntimeError(f"{agent_type} failed")
+
+    monkeypatch.setattr(orchestrator, "_run_agent", _run_agent)
+    with orchestrator, pytest.raises(RuntimeError, match="nova failed"):
+        orchestrator.execute()
+
+
+def test_run_plan_is_resolved_once(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    orchestrator = Orchestrator(["nova"])
+    first = orchestrator.execute().execution_plan
+    assert orchestrator.execute().execution_plan is first is orchestrator.execution_plan
+
+
+def test_parallel_mode_runs_chains_inline(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOVA_HOME", str(tmp_path))
+    chain = Orchestrator(["nova", "lumina", "aura"], execution_mode="parallel")
+    report = chain.execute()
+    assert report.success and report.execution_mode == "parallel"
+    assert [r.agent_type for r in report.agent_reports] == ["nova", "lumina", "aura"]
+    assert chain._pool is None
+
+    branching = Orchestrator(["nova", "orion", "chronos"], execution_mode="parallel")
+    with branching:
+        branching.execute()
+        assert branching._pool is not None
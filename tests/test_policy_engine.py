@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import json
 import threading
-import urllib.error
 from contextlib import contextmanager
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from typing import Generator, Tuple, Type
 
+import httpx
 import pytest
 
 from nova.policy import PolicyEngine, PolicyEngineUnavailable
@@ -44,9 +44,50 @@ class _CountingOPAHandler(_MockOPAHandler):
         super().do_POST()
 
 
+class _BatchOPAHandler(_MockOPAHandler):
+    paths: list = []
+
+    def do_POST(self) -> None:  # noqa: N802
+        type(self).paths.append(self.path)
+        content_length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(content_length))
+        batch = payload["input"].get("batch")
+        if batch is None:
+            allow = payload["input"]["subject"] == "admin"
+            body_data: dict = {"result": {"allow": allow, "reason": "single"}}
+        elif self.path == "/batch":
+            body_data = {"result": [{"allow": item["subject"] == "admin", "reason": "batched"} for item in batch]}
+        else:
+            body_data = {}
+        body = json.dumps(body_data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _FlakyOPAHandler(_MockOPAHandler):
+    responses: list = []
+    call_count = 0
+
+    def do_POST(self) -> None:  # noqa: N802
+        type(self).call_count += 1
+        if not type(self).responses:
+            super().do_POST()
+            return
+        status, body = type(self).responses.pop(0)
+        content_length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(content_length)
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
 @contextmanager
 def _run_mock_opa(handler: Type[_MockOPAHandler]) -> Generator[Tuple[HTTPServer, threading.Thread], None, None]:
-    server = HTTPServer(("localhost", 0), handler)
+    server = ThreadingHTTPServer(("localhost", 0), handler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     try:
@@ -91,10 +132,81 @@ def test_policy_engine_uses_cache_for_repeated_requests() -> None:
 
 def test_policy_engine_raises_on_unavailable_opa(monkeypatch) -> None:
     def _raise_unavailable(*args, **kwargs):
-        raise urllib.error.URLError("connection refused")
+        raise httpx.ConnectError("connection refused")
 
-    monkeypatch.setattr("nova.policy.engine.urllib.request.urlopen", _raise_unavailable)
+    monkeypatch.setattr("nova.policy.engine.httpx.Client.post", _raise_unavailable)
 
     engine = PolicyEngine(opa_url="http://localhost:8181", policy_path="/")
     with pytest.raises(PolicyEngineUnavailable):
         engine.authorize(subject="user", action="read", resource="queue")
+
+
+def test_policy_engine_cache_is_bounded() -> None:
+    _CountingOPAHandler.call_count = 0
+    with _run_mock_opa(_CountingOPAHandler) as (server, _):
+        engine = PolicyEngine(opa_url=f"http://localhost:{server.server_address[1]}", policy_path="/", cache_size=1)
+        engine.authorize(subject="admin", action="write", resource="queue", context={"nested": {"a": 1}})
+        engine.authorize(subject="admin", action="read", resource="queue", context={"flag": True})
+        engine.authorize(subject="admin", action="read", resource="queue", context={"flag": True})
+        engine.authorize(subject="admin", action="write", resource="queue", context={"nested": {"a": 1}})
+
+    assert _CountingOPAHandler.call_count == 3
+
+
+def test_policy_engine_batch_authorize_uses_single_request() -> None:
+    _BatchOPAHandler.paths = []
+    with _run_mock_opa(_BatchOPAHandler) as (server, _):
+        engine = PolicyEngine(
+            opa_url=f"http://localhost:{server.server_address[1]}",
+            policy_path="/",
+            batch_policy_path="/batch",
+        )
+        cached = engine.authorize(subject="admin", action="read", resource="queue")
+        decisions = engine.batch_authorize(
+            [
+                {"subject": "admin", "action": "read", "resource": "queue"},
+                {"subject": "admin", "action": "write", "resource": "queue"},
+                {"subject": "user", "action": "write", "resource": "queue"},
+            ]
+        )
+
+    assert decisions[0] is cached
+    assert [decision.allow for decision in decisions] == [True, True, False]
+    assert decisions[1].reason == "batched"
+    assert _BatchOPAHandler.paths == ["/", "/batch"]
+
+
+def test_policy_engine_batch_authorize_falls_back_without_batch_rule() -> None:
+    _BatchOPAHandler.paths = []
+    with _run_mock_opa(_BatchOPAHandler) as (server, _):
+        engine = PolicyEngine(
+            opa_url=f"http://localhost:{server.server_address[1]}",
+            policy_path="/",
+            batch_policy_path="/missing",
+        )
+        decisions = engine.batch_authorize(
+            [
+                {"subject": "admin", "action": "write", "resource": "queue"},
+                {"subject": "user", "action": "write", "resource": "queue"},
+            ]
+        )
+
+    assert [decision.allow for decision in decisions] == [True, False]
+    assert _BatchOPAHandler.paths == ["/missing", "/", "/"]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [(500, b'{"code": "internal_error"}'), (200, b"<html>proxy error</html>")],
+)
+def test_policy_engine_does_not_cache_failed_responses(response) -> None:
+    _FlakyOPAHandler.responses = [response]
+    _FlakyOPAHandler.call_count = 0
+    with _run_mock_opa(_FlakyOPAHandler) as (server, _):
+        engine = _engine_for(server)
+        with pytest.raises(PolicyEngineUnavailable):
+            engine.authorize(subject="admin", action="write", resource="queue")
+        decision = engine.authorize(subject="admin", action="write", resource="queue")
+
+    assert decision.allow
+    assert _FlakyOPAHandler.call_count == 2
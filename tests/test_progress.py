@@ -93,3 +93,19 @@ def test_progress_report_without_tasks_returns_placeholder():
     report = build_progress_report([], pending_limit=2)
     assert report == "# Nova Fortschrittsbericht\n\nKeine Aufgaben gefunden."
 
+
+def test_progress_report_orders_agents_and_pending_tasks():
+    tasks = [
+        _task("orion", "orion", None, "zweiter Schritt", "Offen"),
+        _task("aura", "Aura", "Analystin", "Dashboard", "done"),
+        _task("orion", "orion", "Spezialist", "Erster Schritt", "Offen"),
+        _task("orion", "orion", "Spezialist", "Mittlerer Schritt", "Fertig"),
+    ]
+
+    report = build_progress_report(tasks)
+
+    assert report.index("## Aura") < report.index("## orion")
+    orion = report[report.index("## orion"):]
+    assert orion.splitlines()[1] == "*Rolle:* Spezialist"
+    assert "- Abgeschlossen: 1" in orion
+    assert orion.index("Erster Schritt") < orion.index("zweiter Schritt")
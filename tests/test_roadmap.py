@@ -1,4 +1,6 @@
-from nova.system.mission import build_default_plan
+from dataclasses import replace
+
+from nova.system.mission import ExecutionPhase, ExecutionPlan, build_default_plan
 from nova.system.roadmap import (
     build_executive_summary,
     build_global_step_plan,
@@ -232,3 +234,27 @@ def test_build_executive_summary_warns_on_unknown_phase():
     )
 
     assert "Keine der angeforderten Phasen" in summary
+
+
+def test_build_phase_roadmap_matches_normalised_names_after_plan_changes():
+    phase = ExecutionPhase("Core Ops", "Betrieb sichern", ("Nova Agent",))
+    plan = ExecutionPlan((phase,))
+
+    roadmap = build_phase_roadmap(_sample_tasks(), plan, phase_filters=[" core ops "])
+    assert "## Core Ops" in roadmap
+    assert "*Fortschritt:* 1/2 (50%)" in roadmap
+
+    plan = ExecutionPlan((replace(phase, agents=("Orion",)),))
+    roadmap = build_phase_roadmap(_sample_tasks(), plan, phase_filters=["Core Ops"])
+    assert "*Fortschritt:* 0/1 (0%)" in roadmap
+    assert "LLM vorbereiten" in roadmap
+
+
+def test_phase_progress_counts_aliased_agents_once():
+    plan = ExecutionPlan((ExecutionPhase("Foundation", "Basis", ("nova", "Nova Agent", "orion")),))
+
+    roadmap = build_phase_roadmap(_sample_tasks(), plan)
+    summary = build_executive_summary(_sample_tasks(), plan)
+
+    assert "*Fortschritt:* 1/3 (33%)" in roadmap
+    assert "- Fortschritt: 1/3 (33%)" in summary
@@ -1,5 +1,9 @@
+import gc
+import threading
+
 import pytest
 
+from nova.security import AuditLogger, AuditStore
 from nova.system.security import run_security_audit
 
 
@@ -32,3 +36,91 @@ def test_security_audit_collects_findings(monkeypatch):
     details = report.to_dict()
     assert details["passed"] is False
     assert any(control["status"] != "ok" for control in details["controls"])
+
+
+def test_audit_logger_batches_events_until_flush():
+    store = AuditStore(":memory:")
+    logger = AuditLogger(store, batch_size=3)
+    logger.record_event("login", subject="nova")
+    logger.record_event("logout", subject="nova")
+    assert store.list_events() == []
+
+    logger.record_event("login", subject="orion")
+    assert len(store.list_events()) == 3
+
+    logger.record_event("login", subject="echo")
+    logger.flush()
+    assert {event.subject for event in store.list_events()} == {"nova", "orion", "echo"}
+
+
+def test_audit_logger_persists_partial_batches_on_close_and_collection():
+    store = AuditStore(":memory:")
+    with AuditLogger(store, batch_size=10) as logger:
+        logger.record_event("login", subject="nova")
+        assert store.list_events() == []
+    assert [event.subject for event in store.list_events()] == ["nova"]
+
+    logger = AuditLogger(store, batch_size=10)
+    logger.record_event("login", subject="orion")
+    del logger
+    gc.collect()
+    assert {event.subject for event in store.list_events()} == {"nova", "orion"}
+
+
+def test_file_backed_audit_store_accepts_concurrent_writers(tmp_path):
+    store = AuditStore(tmp_path / "audit.db")
+    logger = AuditLogger(store)
+
+    def _write(worker: int) -> None:
+        for index in range(10):
+            logger.record_event("probe", subject=f"worker-{worker}", details={"index": str(index)})
+
+    threads = [threading.Thread(target=_write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.list_events(limit=100)) == 40
+    store.close()
+
+
+def test_file_backed_audit_store_closes_connections_of_finished_threads(tmp_path):
+    store = AuditStore(tmp_path / "audit.db")
+    logger = AuditLogger(store)
+    holders = []
+
+    def _write() -> None:
+        logger.record_event("probe", subject="worker")
+        holders.append(store._local.holder)
+
+    thread = threading.Thread(target=_write)
+    thread.start()
+    thread.join()
+    finalizer = holders.pop().close
+    gc.collect()
+
+    assert not finalizer.alive
+    assert len(store.list_events()) == 1
+    store.close()
+
+
+def test_closed_audit_store_rejects_writes_and_skips_final_drain(tmp_path, caplog):
+    store = AuditStore(tmp_path / "audit.db")
+    logger = AuditLogger(store, batch_size=10)
+    logger.record_event("login", subject="nova")
+    store.close()
+    store.close()
+
+    assert store.closed
+    with pytest.raises(RuntimeError, match="closed"):
+        AuditLogger(store).record_event("login", subject="orion")
+    with pytest.raises(RuntimeError, match="closed"):
+        logger.flush()
+    assert not hasattr(store._local, "holder")
+
+    with caplog.at_level("WARNING", logger="nova.security.audit"):
+        del logger
+        gc.collect()
+    assert "Dropping 1 buffered audit events" in caplog.text
+    assert not hasattr(store._local, "holder")
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+
+import pytest
+
+from nova.serialization import dumps_bytes, dumps_sorted, loads
+
+
+def test_dumps_sorted_is_compact_and_deterministic() -> None:
+    first = dumps_sorted({"b": 1, "a": {"d": 2, "c": 3}})
+    second = dumps_sorted({"a": {"c": 3, "d": 2}, "b": 1})
+    assert first == second == '{"a":{"c":3,"d":2},"b":1}'
+
+
+def test_roundtrip_through_bytes() -> None:
+    payload = {"agent": "nova", "action": "execute", "payload": {"steps": [1, 2]}}
+    assert loads(dumps_bytes(payload)) == payload
+
+
+def test_dumps_bytes_uses_default_for_unknown_types() -> None:
+    payload = {"metadata": MappingProxyType({"phase": "foundation"})}
+    assert loads(dumps_bytes(payload, default=dict)) == {"metadata": {"phase": "foundation"}}
+
+
+def test_wide_integers_fall_back_to_the_standard_library() -> None:
+    wide = 2**70
+    assert dumps_sorted({"b": wide, "a": [-wide]}) == '{"a":[-%d],"b":%d}' % (wide, wide)
+    assert dumps_bytes({"value": wide}) == b'{"value":%d}' % wide
+    with pytest.raises(TypeError):
+        dumps_sorted({"value": object()})
@@ -1,13 +1,20 @@
 """Integration tests for the gRPC task queue."""
 from __future__ import annotations
 
+import asyncio
+import socket
 import threading
 import time
 
 import grpc
 
 from nova.logging import initialize_logging
-from nova.orchestration.task_queue import TaskQueueDispatcher
+from nova.orchestration.task_queue import (
+    TaskQueueDispatcher,
+    _decode_payload,
+    _decode_payloads,
+    start_task_queue_server_async,
+)
 from nova.task_queue import TaskQueueServer, TaskQueueService, TaskRepository, TaskQueueStub
 from nova.task_queue import proto
 
@@ -25,7 +32,7 @@ def test_task_queue_lifecycle() -> None:
     enqueue_request = proto.EnqueueRequest()
     enqueue_request.type = "test"
     enqueue_request.payload = "payload"
-    enqueue_request.metadata.add(key="priority", value="high")
+    enqueue_request.metadata["priority"] = "high"
     enqueue_response = stub.Enqueue(enqueue_request)
     task_id = enqueue_response.task.id
     assert enqueue_response.task.attempts == 0
@@ -175,7 +182,7 @@ def test_task_queue_concurrency_stress() -> None:
         enqueue_request = proto.EnqueueRequest()
         enqueue_request.type = "bulk"
         enqueue_request.payload = f"payload-{index}"
-        enqueue_request.metadata.add(key="batch", value="stress")
+        enqueue_request.metadata["batch"] = "stress"
         stub.Enqueue(enqueue_request)
 
     completed_ids: set[str] = set()
@@ -230,3 +237,121 @@ def test_task_queue_dispatcher_local(tmp_path) -> None:
     completed = dispatcher.list_tasks("COMPLETED")
     assert completed and completed[0].status == "COMPLETED"
     dispatcher.close()
+
+
+def test_task_queue_dispatcher_local_reuses_structured_payload(tmp_path) -> None:
+    dispatcher = TaskQueueDispatcher(repository_path=tmp_path / "queue.db")
+    task = dispatcher.run_task("orion", "plan", {"phase": "foundation"})
+    assert task.payload == {"phase": "foundation"}
+    dispatcher.close()
+
+    reopened = TaskQueueDispatcher(repository_path=tmp_path / "queue.db")
+    [persisted] = reopened.list_tasks()
+    assert (persisted.agent, persisted.action, persisted.payload) == ("orion", "plan", {"phase": "foundation"})
+    reopened.close()
+
+
+def test_task_queue_dispatcher_local_payloads_match_decoded_shape(tmp_path) -> None:
+    dispatcher = TaskQueueDispatcher(repository_path=tmp_path / "queue.db")
+    payload = {"steps": (1, 2), "limits": {3: "gpu"}}
+    expected = {"steps": [1, 2], "limits": {"3": "gpu"}}
+    task = dispatcher.run_task("orion", "plan", payload)
+    [batched] = dispatcher.run_tasks_batch([("lumina", "index", payload)])
+    assert task.payload == batched.payload == expected
+    assert [listed.payload for listed in dispatcher.list_tasks()] == [expected, expected]
+
+    other = TaskQueueDispatcher(repository_path=tmp_path / "queue.db")
+    assert [listed.payload for listed in other.list_tasks()] == [expected, expected]
+    other.close()
+    dispatcher.close()
+
+
+def test_task_queue_dispatcher_local_payload_cache_is_private_and_evicted(tmp_path) -> None:
+    dispatcher = TaskQueueDispatcher(repository_path=tmp_path / "queue.db")
+    task = dispatcher.run_task("orion", "plan", {"phase": "foundation"})
+    task.payload["phase"] = "changed"
+    [listed] = dispatcher.list_tasks()
+    listed.payload.clear()
+
+    assert dispatcher.list_tasks()[0].payload == {"phase": "foundation"}
+    acknowledged = dispatcher.acknowledge(task.id, True, "done")
+    assert acknowledged.payload == {"phase": "foundation"}
+    assert task.id not in dispatcher._local_payloads
+    assert dispatcher.list_tasks("COMPLETED")[0].payload == {"phase": "foundation"}
+    dispatcher.close()
+
+
+def test_task_queue_enqueue_stream_batches_requests() -> None:
+    initialize_logging(log_level="CRITICAL")
+    repository = TaskRepository()
+    service = TaskQueueService(repository)
+    server = TaskQueueServer(service, host="localhost", port=0)
+    server.start()
+    channel = grpc.insecure_channel(server.address)
+    grpc.channel_ready_future(channel).result(timeout=5)
+    stub = TaskQueueStub(channel)
+
+    requests = [proto.EnqueueRequest(type="batch", payload=f"payload-{index}") for index in range(5)]
+    responses = list(stub.EnqueueStream(iter(requests)))
+    assert [response.task.payload for response in responses] == [f"payload-{index}" for index in range(5)]
+    assert len(repository.list_tasks("PENDING")) == 5
+
+    channel.close()
+    server.stop(0)
+
+
+def test_task_queue_dispatcher_run_tasks_batch_remote() -> None:
+    initialize_logging(log_level="CRITICAL")
+    repository = TaskRepository()
+    server = TaskQueueServer(TaskQueueService(repository), host="localhost", port=0)
+    server.start()
+    dispatcher = TaskQueueDispatcher(address=server.address)
+    tasks = dispatcher.run_tasks_batch([("nova", "execute", {"step": 1}), ("echo", "notify", None)])
+    assert [(task.agent, task.action, task.payload) for task in tasks] == [
+        ("nova", "execute", {"step": 1}),
+        ("echo", "notify", {}),
+    ]
+    assert len(repository.list_tasks()) == 2
+    dispatcher.close()
+    server.stop(0)
+
+
+def test_async_task_queue_server_handles_unary_and_stream_calls() -> None:
+    with socket.socket() as probe:
+        probe.bind(("localhost", 0))
+        port = probe.getsockname()[1]
+    address = f"localhost:{port}"
+
+    async def _exercise() -> tuple[str, list[str], int]:
+        repository = TaskRepository()
+        server = await start_task_queue_server_async(repository, address=address)
+        try:
+            async with grpc.aio.insecure_channel(address) as channel:
+                stub = TaskQueueStub(channel)
+                single = await stub.Enqueue(proto.EnqueueRequest(type="async", payload="one"))
+                call = stub.EnqueueStream(iter([proto.EnqueueRequest(type="async", payload=p) for p in ("two", "three")]))
+                streamed = [response.task.payload async for response in call]
+                listed = await stub.ListTasks(proto.ListTasksRequest())
+                return single.task.payload, streamed, len(listed.tasks)
+        finally:
+            await server.stop(0)
+
+    assert asyncio.run(_exercise()) == ("one", ["two", "three"], 3)
+
+
+def test_decode_payload_falls_back_to_raw_payloads() -> None:
+    metadata = {"agent": "echo", "action": "notify"}
+    assert _decode_payload("plain text", metadata) == ("echo", "notify", {"raw": "plain text"})
+    assert _decode_payload("{not json", metadata) == ("echo", "notify", {"raw": "{not json"})
+    assert _decode_payload(' {"agent": "nova", "payload": {"a": 1}}', {}) == ("nova", "execute", {"a": 1})
+
+
+def test_decode_payloads_batches_and_falls_back() -> None:
+    encoded = [
+        ('{"agent": "nova", "action": "plan", "payload": {"step": 1}}', {}),
+        ('{"agent": "echo", "payload": 5}', {"action": "notify"}),
+    ]
+    assert _decode_payloads(encoded) == [("nova", "plan", {"step": 1}), ("echo", "notify", {"value": 5})]
+
+    mixed = encoded + [("{broken", {"agent": "aura"})]
+    assert _decode_payloads(mixed)[-1] == ("aura", "execute", {"raw": "{broken"})
@@ -16,6 +16,15 @@ def test_is_task_complete_handles_various_labels():
     assert not tasks.is_task_complete("Offen")
 
 
+
+def test_agent_task_caches_completion_flag(monkeypatch):
+    task = tasks.AgentTask("nova", "Nova", None, "Backup", " Done ")
+    assert task.is_complete
+
+    monkeypatch.setattr(tasks, "is_task_complete", lambda status: pytest.fail("re-evaluated"))
+    assert task.is_complete
+    assert task == tasks.AgentTask("nova", "Nova", None, "Backup", " Done ")
+
 def test_load_agent_tasks_reads_rows(tmp_path):
     csv_path = tmp_path / "tasks.csv"
     csv_path.write_text(
@@ -0,0 +1,60 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from nova.system._wspool import WorkStealingPool
+
+
+def test_pool_runs_submissions_and_reports_errors():
+    with WorkStealingPool(3) as pool:
+        futures = [pool.submit(pow, value, 2) for value in range(20)]
+        failing = pool.submit(int, "not-a-number")
+        assert [future.result(timeout=5) for future in futures] == [value**2 for value in range(20)]
+        with pytest.raises(ValueError):
+            failing.result(timeout=5)
+
+
+def test_nested_submissions_are_stolen_by_idle_workers():
+    with WorkStealingPool(2) as pool:
+        def _parent():
+            # The child lands on this worker's own deque while the worker
+            # blocks on it, so only a stealing sibling can run it.
+            child = pool.submit(lambda: threading.current_thread().name)
+            return threading.current_thread().name, child.result(timeout=5)
+
+        parent_thread, child_thread = pool.submit(_parent).result(timeout=5)
+    assert parent_thread != child_thread
+
+
+def test_pool_rejects_work_after_shutdown():
+    pool = WorkStealingPool(1)
+    future = pool.submit(sum, [1, 2, 3])
+    pool.shutdown()
+    assert future.result() == 6
+    with pytest.raises(RuntimeError):
+        pool.submit(sum, [])
+
+
+def test_shutdown_wait_from_own_worker_raises():
+    with WorkStealingPool(1) as pool:
+        future = pool.submit(pool.shutdown, wait=True)
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+        assert pool.submit(pool.shutdown, wait=False).result(timeout=5) is None
+
+
+def test_interpreter_exit_finishes_running_work(tmp_path):
+    marker = tmp_path / "done.txt"
+    script = (
+        "import time\n"
+        "from nova.system._wspool import WorkStealingPool\n"
+        "pool = WorkStealingPool(1)\n"
+        "assert not pool._threads[0].daemon\n"
+        f"pool.submit(lambda: (time.sleep(0.2), open({str(marker)!r}, 'w').write('done')))\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).resolve().parents[1], timeout=30)
+    assert completed.returncode == 0
+    assert marker.read_text() == "done"